@@ -1,10 +1,399 @@
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin
+import asyncio
+import re
+from collections import OrderedDict
+from dataclasses import replace
+from html.parser import HTMLParser
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from urllib.parse import (parse_qsl, quote, urlencode, urljoin, urlsplit,
+                          urlunsplit)
 
 from playwright.async_api import Error as PlaywrightError
-from base_agent import JobAgent, JobPosting, SearchCriteria
+from base_agent import (FIRST_VISIBLE_JS, JobAgent, JobPosting,
+                        SearchCriteria)
 from utils.email_verifier import GreenHouseEmailVerifier
 
+# Matches both /jobs/view/123/ and slugged /jobs/view/title-at-acme-123/
+_JOB_ID_RE = re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)(?![^/?#])')
+
+_JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+# Serves the same search as server-rendered card HTML, without the app shell
+_GUEST_SEARCH_URL = (
+    "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search")
+_GUEST_JOB_POSTING_URL = (
+    "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}")
+_POST_LOGIN_URL_RE = re.compile(r'linkedin\.com/(feed|jobs|checkpoint)|verify')
+_LOGGED_IN_URL_RE = re.compile(r'linkedin\.com/(feed|jobs)')
+
+# Search URL filter values (f_TPR and f_E query parameters)
+_DATE_POSTED_FILTERS = MappingProxyType({
+    "Past 24 hours": "r86400",
+    "Past week": "r604800",
+    "Past month": "r2592000"
+})
+_EXPERIENCE_LEVEL_FILTERS = MappingProxyType({
+    "Internship": "1",
+    "Entry level": "2",
+    "Associate": "3",
+    "Mid-Senior level": "4",
+    "Director": "5",
+    "Executive": "6"
+})
+
+# Selector candidates are grouped into comma-joined CSS unions so the browser
+# evaluates every alternative in a single query instead of one round-trip each.
+_SEARCH_INPUT_SELECTORS = (
+    'input[aria-label*="Search by title"]',
+    'input[placeholder*="Search by title"]',
+    'input[aria-label*="Search jobs"]',
+    'input[aria-label*="Job title"]',
+    'input[data-test*="job-search"]',
+    '.jobs-search-box__text-input[aria-label*="Search"]'
+)
+_SEARCH_INPUT_SELECTOR = ", ".join(_SEARCH_INPUT_SELECTORS)
+_VISIBLE_SEARCH_INPUT_SELECTOR = f"{_SEARCH_INPUT_SELECTOR} >> visible=true"
+
+_LOCATION_INPUT_SELECTORS = (
+    'input[aria-label*="City"]',
+    'input[placeholder*="City"]',
+    'input[aria-label*="Location"]',
+    'input[placeholder*="Location"]',
+    'input[data-test*="location"]'
+)
+_LOCATION_INPUT_SELECTOR = ", ".join(_LOCATION_INPUT_SELECTORS)
+_VISIBLE_LOCATION_INPUT_SELECTOR = (
+    f"{_LOCATION_INPUT_SELECTOR} >> visible=true")
+
+_EASY_APPLY_FILTER_SELECTORS = (
+    'button[aria-label*="Easy Apply"]',
+    'button:has-text("Easy Apply")',
+    'label:has-text("Easy Apply")',
+    '[data-test-id*="easy-apply"]',
+    '.filter-button:has-text("Easy Apply")',
+    'input[value="Easy Apply"]'
+)
+_EASY_APPLY_FILTER_SELECTOR = ", ".join(_EASY_APPLY_FILTER_SELECTORS)
+
+_RESULTS_CONTAINER_SELECTORS = (
+    '.jobs-search__results-list',
+    '.jobs-search-results-list',
+    '.jobs-search-results__list',
+    '.search-results-container',
+    '[data-test-results-list]',
+    '.job-search-results-list',
+    '.jobs-search-results',
+    '.scaffold-layout__list-detail'
+)
+_RESULTS_CONTAINER_SELECTOR = ", ".join(_RESULTS_CONTAINER_SELECTORS)
+
+_JOB_CARD_SELECTORS = (
+    'li[data-occludable-job-id]',  # Primary LinkedIn job cards
+    '[data-job-id]',  # Alternative job elements
+    '.job-search-card',
+    '.jobs-search-results__list-item',
+    '.job-result-card',
+    '.base-search-card',
+    'li[data-entity-urn*="job"]',  # Updated LinkedIn format
+    'div[data-entity-urn*="job"]',
+    '.entity-result',
+    '.result-card',
+    'article[data-entity-urn]',
+    '.scaffold-layout__list-item'
+)
+
+_TITLE_SELECTORS = (
+    'a[data-test-id*="job-title"]',
+    '.job-search-card__title a',
+    '.job-title a',
+    'h3 a',
+    'a[aria-label*="job"]'
+)
+
+_COMPANY_SELECTORS = (
+    '[data-test-id*="company"]',
+    '.job-search-card__subtitle',
+    '.job-subtitle',
+    'h4',
+    '.base-search-card__subtitle'
+)
+
+_LOCATION_SELECTORS = (
+    '[data-test-id*="location"]',
+    '.job-search-card__location',
+    '.job-location',
+    '.base-search-card__location'
+)
+
+# Runs inside the page: picks the first card selector that matches (keeping
+# the priority order of _JOB_CARD_SELECTORS) and reads every field of every
+# card in one round-trip. Each field comes from the first of its selectors
+# that matches, in priority order; falls back to any link when no title does.
+_EXTRACT_JOB_CARDS_JS = """
+([cardSelectors, titleSelectors, companySelectors, locationSelectors,
+  limit]) => {
+    const cardSelector = cardSelectors.find(s => document.querySelector(s));
+    if (!cardSelector) {
+        return [];
+    }
+    const first = (card, selectors) => {
+        for (const selector of selectors) {
+            const el = card.querySelector(selector);
+            if (el) {
+                return el;
+            }
+        }
+        return null;
+    };
+    const text = (el) => (el ? el.innerText : null);
+    return Array.from(document.querySelectorAll(cardSelector))
+        .slice(0, limit)
+        .map(card => {
+            const link = first(card, titleSelectors) ||
+                card.querySelector('a');
+            return {
+                title: text(link),
+                url: link ? link.getAttribute('href') : null,
+                company: text(first(card, companySelectors)),
+                location: text(first(card, locationSelectors))
+            };
+        });
+}
+"""
+
+_JOB_LINK_SELECTOR = 'a[href*="/jobs/view/"]'
+_EXTRACT_JOB_LINKS_JS = """
+(links, limit) => links.slice(0, limit).map(link => ({
+    title: link.innerText,
+    url: link.getAttribute('href')
+}))
+"""
+
+_EASY_APPLY_BUTTON_SELECTORS = (
+    '.jobs-apply-button--top-card',
+    'button:has-text("Easy Apply")',
+    '[data-test-id*="easy-apply"]',
+    '.jobs-apply-button'
+)
+_EASY_APPLY_BUTTON_SELECTOR = ", ".join(_EASY_APPLY_BUTTON_SELECTORS)
+_VISIBLE_EASY_APPLY_BUTTON_SELECTOR = (
+    f"{_EASY_APPLY_BUTTON_SELECTOR} >> visible=true")
+
+_EASY_APPLY_MODAL_SELECTOR = '.jobs-easy-apply-modal'
+
+_SUCCESS_INDICATORS = (
+    'application submitted',
+    'thank you for applying',
+    'application received',
+    'successfully submitted',
+    'application complete'
+)
+
+# Confirmation headings/feedback shown once an application is sent
+_SUCCESS_SELECTOR = ", ".join(
+    ['[data-test-modal] h2:has-text("submitted")',
+     'h2:has-text("Application sent")'] +
+    [f'{tag}:has-text("{indicator}")'
+     for indicator in _SUCCESS_INDICATORS for tag in ('h2', 'h3')])
+
+_GREENHOUSE_INDICATORS = (
+    'verify your email',
+    'check your email',
+    'verification link'
+)
+
+# Indicator groups in the JSON-ready form the page-side checks take
+_PAGE_TEXT_GROUPS = {
+    'complete': list(_SUCCESS_INDICATORS),
+    'greenhouse': list(_GREENHOUSE_INDICATORS),
+}
+
+# Page-side readiness checks polled with wait_for_function
+_JOB_CARDS_RENDERED_JS = (
+    "() => document.querySelectorAll('li[data-occludable-job-id]').length > 0")
+_SUCCESS_TEXT_JS = """
+(indicators) => {
+    const text = document.body ? document.body.innerText.toLowerCase() : '';
+    return indicators.some(indicator => text.includes(indicator));
+}
+"""
+# Checks several named indicator groups against the page text in one call
+_PAGE_TEXT_MATCHES_JS = """
+(groups) => {
+    const text = document.body ? document.body.innerText.toLowerCase() : '';
+    const matches = {};
+    for (const [name, indicators] of Object.entries(groups)) {
+        matches[name] = indicators.some(indicator => text.includes(indicator));
+    }
+    return matches;
+}
+"""
+_MODAL_TEXT_JS = """
+(selector) => {
+    const modal = document.querySelector(selector);
+    return modal ? modal.innerText : null;
+}
+"""
+_STEP_CHANGED_JS = """
+([selector, before]) => {
+    const modal = document.querySelector(selector);
+    return !modal || modal.innerText !== before;
+}
+"""
+
+# Easy Apply modal buttons as [selector, text] candidates, in priority order
+_NEXT_BUTTONS = [
+    ['button', 'Next'],
+    ['button', 'Continue'],
+    ['button', 'Review'],
+    ['[data-test-id*="next"]', None],
+    ['.artdeco-button--primary', 'Next']
+]
+_SUBMIT_BUTTONS = [
+    ['button', 'Submit application'],
+    ['button', 'Submit'],
+    ['button', 'Apply'],
+    ['button', 'Send application'],
+    ['[data-test-id*="submit"]', None],
+    ['.artdeco-button--primary', 'Submit']
+]
+
+_FORM_FIELD_SELECTOR = 'textarea, input[type="text"], select'
+
+# Substrings of a field's ids/hints/label that mark where AI content goes
+_COVER_LETTER_FIELD_INDICATORS = (
+    'cover letter', 'coverletter', 'cover_letter',
+    'motivation', 'why do you want', 'why are you interested',
+    'personal statement', 'message to hiring manager',
+    'additional information', 'tell us about yourself'
+)
+_RESUME_FIELD_INDICATORS = (
+    'resume', 'experience', 'relevant experience',
+    'background', 'qualifications', 'skills',
+    'work experience', 'professional experience',
+    'paste your resume', 'upload resume text',
+    'summary', 'professional summary'
+)
+_COVER_LETTER_FIELD_RE = re.compile(
+    '|'.join(map(re.escape, _COVER_LETTER_FIELD_INDICATORS)))
+_RESUME_FIELD_RE = re.compile(
+    '|'.join(map(re.escape, _RESUME_FIELD_INDICATORS)))
+
+# Attributes read for each form field, by the key they are returned under
+_FORM_FIELD_ATTRIBUTES = MappingProxyType({
+    'id': 'id',
+    'name': 'name',
+    'cls': 'class',
+    'placeholder': 'placeholder',
+    'aria': 'aria-label',
+})
+
+_JOB_DETAIL_TITLE_SELECTOR = (
+    '.job-details-jobs-unified-top-card__job-title, '
+    '.jobs-unified-top-card__job-title')
+_JOB_DETAIL_COMPANY_SELECTOR = (
+    '.job-details-jobs-unified-top-card__company-name, '
+    '.jobs-unified-top-card__company-name')
+_JOB_DETAIL_LOCATION_SELECTOR = (
+    '.job-details-jobs-unified-top-card__bullet, '
+    '.jobs-unified-top-card__bullet')
+_JOB_DETAIL_DESCRIPTION_SELECTOR = (
+    '.jobs-description-content__text, '
+    '.jobs-description__content')
+
+# Reads the text of each job detail field (null when missing) in one call
+_JOB_DETAILS_JS = """
+([titleSelector, companySelector, locationSelector, descriptionSelector]) => {
+    const text = (selector) => {
+        const el = document.querySelector(selector);
+        return el ? el.innerText : null;
+    };
+    return {
+        title: text(titleSelector),
+        company: text(companySelector),
+        location: text(locationSelector),
+        description: text(descriptionSelector)
+    };
+}
+"""
+
+
+# (tag, class) of each card field in the guest search HTML
+_GUEST_CARD_FIELDS = MappingProxyType({
+    ('h3', 'base-search-card__title'): 'title',
+    ('h4', 'base-search-card__subtitle'): 'company',
+    ('span', 'job-search-card__location'): 'location',
+})
+
+# (tag, class) of each field in the guest job posting HTML
+_GUEST_DETAIL_FIELDS = MappingProxyType({
+    ('h2', 'top-card-layout__title'): 'title',
+    ('a', 'topcard__org-name-link'): 'company',
+    ('span', 'topcard__flavor--bullet'): 'location',
+    ('div', 'show-more-less-html__markup'): 'description',
+})
+
+# Tags that start a new line of text inside a field
+_GUEST_BLOCK_TAGS = frozenset(('p', 'li', 'br', 'div', 'h3', 'ul', 'ol'))
+
+
+class _GuestJobParser(HTMLParser):
+    """
+    Collect text fields from LinkedIn guest endpoint HTML
+    Search results hold one record per job card (plus its link); a job
+    posting page is parsed as a single record
+    """
+
+    def __init__(self, fields, single_record: bool = False):
+        super().__init__()
+        self._fields = fields
+        self.records: List[Dict[str, Any]] = [{}] if single_record else []
+        self._field = None
+        self._field_tag = None
+        self._depth = 0
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._field:
+            if tag == self._field_tag:
+                self._depth += 1
+            if tag in _GUEST_BLOCK_TAGS:
+                self._text.append('\n')
+            return
+
+        attrs = dict(attrs)
+        # Each search card root carries its posting URN
+        if 'jobPosting:' in (attrs.get('data-entity-urn') or ''):
+            self.records.append({'url': attrs.get('href')} if tag == 'a' else {})
+            return
+        if not self.records:
+            return
+
+        classes = (attrs.get('class') or '').split()
+        if tag == 'a' and 'base-card__full-link' in classes:
+            self.records[-1].setdefault('url', attrs.get('href'))
+            return
+        for (field_tag, field_class), field in self._fields.items():
+            if (tag == field_tag and field_class in classes and
+                    field not in self.records[-1]):
+                self._field, self._field_tag = field, tag
+                self._depth, self._text = 0, []
+                return
+
+    def handle_data(self, data):
+        if self._field:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if not self._field or tag != self._field_tag:
+            return
+        if self._depth:
+            self._depth -= 1
+            return
+        lines = (" ".join(line.split())
+                 for line in "".join(self._text).splitlines())
+        self.records[-1][self._field] = "\n".join(line for line in lines if line)
+        self._field = None
+
 
 class LinkedInAgent(JobAgent):
     """
@@ -12,36 +401,83 @@ class LinkedInAgent(JobAgent):
     Implements the workflow from n8n: Login -> Search -> Filter -> Apply
     """
 
+    supports_concurrent_apply = True
+
     def __init__(self, config: Dict[str, Any],
                  proxy_config: Optional[Dict[str, str]] = None):
         super().__init__(config, proxy_config)
         self.platform_name = "LinkedIn"
 
+        # Config subtrees used on every login/form step, resolved once
+        self._linkedin_creds = config.get('credentials', {}).get('linkedin', {})
+        self._form_fields = self._build_form_fields(
+            config.get('application', {}).get('default_answers', {}))
+        # One case-insensitive alternation over every question key
+        self._form_field_re, self._form_field_answers = (
+            self._compile_form_fields(self._form_fields))
+
+        linkedin_config = config.get('platforms', {}).get('linkedin', {})
+        # Opt-in: read results/details from the guest endpoints' HTML
+        # before falling back to rendering the pages
+        self._use_guest_search = linkedin_config.get('guest_search', False)
+        self._use_guest_job_details = linkedin_config.get(
+            'guest_job_details', False)
+
+        # Recently fetched job details by job ID, least recently used first
+        self._details_cache_size = linkedin_config.get(
+            'details_cache_size', 256)
+        self._details_cache: 'OrderedDict[str, JobPosting]' = OrderedDict()
+
         # Email verifier for Greenhouse applications
         email_config = config.get('credentials', {}).get(
             'verification_email', {})
         if email_config.get('address'):
-            self.email_verifier = GreenHouseEmailVerifier(email_config)
+            self.email_verifier = GreenHouseEmailVerifier.get(email_config)
         else:
             self.email_verifier = None
             self.logger.warning("No email verification configured")
 
+    @staticmethod
+    def _build_form_fields(app_settings: Dict[str, Any]) -> Dict[str, str]:
+        """Map common form questions to answers from the default_answers config"""
+        return {
+            'years of experience': app_settings.get(
+                'years_experience', '3-5 years'),
+            'willing to relocate': ('Yes' if app_settings.get(
+                'willing_to_relocate', False) else 'No'),
+            'authorized to work': ('Yes' if app_settings.get(
+                'authorized_to_work', True) else 'No'),
+            'require sponsorship': ('Yes' if app_settings.get(
+                'require_sponsorship', False) else 'No'),
+            'salary expectation': app_settings.get(
+                'salary_expectation', 'Competitive'),
+            'availability': app_settings.get(
+                'availability', '2 weeks notice')
+        }
+
+    def has_credentials(self) -> bool:
+        """Whether LinkedIn email and password are configured"""
+        return bool(self._linkedin_creds.get('email') and
+                    self._linkedin_creds.get('password'))
+
     async def login(self) -> bool:
         """Login to LinkedIn using credentials from config"""
         try:
-            credentials = self.config.get(
-                'credentials', {}).get('linkedin', {})
-            if not credentials.get('email') or not credentials.get('password'):
+            if not self.has_credentials():
                 self.logger.error("LinkedIn credentials not found in config")
                 return False
+            credentials = self._linkedin_creds
+
+            # A saved session skips the whole login form
+            if self.session_restored and await self._has_active_session():
+                self.logger.info("Reusing saved LinkedIn session")
+                return True
 
             self.logger.info("Navigating to LinkedIn login page")
             await self.page.goto("https://www.linkedin.com/login",
-                                 timeout=30000)
-            await self.page.wait_for_load_state(
-                'domcontentloaded', timeout=30000)
-            # Give page time to fully load
-            await self.page.wait_for_timeout(2000)
+                                 wait_until='domcontentloaded')
+            await self.page.wait_for_selector(
+                'input[name="session_key"]', timeout=10000)
 
             # Fill login form
             await self.page.fill('input[name="session_key"]',
@@ -51,7 +487,10 @@ class LinkedInAgent(JobAgent):
 
             # Click login button
             await self.page.click('button[type="submit"]')
-            await self.page.wait_for_timeout(3000)
+            try:
+                await self.page.wait_for_url(_POST_LOGIN_URL_RE)
+            except PlaywrightError as e:
+                self.logger.debug(f"Post-login redirect wait failed: {e}")
 
             # Check for and handle CAPTCHA after login attempt
             await self.handle_captcha_if_present()
@@ -61,13 +500,20 @@ class LinkedInAgent(JobAgent):
             if ('linkedin.com/feed' in current_url or
                     'linkedin.com/jobs' in current_url):
                 self.logger.info("LinkedIn login successful")
+                await self.save_session()
                 return True
             elif 'checkpoint' in current_url or 'verify' in current_url:
                 self.logger.warning(
                     "LinkedIn login requires additional verification")
                 # Handle 2FA or verification if needed
-                # Wait for manual intervention
-                await self.page.wait_for_timeout(10000)
+                # Wait for manual intervention, returning as soon as the
+                # verification redirects to the feed or jobs pages
+                try:
+                    await self.page.wait_for_url(
+                        _LOGGED_IN_URL_RE, timeout=10000)
+                    await self.save_session()
+                except PlaywrightError as e:
+                    self.logger.debug(f"Verification still pending: {e}")
                 return True
             else:
                 self.logger.error("LinkedIn login failed")
@@ -77,117 +523,100 @@ class LinkedInAgent(JobAgent):
             self.logger.error(f"LinkedIn login error: {str(e)}")
             return False
 
+    async def _has_active_session(self) -> bool:
+        """Check the restored cookies are still logged in (no login redirect)"""
+        try:
+            await self.page.goto("https://www.linkedin.com/feed/",
+                                 wait_until='domcontentloaded')
+            return 'linkedin.com/feed' in self.page.url
+        except PlaywrightError as e:
+            self.logger.debug(f"Saved session check failed: {e}")
+            return False
+
     async def search_jobs(self, criteria: SearchCriteria) -> List[JobPosting]:
         """
         Search for jobs on LinkedIn based on criteria
-        Implements the n8n workflow: Navigate -> Type keywords -> Apply filters
+        Each location is searched on its own page, concurrently, and the
+        results are merged without duplicates
         """
-        try:
-            jobs = []
-
-            # Navigate to LinkedIn jobs page
-            self.logger.info("Navigating to LinkedIn jobs page")
-            try:
-                await self.page.goto("https://www.linkedin.com/jobs/",
-                                     timeout=60000)
-                await self.page.wait_for_load_state(
-                    'networkidle', timeout=30000)
-            except Exception as e:
-                self.logger.warning(
-                    f"Initial navigation slow: {str(e)}, continuing...")
-                # Try to wait for basic page elements instead
-                try:
-                    await self.page.wait_for_selector(
-                        ('input[aria-label*="Search"], '
-                         'input[placeholder*="Search"]'),
-                        timeout=30000)
-                except PlaywrightError as e:
-                    # Try direct search URL approach
-                    self.logger.debug(f"Search selector wait failed: {e}")
-                    search_url = (
-                        "https://www.linkedin.com/jobs/search/"
-                        "?keywords=Solutions%20Engineer"
-                        "&location=San%20Francisco%20Bay%20Area")
-                    self.logger.info("Trying direct search URL approach")
-                    await self.page.goto(search_url, timeout=60000)
-                    await self.page.wait_for_load_state('domcontentloaded')
-
-            # If we're not already on a search results page, try to search
-            current_url = self.page.url
-            if "/jobs/search" not in current_url:
-                # Search for jobs using keywords
-                keywords_str = " OR ".join(criteria.keywords)
-                locations_str = ", ".join(criteria.locations)
+        if len(criteria.locations) <= 1:
+            return await self._search_location(criteria)
 
-                try:
-                    # Try multiple selector patterns for search fields
-                    search_selectors = [
-                        'input[aria-label*="Search by title"]',
-                        'input[placeholder*="Search by title"]',
-                        'input[aria-label*="Search jobs"]',
-                        'input[aria-label*="Job title"]',
-                        'input[data-test*="job-search"]',
-                        '.jobs-search-box__text-input[aria-label*="Search"]'
-                    ]
-
-                    location_selectors = [
-                        'input[aria-label*="City"]',
-                        'input[placeholder*="City"]',
-                        'input[aria-label*="Location"]',
-                        'input[placeholder*="Location"]',
-                        'input[data-test*="location"]'
-                    ]
-
-                    # Try to fill search field
-                    search_filled = False
-                    for selector in search_selectors:
-                        try:
-                            await self.page.wait_for_selector(
-                                selector, timeout=5000)
-                            await self.page.fill(
-                                selector, keywords_str, timeout=5000)
-                            search_filled = True
-                            self.logger.info(
-                                f"Filled search with selector: {selector}")
-                            break
-                        except PlaywrightError as e:
-                            self.logger.debug(f"Search selector failed: {e}")
-                            continue
+        self.logger.info(
+            f"Searching {len(criteria.locations)} LinkedIn locations concurrently")
+        results = await asyncio.gather(
+            *[self._search_in_worker(replace(criteria, locations=[location]))
+              for location in criteria.locations],
+            return_exceptions=True)
 
-                    # Try to fill location field
-                    for selector in location_selectors:
-                        try:
-                            await self.page.wait_for_selector(
-                                selector, timeout=5000)
-                            await self.page.fill(
-                                selector, locations_str, timeout=5000)
-                            self.logger.info(
-                                f"Filled location with selector: {selector}")
-                            break
-                        except PlaywrightError as e:
-                            self.logger.debug(f"Location selector failed: {e}")
-                            continue
+        jobs = []
+        seen = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error(f"LinkedIn location search error: {result}")
+                continue
+            for job in result:
+                if job.job_id not in seen:
+                    seen.add(job.job_id)
+                    jobs.append(job)
 
-                    if search_filled:
-                        # Press enter to search
-                        await self.page.keyboard.press('Enter')
-                        await self.page.wait_for_timeout(3000)
-                        await self.page.wait_for_load_state(
-                            'domcontentloaded', timeout=30000)
+        self.logger.info(f"Found {len(jobs)} jobs on LinkedIn")
+        return jobs
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Search form filling failed: {str(e)}, "
-                        "trying to extract jobs from current page")
+    async def iter_job_batches(
+            self, criteria: SearchCriteria) -> AsyncIterator[List[JobPosting]]:
+        """Yield each location's new results as soon as its search finishes"""
+        if len(criteria.locations) <= 1:
+            yield await self.search_jobs(criteria)
+            return
+
+        seen = set()
+        for search in asyncio.as_completed(
+                [self._search_in_worker(replace(criteria, locations=[location]))
+                 for location in criteria.locations]):
+            try:
+                jobs = await search
+            except Exception as e:
+                self.logger.error(f"LinkedIn location search error: {e}")
+                continue
+            batch = [job for job in jobs if job.job_id not in seen]
+            seen.update(job.job_id for job in batch)
+            yield batch
 
-            # Wait a moment for any dynamic content to load
-            await self.page.wait_for_timeout(3000)
+    async def _search_in_worker(self, criteria: SearchCriteria) -> List[JobPosting]:
+        """Run one location search on a pooled page"""
+        async with self._worker() as worker:
+            return await worker._search_location(criteria)
 
-            # Apply filters - following n8n Click operations
-            await self._apply_search_filters(criteria)
+    async def _search_location(self, criteria: SearchCriteria) -> List[JobPosting]:
+        """
+        Search one location (or none)
+        Opens the results URL directly and only falls back to the n8n
+        workflow (Navigate -> Type keywords -> Apply filters) if it is empty
+        """
+        try:
+            if self._use_guest_search:
+                jobs = await self._search_via_guest_api(criteria)
+                if jobs:
+                    self.logger.info(
+                        f"Found {len(jobs)} jobs via LinkedIn guest search")
+                    return jobs
+
+            # Keywords, location and filters all fit in the search URL
+            self.logger.info("Navigating to LinkedIn job search results")
+            try:
+                await self.page.goto(self._build_search_url(criteria),
+                                     wait_until='domcontentloaded')
+                jobs = await self._extract_job_listings()
+                if jobs:
+                    self.logger.info(f"Found {len(jobs)} jobs on LinkedIn")
+                    return jobs
+            except PlaywrightError as e:
+                self.logger.debug(f"Direct search URL failed: {e}")
 
-            # Extract job listings
-            jobs = await self._extract_job_listings()
+            self.logger.info(
+                "Direct search returned no results, falling back to search form")
+            jobs = await self._search_via_form(criteria)
 
             self.logger.info(f"Found {len(jobs)} jobs on LinkedIn")
             return jobs
@@ -196,12 +625,114 @@ class LinkedInAgent(JobAgent):
             self.logger.error(f"LinkedIn job search error: {str(e)}")
             return []
 
+    def _build_search_url(self, criteria: SearchCriteria,
+                          base_url: str = _JOBS_SEARCH_URL) -> str:
+        """Build a LinkedIn job search URL with keywords, location and filters"""
+        params = {'keywords': " OR ".join(criteria.keywords)}
+        if criteria.locations:
+            params['location'] = ", ".join(criteria.locations)
+        params.update(self._search_filter_params(criteria))
+        return f"{base_url}?{urlencode(params, quote_via=quote)}"
+
+    async def _search_via_guest_api(
+            self, criteria: SearchCriteria) -> List[JobPosting]:
+        """Fetch the first page of results as card HTML over the session's
+        HTTP client, with no page render"""
+        try:
+            response = await self.page.request.get(
+                self._build_search_url(criteria, _GUEST_SEARCH_URL))
+            if not response.ok:
+                self.logger.debug(
+                    f"Guest job search returned HTTP {response.status}")
+                return []
+            parser = _GuestJobParser(_GUEST_CARD_FIELDS)
+            parser.feed(await response.text())
+        except PlaywrightError as e:
+            self.logger.debug(f"Guest job search failed: {e}")
+            return []
+
+        return self._jobs_from_card_data(parser.records[:20])
+
+    def _search_filter_params(self, criteria: SearchCriteria) -> Dict[str, str]:
+        """Map search criteria onto LinkedIn's search URL filter parameters"""
+        params = {}
+
+        # LinkedIn's Easy Apply filter parameter
+        if criteria.easy_apply_only:
+            params['f_LF'] = 'f_AL'
+
+        date_filter = _DATE_POSTED_FILTERS.get(criteria.date_posted)
+        if date_filter:
+            params['f_TPR'] = date_filter
+
+        experience_filter = _EXPERIENCE_LEVEL_FILTERS.get(
+            criteria.experience_level)
+        if experience_filter:
+            params['f_E'] = experience_filter
+
+        return params
+
+    async def _search_via_form(self, criteria: SearchCriteria) -> List[JobPosting]:
+        """Search by filling in the jobs page search form (last resort)"""
+        # Navigate to LinkedIn jobs page
+        self.logger.info("Navigating to LinkedIn jobs page")
+        try:
+            await self.page.goto("https://www.linkedin.com/jobs/",
+                                 wait_until='domcontentloaded')
+        except Exception as e:
+            self.logger.warning(
+                f"Initial navigation slow: {str(e)}, continuing...")
+
+        # Search for jobs using keywords
+        keywords_str = " OR ".join(criteria.keywords)
+        locations_str = ", ".join(criteria.locations)
+
+        try:
+            # fill() waits for the first visible candidate, so one 5s budget
+            # covers every search field selector
+            search_filled = False
+            try:
+                await self.page.locator(
+                    _VISIBLE_SEARCH_INPUT_SELECTOR).first.fill(
+                        keywords_str, timeout=5000)
+                search_filled = True
+                self.logger.info("Filled search field")
+            except PlaywrightError as e:
+                self.logger.debug(f"Search selector failed: {e}")
+
+            # Location field is optional - fill it only if present
+            try:
+                location_input = self.page.locator(
+                    _VISIBLE_LOCATION_INPUT_SELECTOR).first
+                if await location_input.count():
+                    await location_input.fill(locations_str, timeout=5000)
+                    self.logger.info("Filled location field")
+            except PlaywrightError as e:
+                self.logger.debug(f"Location selector failed: {e}")
+
+            if search_filled:
+                # Press enter to search
+                await self.page.keyboard.press('Enter')
+                await self.page.wait_for_load_state('domcontentloaded')
+
+        except Exception as e:
+            self.logger.warning(
+                f"Search form filling failed: {str(e)}, "
+                "trying to extract jobs from current page")
+
+        # Apply filters - following n8n Click operations
+        await self._apply_search_filters(criteria)
+
+        # Extract job listings
+        return await self._extract_job_listings()
+
     async def _apply_search_filters(self, criteria: SearchCriteria):
         """Apply search filters similar to n8n Click operations"""
-        try:
-            # Wait for filters to be available
-            await self.page.wait_for_timeout(3000)
+        if not self._search_filter_params(criteria):
+            self.logger.debug("No search filters set, keeping current results")
+            return
 
+        try:
             # Try to use URL-based filtering first (more reliable)
             current_url = self.page.url
             filters_applied = await self._apply_url_filters(
@@ -216,29 +747,18 @@ class LinkedInAgent(JobAgent):
             if criteria.easy_apply_only:
                 try:
                     # Look for Easy Apply filter button with shorter timeout
-                    easy_apply_selectors = [
-                        'button[aria-label*="Easy Apply"]',
-                        'button:has-text("Easy Apply")',
-                        'label:has-text("Easy Apply")',
-                        '[data-test-id*="easy-apply"]',
-                        '.filter-button:has-text("Easy Apply")',
-                        'input[value="Easy Apply"]'
-                    ]
-
                     filter_applied = False
-                    for selector in easy_apply_selectors:
-                        try:
-                            await self.page.wait_for_selector(
-                                selector, timeout=3000)
-                            if await self.page.is_visible(selector):
-                                await self.page.click(selector, timeout=3000)
-                                self.logger.info("Applied Easy Apply filter")
-                                filter_applied = True
-                                break
-                        except PlaywrightError as e:
-                            self.logger.debug(
-                                f"Easy Apply selector failed: {e}")
-                            continue
+                    try:
+                        await self.page.wait_for_selector(
+                            _EASY_APPLY_FILTER_SELECTOR, timeout=3000)
+                        if await self.page.is_visible(
+                                _EASY_APPLY_FILTER_SELECTOR):
+                            await self.page.click(
+                                _EASY_APPLY_FILTER_SELECTOR, timeout=3000)
+                            self.logger.info("Applied Easy Apply filter")
+                            filter_applied = True
+                    except PlaywrightError as e:
+                        self.logger.debug(f"Easy Apply selector failed: {e}")
 
                     if not filter_applied:
                         self.logger.info(
@@ -252,8 +772,12 @@ class LinkedInAgent(JobAgent):
             # Just proceed with basic search results
             self.logger.info("Skipping additional filters to avoid timeouts")
 
-            # Wait briefly for any applied filters to take effect
-            await self.page.wait_for_timeout(2000)
+            # Wait for the filtered result cards to render
+            try:
+                await self.page.wait_for_function(
+                    _JOB_CARDS_RENDERED_JS, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Filtered results wait failed: {e}")
 
         except Exception as e:
             self.logger.warning(
@@ -264,58 +788,17 @@ class LinkedInAgent(JobAgent):
                                  current_url: str) -> bool:
         """Apply filters by modifying the URL (more reliable than UI clicks)"""
         try:
-            from urllib.parse import urlencode, urlparse, parse_qs
-
-            # Parse current URL
-            parsed = urlparse(current_url)
-            params = parse_qs(parsed.query)
+            # LinkedIn search parameters are single-valued, so a flat dict
+            # of the current query is enough to overlay the filters on
+            parsed = urlsplit(current_url)
+            params = dict(parse_qsl(parsed.query))
+            params.update(self._search_filter_params(criteria))
 
-            # Add Easy Apply filter
-            if criteria.easy_apply_only:
-                # LinkedIn's Easy Apply filter parameter
-                params['f_LF'] = ['f_AL']
-
-            # Add date filter
-            if criteria.date_posted:
-                date_map = {
-                    "Past 24 hours": "r86400",
-                    "Past week": "r604800",
-                    "Past month": "r2592000"
-                }
-                if criteria.date_posted in date_map:
-                    params['f_TPR'] = [date_map[criteria.date_posted]]
-
-            # Add experience level filter
-            if criteria.experience_level:
-                exp_map = {
-                    "Internship": "1",
-                    "Entry level": "2",
-                    "Associate": "3",
-                    "Mid-Senior level": "4",
-                    "Director": "5",
-                    "Executive": "6"
-                }
-                if criteria.experience_level in exp_map:
-                    params['f_E'] = [exp_map[criteria.experience_level]]
-
-            # Build new URL
-            # Convert single-item lists back to strings for urlencode
-            clean_params = {}
-            for key, value_list in params.items():
-                if value_list:
-                    clean_params[key] = (
-                        value_list[0] if len(value_list) == 1
-                        else value_list)
-
-            new_query = urlencode(clean_params, doseq=True)
-            new_url = (
-                f"{parsed.scheme}://{parsed.netloc}"
-                f"{parsed.path}?{new_query}")
+            new_url = urlunsplit((parsed.scheme, parsed.netloc, parsed.path,
+                                  urlencode(params), ''))
 
             # Navigate to filtered URL
-            await self.page.goto(new_url, timeout=30000)
-            await self.page.wait_for_load_state(
-                'domcontentloaded', timeout=20000)
+            await self.page.goto(new_url, wait_until='domcontentloaded')
             return True
 
         except Exception as e:
@@ -327,228 +810,116 @@ class LinkedInAgent(JobAgent):
         jobs = []
 
         try:
-            # Wait for page to load
-            await self.page.wait_for_timeout(5000)
-
-            # Try multiple selectors for job results container
-            results_selectors = [
-                '.jobs-search__results-list',
-                '.jobs-search-results-list',
-                '.jobs-search-results__list',
-                '.search-results-container',
-                '[data-test-results-list]',
-                '.job-search-results-list',
-                '.jobs-search-results',
-                '.scaffold-layout__list-detail',
-                '.jobs-search-results-list'
-            ]
-
-            results_container = None
-            for selector in results_selectors:
-                try:
-                    if await self.page.query_selector_all(selector):
-                        results_container = selector
-                        self.logger.info(
-                            f"Found results container: {selector}")
-                        break
-                except (PlaywrightError, AttributeError, TypeError) as e:
-                    self.logger.debug(
-                        f"Results container selector failed: {e}")
-                    continue
-
-            if not results_container:
+            # Wait once for any results container candidate to render
+            try:
+                await self.page.wait_for_selector(
+                    _RESULTS_CONTAINER_SELECTOR, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Results container wait failed: {e}")
                 self.logger.warning(
                     ("Could not find standard results container, "
                      "trying generic job selectors"))
 
-            # Try multiple selectors for individual job cards
-            job_card_selectors = [
-                'li[data-occludable-job-id]',  # Primary LinkedIn job cards
-                '[data-job-id]',  # Alternative job elements
-                '.job-search-card',
-                '.jobs-search-results__list-item',
-                '.job-result-card',
-                '.base-search-card',
-                'li[data-entity-urn*="job"]',  # Updated LinkedIn format
-                'div[data-entity-urn*="job"]',
-                '.entity-result',
-                '.result-card',
-                'article[data-entity-urn]',
-                '.scaffold-layout__list-item',
-                'li.jobs-search-results__list-item',
-                'div.job-search-card'
-            ]
-
-            job_cards = []
-            for selector in job_card_selectors:
-                try:
-                    cards = await self.page.query_selector_all(selector)
-                    if cards and len(cards) > 0:
-                        job_cards = cards
-                        self.logger.info(
-                            f"Found {len(cards)} job cards "
-                            f"with selector: {selector}")
-                        break
-                except (PlaywrightError, AttributeError, TypeError) as e:
-                    self.logger.debug(f"Job card selector failed: {e}")
-                    continue
+            # Extract every job card in a single browser-side pass
+            card_data = []
+            try:
+                card_data = await self.page.evaluate(
+                    _EXTRACT_JOB_CARDS_JS,
+                    [list(_JOB_CARD_SELECTORS), list(_TITLE_SELECTORS),
+                     list(_COMPANY_SELECTORS), list(_LOCATION_SELECTORS), 20])
+                if card_data:
+                    self.logger.info(f"Found {len(card_data)} job cards")
+            except PlaywrightError as e:
+                self.logger.debug(f"Job card extraction failed: {e}")
 
             # If no structured job cards, try to find job links
-            if not job_cards:
+            if not card_data:
                 self.logger.info(
                     ("No job cards found, "
                      "trying to find job links directly"))
                 try:
-                    job_links = await self.page.query_selector_all(
-                        'a[href*="/jobs/view/"]')
-                    if job_links:
+                    # Read every link's text and href in one round-trip
+                    link_data = await self.page.locator(
+                        _JOB_LINK_SELECTOR).evaluate_all(
+                            _EXTRACT_JOB_LINKS_JS, 20)
+                    if link_data:
                         self.logger.info(
-                            f"Found {len(job_links)} job links as fallback")
-                        # Extract minimal job info from links
-                        for link in job_links[:20]:
-                            try:
-                                title = await link.inner_text()
-                                url = await link.get_attribute('href')
-                                if url and not url.startswith('http'):
-                                    url = urljoin(
-                                        'https://www.linkedin.com', url)
-
-                                job_id = self._extract_job_id_from_url(url)
-                                if title and url and job_id:
-                                    jobs.append(JobPosting(
-                                        job_id=job_id,
-                                        title=title.strip(),
-                                        company="Unknown",
-                                        location="Unknown",
-                                        url=url,
-                                        platform="LinkedIn"
-                                    ))
-                            except (PlaywrightError, AttributeError,
-                                    TypeError) as e:
-                                self.logger.debug(
-                                    f"Job link extraction failed: {e}")
-                                continue
-                        return jobs
-                except (PlaywrightError, AttributeError, TypeError) as e:
+                            f"Found {len(link_data)} job links as fallback")
+                        return self._jobs_from_card_data(link_data)
+                except PlaywrightError as e:
                     self.logger.debug(f"Job links fallback failed: {e}")
-                    pass
 
-            # Process job cards
-            processed_count = 0
-            for card in job_cards[:20]:  # Limit to first 20 jobs
-                try:
-                    job = await self._extract_single_job(card)
-                    if job:
-                        jobs.append(job)
-                        processed_count += 1
-                except Exception as e:
-                    self.logger.debug(f"Error extracting job: {str(e)}")
-                    continue
+            # Build postings in pure Python - no further browser calls
+            jobs = self._jobs_from_card_data(card_data)
 
             self.logger.info(
-                f"Successfully extracted {processed_count} jobs "
-                f"from {len(job_cards)} cards")
+                f"Successfully extracted {len(jobs)} jobs "
+                f"from {len(card_data)} cards")
 
         except Exception as e:
             self.logger.error(f"Error extracting job listings: {str(e)}")
 
         return jobs
 
-    async def _extract_single_job(self, card) -> Optional[JobPosting]:
-        """Extract information from a single job card"""
-        try:
-            # Extract job title - try multiple selectors
-            title_selectors = [
-                'a[data-test-id*="job-title"]',
-                '.job-search-card__title a',
-                '.job-title a',
-                'h3 a',
-                'a[aria-label*="job"]',
-                'a:has-text("Engineer")'  # fallback for engineer jobs
-            ]
-
-            title_element = None
-            for selector in title_selectors:
-                title_element = await card.query_selector(selector)
-                if title_element:
-                    break
-
-            if not title_element:
-                # Try to get any link within the card
-                title_element = await card.query_selector('a')
-                if not title_element:
-                    return None
-
-            title = await title_element.inner_text()
-            job_url = await title_element.get_attribute('href')
-
-            # Make URL absolute
-            if job_url and not job_url.startswith('http'):
-                job_url = urljoin('https://www.linkedin.com', job_url)
-
-            # Extract job ID from URL
-            job_id = self._extract_job_id_from_url(job_url)
-
-            # Extract company name - try multiple selectors
-            company_selectors = [
-                '[data-test-id*="company"]',
-                '.job-search-card__subtitle',
-                '.job-subtitle',
-                'h4',
-                '.base-search-card__subtitle'
-            ]
-
-            company = "Unknown"
-            for selector in company_selectors:
-                company_element = await card.query_selector(selector)
-                if company_element:
-                    company = await company_element.inner_text()
-                    break
-
-            # Extract location - try multiple selectors
-            location_selectors = [
-                '[data-test-id*="location"]',
-                '.job-search-card__location',
-                '.job-location',
-                '.base-search-card__location'
-            ]
-
-            location = "Unknown"
-            for selector in location_selectors:
-                location_element = await card.query_selector(selector)
-                if location_element:
-                    location = await location_element.inner_text()
-                    break
-
-            # For now, assume all jobs allow Easy Apply since we're on a
-            # filtered page. We'll check this during application attempt
-
-            return JobPosting(
-                job_id=job_id,
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
-                url=job_url,
-                platform="LinkedIn"
-            )
+    def _jobs_from_card_data(
+            self, cards: List[Dict[str, Any]]) -> List[JobPosting]:
+        """Build postings from extracted cards, once per job ID"""
+        jobs = []
+        seen = set()
+        for data in cards:
+            job = self._job_from_card_data(data)
+            if job and job.job_id not in seen:
+                seen.add(job.job_id)
+                jobs.append(job)
+        return jobs
 
-        except Exception as e:
-            self.logger.warning(f"Error extracting single job: {str(e)}")
+    def _job_from_card_data(self, data: Dict[str, Any]) -> Optional[JobPosting]:
+        """Build a JobPosting from the fields extracted for one job card"""
+        title = data.get('title')
+        job_url = data.get('url')
+        if not title or not job_url:
             return None
 
+        # Make URL absolute
+        if not job_url.startswith('http'):
+            job_url = urljoin('https://www.linkedin.com', job_url)
+
+        # For now, assume all jobs allow Easy Apply since we're on a
+        # filtered page. We'll check this during application attempt
+        return JobPosting(
+            job_id=self._extract_job_id_from_url(job_url),
+            title=title.strip(),
+            company=(data.get('company') or "Unknown").strip(),
+            location=(data.get('location') or "Unknown").strip(),
+            url=job_url,
+            platform="LinkedIn"
+        )
+
     def _extract_job_id_from_url(self, url: str) -> str:
         """Extract LinkedIn job ID from URL"""
-        try:
-            # LinkedIn job URLs typically contain the job ID
-            # Example: https://www.linkedin.com/jobs/view/1234567890/
-            if '/jobs/view/' in url:
-                return url.split('/jobs/view/')[1].split('/')[0].split('?')[0]
-            else:
-                # Fallback: use the entire URL as ID
-                return url.split('/')[-1].split('?')[0]
-        except (AttributeError, TypeError, ValueError) as e:
-            self.logger.debug(f"Job ID extraction failed: {e}")
+        # LinkedIn job URLs typically contain the job ID
+        # Example: https://www.linkedin.com/jobs/view/1234567890/
+        match = _JOB_ID_RE.search(url)
+        if match:
+            return match.group(1)
+        # Search and collection pages name the selected job in the query:
+        # /jobs/search/?currentJobId=1234567890
+        parts = urlsplit(url)
+        current_job_id = dict(parse_qsl(parts.query)).get('currentJobId')
+        if current_job_id:
+            return current_job_id
+        # Fallback: the slug after /jobs/view/ (the whole URL when there is
+        # none), else the last non-empty path segment, else the whole URL.
+        # Never an empty or shared ID: it would merge distinct postings in
+        # dedup and in the applied-jobs state.
+        path = parts.path
+        _, view_marker, view_path = f"{path}/".partition('/jobs/view/')
+        segments = [segment for segment in
+                    (view_path if view_marker else path).split('/')
+                    if segment]
+        if not segments:
             return url
+        return segments[0] if view_marker else segments[-1]
 
     async def apply_to_job(self, job: JobPosting,
                            ai_content: Optional[Dict[str, str]] = None) -> bool:
@@ -561,35 +932,41 @@ class LinkedInAgent(JobAgent):
             ai_content: Optional AI-generated content
                        (cover letter, optimized resume sections)
         """
+        try:
+            async with self._worker() as worker:
+                return await worker._apply_on_page(job, ai_content)
+        except Exception as e:
+            self.logger.error(f"Error applying to {job.title}: {str(e)}")
+            return False
+
+    async def _apply_on_page(self, job: JobPosting,
+                             ai_content: Optional[Dict[str, str]] = None) -> bool:
+        """Run the Easy Apply flow for a job on this agent's current page"""
         try:
             self.logger.info(f"Applying to {job.title} at {job.company}")
 
-            # Navigate to job page
-            await self.page.goto(job.url)
-            await self.page.wait_for_load_state('networkidle')
+            # Navigate to job page and wait for the apply button, not the
+            # analytics beacons that keep LinkedIn from ever going idle
+            await self.page.goto(job.url, wait_until='domcontentloaded')
+            try:
+                await self.page.wait_for_selector(
+                    _EASY_APPLY_BUTTON_SELECTOR, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Easy Apply button wait failed: {e}")
 
             # Check for CAPTCHA after navigation
             await self.handle_captcha_if_present()
 
             # Click Easy Apply button
-            easy_apply_selectors = [
-                '.jobs-apply-button--top-card',
-                'button:has-text("Easy Apply")',
-                '[data-test-id*="easy-apply"]',
-                '.jobs-apply-button'
-            ]
-
+            # Click the first visible candidate in a single call
             clicked = False
-            for selector in easy_apply_selectors:
-                try:
-                    if await self.page.is_visible(selector):
-                        await self.page.click(selector)
-                        clicked = True
-                        break
-                except PlaywrightError as e:
-                    self.logger.debug(
-                        f"Easy Apply button selector failed: {e}")
-                    continue
+            try:
+                await self.page.locator(
+                    _VISIBLE_EASY_APPLY_BUTTON_SELECTOR).first.click(
+                        timeout=5000)
+                clicked = True
+            except PlaywrightError as e:
+                self.logger.debug(f"Easy Apply button click failed: {e}")
 
             if not clicked:
                 self.logger.warning(
@@ -597,7 +974,11 @@ class LinkedInAgent(JobAgent):
                 return False
 
             # Wait for application form to load
-            await self.page.wait_for_timeout(2000)
+            try:
+                await self.page.wait_for_selector(
+                    _EASY_APPLY_MODAL_SELECTOR, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Easy Apply modal wait failed: {e}")
 
             # Handle application process with AI content
             success = await self._handle_application_flow(job, ai_content)
@@ -623,18 +1004,20 @@ class LinkedInAgent(JobAgent):
             current_step = 0
 
             while current_step < max_steps:
-                # Check if we're done
-                if await self._is_application_complete():
+                # One text scan covers both the success and Greenhouse checks
+                matches = await self._page_text_matches()
+                if matches.get('complete') or await self._success_visible():
                     return True
 
                 # Check for Greenhouse verification
                 if (self.email_verifier and
-                        await self._is_greenhouse_verification()):
+                        self._needs_greenhouse_verification(matches)):
                     verification_success = (
                         await self.email_verifier
                         .handle_greenhouse_verification(self.page))
                     if verification_success:
-                        await self.page.wait_for_timeout(3000)
+                        await self.page.wait_for_load_state(
+                            'domcontentloaded', timeout=10000)
                         continue
                     else:
                         self.logger.error("Greenhouse verification failed")
@@ -643,21 +1026,36 @@ class LinkedInAgent(JobAgent):
                 # Fill form fields if present, using AI content when available
                 await self._fill_application_form(ai_content)
 
+                # Remember this step so we can tell when the next one renders
+                step_text = await self._modal_text()
+
                 # Look for Next/Submit/Review buttons
                 next_clicked = await self._click_next_button()
                 if not next_clicked:
                     # Try to submit
                     submit_clicked = await self._click_submit_button()
                     if submit_clicked:
-                        await self.page.wait_for_timeout(3000)
-                        return await self._is_application_complete()
+                        try:
+                            await self.page.wait_for_function(
+                                _SUCCESS_TEXT_JS,
+                                arg=_PAGE_TEXT_GROUPS['complete'],
+                                timeout=10000)
+                            return True
+                        except PlaywrightError as e:
+                            self.logger.debug(
+                                f"Submission confirmation wait failed: {e}")
+                        # Fall back to the confirmation headings/page text
+                        if await self._success_visible():
+                            return True
+                        matches = await self._page_text_matches()
+                        return bool(matches.get('complete'))
                     else:
                         self.logger.warning(
                             "Could not find Next or Submit button")
                         return False
 
                 current_step += 1
-                await self.page.wait_for_timeout(2000)
+                await self._wait_for_step_change(step_text)
 
             return False
 
@@ -665,190 +1063,165 @@ class LinkedInAgent(JobAgent):
             self.logger.error(f"Error in application flow: {str(e)}")
             return False
 
-    async def _is_application_complete(self) -> bool:
-        """Check if application is complete"""
-        success_indicators = [
-            'application submitted',
-            'thank you for applying',
-            'application received',
-            'successfully submitted',
-            'application complete'
-        ]
-
-        content = await self.page.content()
-        return any(indicator in content.lower()
-                   for indicator in success_indicators)
-
-    async def _is_greenhouse_verification(self) -> bool:
-        """Check if current page requires Greenhouse email verification"""
-        url = self.page.url
-        content = await self.page.content()
-
-        greenhouse_indicators = [
-            'greenhouse.io' in url.lower(),
-            'verify your email' in content.lower(),
-            'check your email' in content.lower(),
-            'verification link' in content.lower()
-        ]
-
-        return any(greenhouse_indicators)
+    async def _modal_text(self) -> Optional[str]:
+        """Read the visible text of the Easy Apply modal, if open"""
+        try:
+            return await self.page.evaluate(
+                _MODAL_TEXT_JS, _EASY_APPLY_MODAL_SELECTOR)
+        except PlaywrightError as e:
+            self.logger.debug(f"Could not read Easy Apply modal: {e}")
+            return None
+
+    async def _wait_for_step_change(self, step_text: Optional[str]) -> None:
+        """Wait until the Easy Apply modal shows a different step"""
+        try:
+            await self.page.wait_for_function(
+                _STEP_CHANGED_JS,
+                arg=[_EASY_APPLY_MODAL_SELECTOR, step_text],
+                timeout=10000)
+        except PlaywrightError as e:
+            self.logger.debug(f"Next step wait failed: {e}")
+
+    async def _success_visible(self) -> bool:
+        """Check for a post-apply confirmation element with a selector count"""
+        try:
+            return await self.page.locator(_SUCCESS_SELECTOR).count() > 0
+        except PlaywrightError as e:
+            self.logger.debug(f"Success selector check failed: {e}")
+            return False
+
+    async def _page_text_matches(self) -> Dict[str, bool]:
+        """Scan the page text for success and verification prompts at once"""
+        try:
+            return await self.page.evaluate(
+                _PAGE_TEXT_MATCHES_JS, _PAGE_TEXT_GROUPS)
+        except PlaywrightError as e:
+            self.logger.debug(f"Page text check failed: {e}")
+            return {}
+
+    def _needs_greenhouse_verification(self, matches: Dict[str, bool]) -> bool:
+        """Check the URL, then the page-text matches, for Greenhouse"""
+        # The URL check is free, so try it before the text matches
+        if 'greenhouse.io' in self.page.url.lower():
+            return True
+        return bool(matches.get('greenhouse'))
 
     async def _fill_application_form(
             self, ai_content: Optional[Dict[str, str]] = None):
         """Fill common application form fields with AI-generated content
         when available"""
         try:
+            # Labels for inputs and selects are all read in the same pass,
+            # shared by the AI content and the default answers below
+            fields = await self._describe_form_fields(
+                _FORM_FIELD_SELECTOR, _FORM_FIELD_ATTRIBUTES)
+
             # First, try to fill AI-generated content if provided
+            filled = set()
             if ai_content:
-                await self._fill_ai_content(ai_content)
-
-            app_settings = self.config.get(
-                'application', {}).get('default_answers', {})
-
-            # Common form fields and their values
-            form_fields = {
-                'years of experience': app_settings.get(
-                    'years_experience', '3-5 years'),
-                'willing to relocate': ('Yes' if app_settings.get(
-                    'willing_to_relocate', False) else 'No'),
-                'authorized to work': ('Yes' if app_settings.get(
-                    'authorized_to_work', True) else 'No'),
-                'require sponsorship': ('Yes' if app_settings.get(
-                    'require_sponsorship', False) else 'No'),
-                'salary expectation': app_settings.get(
-                    'salary_expectation', 'Competitive'),
-                'availability': app_settings.get(
-                    'availability', '2 weeks notice')
-            }
+                filled = await self._fill_ai_content(ai_content, fields)
 
-            # Try to fill text inputs
-            inputs = await self.page.query_selector_all(
-                'input[type="text"], textarea')
-            for input_element in inputs:
-                placeholder = (
-                    await input_element.get_attribute('placeholder') or '')
-                label_text = await self._get_input_label(input_element)
+            # Try to fill text inputs, leaving AI-filled fields alone
+            for field in fields:
+                if field['tag'] == 'select' or field['index'] in filled:
+                    continue
 
                 # Match field based on placeholder or label
-                for field_key, field_value in form_fields.items():
-                    if (field_key.lower() in placeholder.lower() or
-                            field_key.lower() in label_text.lower()):
-                        await input_element.fill(str(field_value))
-                        break
+                field_value = self._match_form_answer(
+                    field['placeholder'], field['label'])
+                if field_value is not None:
+                    await self._fill_field(field, field_value)
 
             # Handle dropdowns/selects
-            selects = await self.page.query_selector_all('select')
-            for select_element in selects:
-                label_text = await self._get_input_label(select_element)
+            for field in fields:
+                if field['tag'] != 'select':
+                    continue
+                field_value = self._match_form_answer(field['label'])
+                if field_value is None:
+                    continue
+                selector = self._field_selector(field)
 
-                for field_key, field_value in form_fields.items():
-                    if field_key.lower() in label_text.lower():
-                        try:
-                            await select_element.select_option(
-                                label=str(field_value))
-                        except PlaywrightError:
-                            # Try by value if label doesn't work
-                            try:
-                                await select_element.select_option(
-                                    value=str(field_value))
-                            except PlaywrightError as e:
-                                self.logger.debug(
-                                    f"Select option failed: {e}")
-                                pass
-                        break
+                try:
+                    await self.page.select_option(selector, label=field_value)
+                except PlaywrightError:
+                    # Try by value if label doesn't work
+                    try:
+                        await self.page.select_option(
+                            selector, value=field_value)
+                    except PlaywrightError as e:
+                        self.logger.debug(f"Select option failed: {e}")
 
         except Exception as e:
             self.logger.warning(f"Error filling form: {str(e)}")
 
-    async def _fill_ai_content(self, ai_content: Dict[str, str]) -> None:
-        """Fill form fields with AI-generated content"""
+    async def _fill_ai_content(
+            self, ai_content: Dict[str, str],
+            fields: Optional[List[Dict[str, Any]]] = None) -> Set[int]:
+        """Fill form fields with AI-generated content, returning the indices
+        of the fields that were filled"""
+        filled = set()
         try:
             if not ai_content:
-                return
+                return filled
+
+            # Work out up front which kinds of content there are to place
+            cover_letter = ai_content.get('cover_letter')
+            resume_content = (ai_content.get('optimized_summary') or
+                              ai_content.get('optimized_skills'))
+            if not cover_letter and not resume_content:
+                return filled
 
             self.logger.info(
                 "Filling application form with AI-generated content")
 
-            # Get all text inputs and textareas
-            form_elements = await self.page.query_selector_all(
-                'textarea, input[type="text"]')
+            # Describe all text inputs and textareas in one browser call,
+            # unless the caller already has the descriptions
+            if fields is None:
+                fields = await self._describe_form_fields(
+                    _FORM_FIELD_SELECTOR, _FORM_FIELD_ATTRIBUTES)
+            form_fields = [field for field in fields
+                           if field['tag'] != 'select']
 
             # Track which fields we've filled
             filled_cover_letter = False
             filled_resume_section = False
 
-            for element in form_elements:
-                try:
-                    # Get element attributes for identification
-                    element_id = await element.get_attribute('id') or ''
-                    element_name = await element.get_attribute('name') or ''
-                    element_class = await element.get_attribute('class') or ''
-                    placeholder = (
-                        await element.get_attribute('placeholder') or '')
-                    aria_label = (
-                        await element.get_attribute('aria-label') or '')
-
-                    # Get associated label text
-                    label_text = await self._get_input_label(element)
+            for field in form_fields:
+                # Stop once every kind of content we have has been placed
+                if ((filled_cover_letter or not cover_letter) and
+                        (filled_resume_section or not resume_content)):
+                    break
 
+                try:
                     # Combine all text for field identification
                     field_identifiers = (
-                        f"{element_id} {element_name} {element_class} "
-                        f"{placeholder} {aria_label} {label_text}").lower()
+                        f"{field['id']} {field['name']} {field['cls']} "
+                        f"{field['placeholder']} {field['aria']} "
+                        f"{field['label']}").lower()
 
                     # Check if this is a cover letter field
-                    cover_letter_indicators = [
-                        'cover letter', 'coverletter', 'cover_letter',
-                        'motivation', 'why do you want', 'why are you interested',
-                        'personal statement', 'message to hiring manager',
-                        'additional information', 'tell us about yourself'
-                    ]
-
-                    if (not filled_cover_letter and
-                            'cover_letter' in ai_content):
-                        if any(indicator in field_identifiers
-                               for indicator in cover_letter_indicators):
+                    if cover_letter and not filled_cover_letter:
+                        if _COVER_LETTER_FIELD_RE.search(field_identifiers):
                             self.logger.info(
                                 ("Found cover letter field, "
                                  "filling with AI-generated content"))
-                            await element.fill(ai_content['cover_letter'])
+                            await self._fill_field(field, cover_letter)
                             filled_cover_letter = True
-                            # Brief pause
-                            await self.page.wait_for_timeout(1000)
+                            filled.add(field['index'])
                             continue
 
-                    # Check if this is a resume/experience field
-                    resume_indicators = [
-                        'resume', 'experience', 'relevant experience',
-                        'background', 'qualifications', 'skills',
-                        'work experience', 'professional experience',
-                        'paste your resume', 'upload resume text',
-                        'summary', 'professional summary'
-                    ]
-
                     # Use optimized summary or skills if available
-                    resume_content = None
-                    if 'optimized_summary' in ai_content:
-                        resume_content = ai_content['optimized_summary']
-                    elif 'optimized_skills' in ai_content:
-                        resume_content = ai_content['optimized_skills']
-
-                    if not filled_resume_section and resume_content:
+                    if resume_content and not filled_resume_section:
                         # Check if this is a large text area
                         # (likely for resume/experience)
-                        tag_name = await element.evaluate(
-                            'el => el.tagName.toLowerCase()')
-
-                        if (tag_name == 'textarea' and
-                                any(indicator in field_identifiers
-                                    for indicator in resume_indicators)):
+                        if (field['tag'] == 'textarea' and
+                                _RESUME_FIELD_RE.search(field_identifiers)):
                             self.logger.info(
                                 ("Found resume/experience field, "
                                  "filling with AI-optimized content"))
-                            await element.fill(resume_content)
+                            await self._fill_field(field, resume_content)
                             filled_resume_section = True
-                            # Brief pause
-                            await self.page.wait_for_timeout(1000)
+                            filled.add(field['index'])
                             continue
 
                 except Exception as e:
@@ -874,114 +1247,75 @@ class LinkedInAgent(JobAgent):
             self.logger.error(f"Error filling AI content: {e}")
             # Don't raise exception - fallback to standard form filling
 
-    async def _get_input_label(self, element) -> str:
-        """Get the label text associated with an input element"""
-        try:
-            # Try to find associated label
-            element_id = await element.get_attribute('id')
-            if element_id:
-                label = await self.page.query_selector(
-                    f'label[for="{element_id}"]')
-                if label:
-                    return await label.inner_text()
-
-            # Try to find parent label
-            parent_label = await element.query_selector(
-                'xpath=ancestor::label[1]')
-            if parent_label:
-                return await parent_label.inner_text()
-
-            # Try to find nearby text
-            aria_label = await element.get_attribute('aria-label')
-            if aria_label:
-                return aria_label
-
-            return ""
-        except (PlaywrightError, AttributeError, TypeError) as e:
-            self.logger.debug(f"Label extraction failed: {e}")
-            return ""
+        return filled
+
+    async def _fill_field(self, field: Dict[str, Any], value: str) -> None:
+        """Fill a field found by _describe_form_fields"""
+        await self.page.fill(self._field_selector(field), value)
 
     async def _click_next_button(self) -> bool:
         """Click Next/Continue button"""
-        next_selectors = [
-            'button:has-text("Next")',
-            'button:has-text("Continue")',
-            'button:has-text("Review")',
-            '[data-test-id*="next"]',
-            '.artdeco-button--primary:has-text("Next")'
-        ]
-
-        for selector in next_selectors:
-            try:
-                if await self.page.is_visible(selector):
-                    await self.page.click(selector)
-                    return True
-            except PlaywrightError as e:
-                self.logger.debug(f"Next button click failed: {e}")
-                continue
-
-        return False
+        return await self._click_first_visible(_NEXT_BUTTONS)
 
     async def _click_submit_button(self) -> bool:
         """Click Submit/Apply button"""
         # Check for CAPTCHA before submitting forms
         await self.handle_captcha_if_present()
 
-        submit_selectors = [
-            'button:has-text("Submit application")',
-            'button:has-text("Submit")',
-            'button:has-text("Apply")',
-            'button:has-text("Send application")',
-            '[data-test-id*="submit"]',
-            '.artdeco-button--primary:has-text("Submit")'
-        ]
-
-        for selector in submit_selectors:
-            try:
-                if await self.page.is_visible(selector):
-                    await self.page.click(selector)
-                    return True
-            except PlaywrightError as e:
-                self.logger.debug(f"Submit button click failed: {e}")
-                continue
+        return await self._click_first_visible(_SUBMIT_BUTTONS)
 
-        return False
+    async def _click_first_visible(
+            self, candidates: List[List[Optional[str]]]) -> bool:
+        """
+        Click the first visible (selector, text) candidate, in priority order,
+        located in a single browser-side pass
+        """
+        try:
+            handle = await self.page.evaluate_handle(
+                FIRST_VISIBLE_JS, candidates)
+            element = handle.as_element()
+            if not element:
+                return False
+            await element.click()
+            return True
+        except PlaywrightError as e:
+            self.logger.debug(f"Button click failed: {e}")
+            return False
 
     async def get_job_details(self, job_url: str) -> Optional[JobPosting]:
         """Get detailed job information from job page"""
+        job_id = self._extract_job_id_from_url(job_url)
+        cached = self._details_cache.get(job_id)
+        if cached is not None:
+            self._details_cache.move_to_end(job_id)
+            return cached
+
+        if self._use_guest_job_details:
+            job = await self._job_details_via_guest_api(job_url, job_id)
+            if job:
+                self._cache_job_details(job)
+                return job
+
         try:
-            await self.page.goto(job_url)
-            await self.page.wait_for_load_state('networkidle')
-
-            # Extract detailed information
-            title_element = await self.page.query_selector(
-                ('.job-details-jobs-unified-top-card__job-title, '
-                 '.jobs-unified-top-card__job-title'))
-            title = (await title_element.inner_text()
-                     if title_element else "Unknown")
-
-            company_element = await self.page.query_selector(
-                ('.job-details-jobs-unified-top-card__company-name, '
-                 '.jobs-unified-top-card__company-name'))
-            company = (await company_element.inner_text()
-                       if company_element else "Unknown")
-
-            location_element = await self.page.query_selector(
-                ('.job-details-jobs-unified-top-card__bullet, '
-                 '.jobs-unified-top-card__bullet'))
-            location = (await location_element.inner_text()
-                        if location_element else "Unknown")
-
-            # Extract job description
-            description_element = await self.page.query_selector(
-                ('.jobs-description-content__text, '
-                 '.jobs-description__content'))
-            description = (await description_element.inner_text()
-                           if description_element else None)
-
-            job_id = self._extract_job_id_from_url(job_url)
-
-            return JobPosting(
+            await self.page.goto(job_url, wait_until='domcontentloaded')
+            try:
+                await self.page.wait_for_selector(
+                    _JOB_DETAIL_TITLE_SELECTOR, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Job title wait failed: {e}")
+
+            # Extract detailed information in one browser call
+            details = await self.page.evaluate(
+                _JOB_DETAILS_JS, [_JOB_DETAIL_TITLE_SELECTOR,
+                                  _JOB_DETAIL_COMPANY_SELECTOR,
+                                  _JOB_DETAIL_LOCATION_SELECTOR,
+                                  _JOB_DETAIL_DESCRIPTION_SELECTOR])
+            title = details['title'] or "Unknown"
+            company = details['company'] or "Unknown"
+            location = details['location'] or "Unknown"
+            description = details['description']
+
+            job = JobPosting(
                 job_id=job_id,
                 title=title.strip(),
                 company=company.strip(),
@@ -991,6 +1325,44 @@ class LinkedInAgent(JobAgent):
                 platform="LinkedIn"
             )
 
+            self._cache_job_details(job)
+            return job
+
         except Exception as e:
             self.logger.error(f"Error getting job details: {str(e)}")
             return None
+
+    async def _job_details_via_guest_api(
+            self, job_url: str, job_id: str) -> Optional[JobPosting]:
+        """Read a posting from the guest job posting HTML, with no page render"""
+        try:
+            response = await self.page.request.get(
+                _GUEST_JOB_POSTING_URL.format(job_id=quote(job_id)))
+            if not response.ok:
+                self.logger.debug(
+                    f"Guest job posting returned HTTP {response.status}")
+                return None
+            parser = _GuestJobParser(_GUEST_DETAIL_FIELDS, single_record=True)
+            parser.feed(await response.text())
+        except PlaywrightError as e:
+            self.logger.debug(f"Guest job posting fetch failed: {e}")
+            return None
+
+        details = parser.records[0]
+        if not details.get('title'):
+            return None
+        return JobPosting(
+            job_id=job_id,
+            title=details['title'],
+            company=details.get('company') or "Unknown",
+            location=details.get('location') or "Unknown",
+            url=job_url,
+            description=details.get('description'),
+            platform="LinkedIn"
+        )
+
+    def _cache_job_details(self, job: JobPosting) -> None:
+        """Remember a posting, evicting the least recently used when full"""
+        self._details_cache[job.job_id] = job
+        if len(self._details_cache) > self._details_cache_size:
+            self._details_cache.popitem(last=False)
@@ -1,10 +1,293 @@
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin
+import asyncio
+import random
+import re
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Pattern
+from urllib.parse import quote_plus, urljoin, urlsplit
 
 from playwright.async_api import Error as PlaywrightError
-from base_agent import JobAgent, JobPosting, SearchCriteria
+from base_agent import (FIRST_VISIBLE_JS, JobAgent, JobPosting,
+                        SearchCriteria)
 from utils.email_verifier import GreenHouseEmailVerifier
 
+# Bound on waiting for an in-page update (search results, the next form
+# step) to render after an action
+_CHANGE_TIMEOUT = 10000
+
+# Concurrent page loads allowed and the base backoff (seconds) after a 429,
+# per platforms.wellfound.rate_limit_mode
+_RATE_LIMIT_MODES = MappingProxyType({
+    'fast': (8, 0.5),
+    'normal': (4, 1.5),
+    'conservative': (2, 3.0),
+})
+_MAX_RATE_LIMIT_RETRIES = 3
+_MAX_BACKOFF_SECONDS = 30.0
+
+_JOB_ID_RE = re.compile(r'/jobs/(\d+)')
+
+_LOGIN_URLS = (
+    "https://wellfound.com/login",
+    "https://wellfound.com/sign_in",
+    "https://angel.co/login",  # Legacy URL
+)
+
+_EMAIL_SELECTORS = (
+    'input[name="user[email]"]',
+    'input[type="email"]',
+    'input[placeholder*="email"]',
+    'input[id*="email"]',
+    '#user_email',
+    '.email-input',
+)
+_VISIBLE_EMAIL_SELECTOR = f"{', '.join(_EMAIL_SELECTORS)} >> visible=true"
+
+_PASSWORD_SELECTORS = (
+    'input[name="user[password]"]',
+    'input[type="password"]',
+    'input[placeholder*="password"]',
+    'input[id*="password"]',
+    '#user_password',
+    '.password-input',
+)
+_VISIBLE_PASSWORD_SELECTOR = (
+    f"{', '.join(_PASSWORD_SELECTORS)} >> visible=true")
+
+_LOGIN_SUBMIT_SELECTORS = (
+    'input[type="submit"]',
+    'button:has-text("Sign in")',
+    'button:has-text("Login")',
+    'button:has-text("Log in")',
+    '.login-button',
+    '.signin-button',
+    'button[type="submit"]',
+)
+_VISIBLE_LOGIN_SUBMIT_SELECTOR = (
+    f"{', '.join(_LOGIN_SUBMIT_SELECTORS)} >> visible=true")
+
+_LOGIN_SUCCESS_URL_PATTERNS = (
+    'wellfound.com/jobs',
+    'wellfound.com/dashboard',
+    'wellfound.com/candidates',
+    'wellfound.com/startup',
+    'angel.co/jobs',
+    'angel.co/dashboard',
+)
+
+_LOGIN_SUCCESS_URL_RE = re.compile(
+    '|'.join(map(re.escape, _LOGIN_SUCCESS_URL_PATTERNS)))
+
+# Only shown to a logged-in user: the account menu/avatar, a logout link,
+# or a candidate-only page
+_LOGGED_IN_SELECTORS = (
+    '[data-test*="UserMenu"]',
+    '[data-test*="Avatar"]',
+    'img[alt*="avatar" i]',
+    'a[href*="/logout"]',
+    'a[href*="/candidates/"]',
+)
+_LOGGED_IN_SELECTOR = ", ".join(_LOGGED_IN_SELECTORS)
+_LOGGED_IN_URL_RE = re.compile(r'wellfound\.com/(?:candidates|dashboard)')
+
+_LOGIN_VERIFICATION_PATTERNS = ('verify', 'confirm', 'check', 'email')
+_LOGIN_VERIFICATION_RE = re.compile(
+    '|'.join(map(re.escape, _LOGIN_VERIFICATION_PATTERNS)))
+
+# Any of these means the login form was answered one way or another
+_POST_LOGIN_URL_RE = re.compile('|'.join(map(
+    re.escape, _LOGIN_SUCCESS_URL_PATTERNS + _LOGIN_VERIFICATION_PATTERNS)))
+
+_SEARCH_INPUT_SELECTORS = (
+    'input[placeholder*="Search"]',
+    'input[name="query"]',
+    'input.search-input',
+    '[data-test="JobSearchFilters-keywords"]',
+)
+_SEARCH_INPUT_SELECTOR = ", ".join(_SEARCH_INPUT_SELECTORS)
+
+_LOCATION_INPUT_SELECTORS = (
+    '[data-test="JobSearchFilters-location"]',
+    'input[placeholder*="Location"]',
+    'input[name="location"]',
+)
+
+_REMOTE_FILTER_SELECTORS = (
+    'label:has-text("Remote")',
+    'input[value*="remote"]',
+    '[data-test*="remote"]',
+)
+
+# Wellfound's option label for each experience level keyword
+_EXPERIENCE_LEVELS = MappingProxyType({
+    'entry': 'Entry level',
+    'mid': 'Mid level',
+    'senior': 'Senior level',
+    'lead': 'Lead',
+    'principal': 'Principal',
+})
+# [selector, text] candidates for each level, in priority order: the
+# option's label, then its input, then a looser data-test hook
+_EXPERIENCE_FILTER_CANDIDATES = MappingProxyType({
+    key: [['label', label],
+          [f'input[value*="{key}"]', None],
+          [f'[data-test*="{key}"]', None]]
+    for key, label in _EXPERIENCE_LEVELS.items()
+})
+
+_JOB_CARD_SELECTORS = (
+    '.job-card',
+    '.startup-job-listing',
+    '[data-test*="job-listing"]',
+    '.job-listing',
+)
+
+_JOB_CARD_SELECTOR = ", ".join(_JOB_CARD_SELECTORS)
+
+# Only the first page of cards is read; a few CDP calls run at once
+_MAX_JOB_CARDS = 20
+_CARD_EXTRACTION_CONCURRENCY = 8
+
+_TITLE_SELECTORS = (
+    'a.job-title',
+    '.job-title a',
+    '[data-test*="job-title"] a',
+    'h3 a',
+    'h4 a',
+)
+
+_COMPANY_SELECTORS = (
+    '.startup-name',
+    '.company-name',
+    '[data-test*="company"] a',
+    '.startup-link',
+)
+
+_LOCATION_SELECTORS = (
+    '.location',
+    '[data-test*="location"]',
+    '.job-location',
+)
+
+# Runs on a job card: each field comes from the first of its selectors that
+# matches, in priority order. Cards without a title link yield null.
+_CARD_FIELDS_JS = """
+(card, [titleSelectors, companySelectors, locationSelectors]) => {
+    const first = (selectors) => {
+        for (const selector of selectors) {
+            const el = card.querySelector(selector);
+            if (el) {
+                return el;
+            }
+        }
+        return null;
+    };
+    const text = (el) => (el ? el.innerText : null);
+    const link = first(titleSelectors);
+    if (!link) {
+        return null;
+    }
+    return {
+        title: link.innerText,
+        url: link.getAttribute('href'),
+        company: text(first(companySelectors)),
+        location: text(first(locationSelectors))
+    };
+}
+"""
+
+_APPLY_BUTTON_SELECTORS = (
+    'button:has-text("Apply")',
+    '.apply-button',
+    '[data-test*="apply"]',
+    'a:has-text("Apply to")',
+    'input[value*="Apply"]',
+)
+_APPLY_BUTTON_SELECTOR = ", ".join(_APPLY_BUTTON_SELECTORS)
+
+# Where application steps render: a modal or the application form,
+# falling back to the whole page (e.g. after a redirect)
+_APPLICATION_SELECTOR = '[role="dialog"], form'
+
+_NEXT_OR_SUBMIT_SELECTORS = (
+    'button:has-text("Submit")',
+    'button:has-text("Apply")',
+    'button:has-text("Continue")',
+    'button:has-text("Next")',
+    'input[type="submit"]',
+    '[data-test*="submit"]',
+    '[data-test*="apply"]',
+)
+
+_SUCCESS_INDICATORS = (
+    'application submitted',
+    'thank you for applying',
+    'application received',
+    'successfully submitted',
+    'application complete',
+    'we\'ll be in touch',
+    'application sent',
+)
+_SUCCESS_RE = re.compile(
+    '|'.join(map(re.escape, _SUCCESS_INDICATORS)), re.IGNORECASE)
+
+
+def _find_job_records(node: Any) -> List[Dict[str, Any]]:
+    """
+    Collect job-like objects (a title plus a url or id) from a search API
+    response, wherever the endpoint nests them
+    """
+    if isinstance(node, list):
+        return [record for item in node for record in _find_job_records(item)]
+    if not isinstance(node, dict):
+        return []
+    if isinstance(node.get('title'), str) and (node.get('url') or
+                                               node.get('id')):
+        return [node]
+    return [record for value in node.values()
+            for record in _find_job_records(value)]
+
+
+def _api_text(value: Any) -> Optional[str]:
+    """Flatten a name-like API value (string, {name: ...} or list of them)"""
+    if isinstance(value, dict):
+        value = value.get('name')
+    if isinstance(value, list):
+        value = ", ".join(filter(None, map(_api_text, value)))
+    return value if isinstance(value, str) and value else None
+
+
+# Tests the page's visible text against a regex source, case-insensitively,
+# so the page HTML never has to be sent back
+_PAGE_TEXT_SEARCH_JS = """
+(pattern) => new RegExp(pattern, 'i').test(
+    document.body ? document.body.innerText : '')
+"""
+
+# Text of every element matching a selector, or of the page when none
+# match; compared before and after an action to see it took effect
+_REGION_TEXT_JS = """
+(selector) => {
+    const els = document.querySelectorAll(selector);
+    if (!els.length) {
+        return document.body ? document.body.innerText : '';
+    }
+    return Array.from(els).map(el => el.innerText).join('\\n');
+}
+"""
+_REGION_CHANGED_JS = (
+    f"([selector, before]) => ({_REGION_TEXT_JS.strip()})(selector) !== before")
+
+_WELLFOUND_FIELD_SELECTOR = (
+    'input[type="text"], textarea, input:not([type]), input[type="checkbox"]')
+_EXTERNAL_FIELD_SELECTOR = 'input[type="text"], textarea'
+
+# Attributes read for each form field, by the key they are returned under
+_FORM_FIELD_ATTRIBUTES = MappingProxyType({
+    'type': 'type',
+    'name': 'name',
+    'placeholder': 'placeholder',
+})
+
 
 class WellfoundAgent(JobAgent):
     """
@@ -12,40 +295,97 @@ class WellfoundAgent(JobAgent):
     Specialized for startup job applications
     """
 
+    supports_concurrent_apply = True
+
     def __init__(self, config: Dict[str, Any],
                  proxy_config: Optional[Dict[str, str]] = None):
         super().__init__(config, proxy_config)
         self.platform_name = "Wellfound"
 
+        # Config subtrees used on every login/form step, resolved once
+        self._wellfound_creds = config.get(
+            'credentials', {}).get('wellfound', {})
+        self._personal_info = config.get(
+            'application', {}).get('personal_info', {})
+        self._form_fields = self._build_form_fields(
+            config.get('application', {}).get('default_answers', {}))
+        # One case-insensitive alternation over every question key
+        self._form_field_re, self._form_field_answers = (
+            self._compile_form_fields(self._form_fields))
+
+        # Page loads are bounded and back off when Wellfound rate limits us
+        wellfound_config = config.get('platforms', {}).get('wellfound', {})
+        mode = wellfound_config.get('rate_limit_mode', 'normal')
+        if mode not in _RATE_LIMIT_MODES:
+            self.logger.warning(
+                f"Unknown rate_limit_mode '{mode}', using 'normal'")
+            mode = 'normal'
+        self._max_navigations, self._backoff_base = _RATE_LIMIT_MODES[mode]
+        self._navigation_slots: Optional[asyncio.Semaphore] = None
+
+        # Opt-in: a JSON search endpoint (with {keywords}/{location}
+        # placeholders) read over the session's HTTP client before falling
+        # back to rendering and scraping the jobs page
+        self._search_api_url = wellfound_config.get('search_api_url')
+
+        self._jobs_url = wellfound_config.get(
+            'search_url', "https://wellfound.com/jobs")
+        # Set while the page shows the jobs page as loaded, before any
+        # search or filter was applied, so search_jobs can skip reloading it
+        self._jobs_page_pristine = False
+
         # Email verifier for Greenhouse applications
         email_config = config.get('credentials', {}).get(
             'verification_email', {})
-        if email_config.get('address'):
-            self.email_verifier = GreenHouseEmailVerifier(email_config)
+        self._verification_address = email_config.get('address', '')
+        if self._verification_address:
+            self.email_verifier = GreenHouseEmailVerifier.get(email_config)
         else:
             self.email_verifier = None
             self.logger.warning("No email verification configured")
 
+    def has_credentials(self) -> bool:
+        """Whether Wellfound email and password are configured"""
+        return bool(self._wellfound_creds.get('email') and
+                    self._wellfound_creds.get('password'))
+
+    @staticmethod
+    def _build_form_fields(app_settings: Dict[str, Any]) -> Dict[str, str]:
+        """Map common Wellfound questions to answers from default_answers"""
+        return {
+            'why interested': ('I am excited about this opportunity and believe '
+                               'my skills align well with your needs.'),
+            'years experience': app_settings.get(
+                'years_experience', '3-5 years'),
+            'salary expectation': app_settings.get(
+                'salary_expectation', 'Competitive'),
+            'available start': app_settings.get(
+                'availability', '2 weeks notice'),
+            'relocate': ('Yes' if app_settings.get(
+                'willing_to_relocate', False) else 'No'),
+            'visa sponsorship': ('Yes' if app_settings.get(
+                'require_sponsorship', False) else 'No')
+        }
+
     async def login(self) -> bool:
         """Login to Wellfound using credentials from config"""
         try:
-            credentials = self.config.get(
-                'credentials', {}).get('wellfound', {})
-            if not credentials.get('email') or not credentials.get('password'):
+            if not self.has_credentials():
                 self.logger.error("Wellfound credentials not found in config")
                 return False
+            credentials = self._wellfound_creds
+
+            # A saved session skips the whole login form
+            if self.session_restored and await self._has_active_session():
+                self.logger.info("Reusing saved Wellfound session")
+                return True
 
             self.logger.info("Navigating to Wellfound login page")
 
             # Try multiple login page URLs
-            login_urls = [
-                "https://wellfound.com/login",
-                "https://wellfound.com/sign_in",
-                "https://angel.co/login"  # Legacy URL
-            ]
-
+            self._jobs_page_pristine = False
             page_loaded = False
-            for url in login_urls:
+            for url in _LOGIN_URLS:
                 try:
                     await self.page.goto(url, timeout=30000)
                     await self.page.wait_for_load_state(
@@ -53,7 +393,7 @@ class WellfoundAgent(JobAgent):
                     page_loaded = True
                     self.logger.info(f"Successfully loaded login page: {url}")
                     break
-                except Exception as e:
+                except PlaywrightError as e:
                     self.logger.warning(f"Failed to load {url}: {str(e)}")
                     continue
 
@@ -61,99 +401,49 @@ class WellfoundAgent(JobAgent):
                 self.logger.error("Could not load any Wellfound login page")
                 return False
 
-            # Wait for login form to be available
-            await self.page.wait_for_timeout(3000)
-
-            # Try multiple selectors for email field
-            email_selectors = [
-                'input[name="user[email]"]',
-                'input[type="email"]',
-                'input[placeholder*="email"]',
-                'input[id*="email"]',
-                '#user_email',
-                '.email-input'
-            ]
-
-            email_filled = False
-            for selector in email_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.fill(selector, credentials['email'])
-                    email_filled = True
-                    self.logger.info(f"Filled email with selector: {selector}")
-                    break
-                except PlaywrightError as e:
-                    self.logger.debug(f"Email selector failed: {e}")
-                    continue
-
-            if not email_filled:
-                self.logger.error("Could not find email input field")
+            # Each field is found with one wait on its visible selector union
+            try:
+                email_input = self.page.locator(_VISIBLE_EMAIL_SELECTOR).first
+                await email_input.wait_for(timeout=5000)
+                await email_input.fill(credentials['email'])
+            except PlaywrightError as e:
+                self.logger.error(f"Could not find email input field: {e}")
                 return False
 
-            # Try multiple selectors for password field
-            password_selectors = [
-                'input[name="user[password]"]',
-                'input[type="password"]',
-                'input[placeholder*="password"]',
-                'input[id*="password"]',
-                '#user_password',
-                '.password-input'
-            ]
-
-            password_filled = False
-            for selector in password_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.fill(selector, credentials['password'])
-                    password_filled = True
-                    self.logger.info(
-                        f"Filled password with selector: {selector}")
-                    break
-                except PlaywrightError as e:
-                    self.logger.debug(f"Password selector failed: {e}")
-                    continue
-
-            if not password_filled:
-                self.logger.error("Could not find password input field")
+            try:
+                password_input = self.page.locator(
+                    _VISIBLE_PASSWORD_SELECTOR).first
+                await password_input.wait_for(timeout=5000)
+                await password_input.fill(credentials['password'])
+            except PlaywrightError as e:
+                self.logger.error(f"Could not find password input field: {e}")
                 return False
 
-            # Try multiple selectors for submit button
-            submit_selectors = [
-                'input[type="submit"]',
-                'button:has-text("Sign in")',
-                'button:has-text("Login")',
-                'button:has-text("Log in")',
-                '.login-button',
-                '.signin-button',
-                'button[type="submit"]'
-            ]
-
-            login_clicked = False
-            for selector in submit_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    if await self.page.is_visible(selector):
-                        await self.page.click(selector)
-                        login_clicked = True
-                        self.logger.info(
-                            f"Clicked login with selector: {selector}")
-                        break
-                except PlaywrightError as e:
-                    self.logger.debug(f"Login button selector failed: {e}")
-                    continue
+            try:
+                login_button = self.page.locator(
+                    _VISIBLE_LOGIN_SUBMIT_SELECTOR).first
+                await login_button.wait_for(timeout=5000)
+                await login_button.click()
+                login_clicked = True
+                self.logger.info("Clicked login button")
+            except PlaywrightError as e:
+                self.logger.debug(f"Login button not found: {e}")
+                login_clicked = False
 
             if not login_clicked:
                 # Try pressing Enter as fallback
                 try:
                     await self.page.keyboard.press('Enter')
-                    login_clicked = True
                     self.logger.info("Submitted login form with Enter key")
                 except PlaywrightError as e:
                     self.logger.error(f"Could not submit login form: {e}")
                     return False
 
             # Wait for login response
-            await self.page.wait_for_timeout(5000)
+            try:
+                await self.page.wait_for_url(_POST_LOGIN_URL_RE, timeout=15000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Post-login redirect wait failed: {e}")
 
             # Check if login was successful
             await self.page.wait_for_load_state(
@@ -161,30 +451,19 @@ class WellfoundAgent(JobAgent):
             current_url = self.page.url
 
             # Success indicators
-            success_patterns = [
-                'wellfound.com/jobs',
-                'wellfound.com/dashboard',
-                'wellfound.com/candidates',
-                'wellfound.com/startup',
-                'angel.co/jobs',
-                'angel.co/dashboard'
-            ]
-
-            for pattern in success_patterns:
-                if pattern in current_url:
-                    self.logger.info("Wellfound login successful")
-                    return True
+            if _LOGIN_SUCCESS_URL_RE.search(current_url):
+                self.logger.info("Wellfound login successful")
+                self._note_jobs_page()
+                await self.save_session()
+                return True
 
             # Check for verification requirements
-            verification_patterns = ['verify', 'confirm', 'check', 'email']
-            page_content = (await self.page.content()).lower()
-
-            for pattern in verification_patterns:
-                if pattern in current_url or pattern in page_content:
-                    self.logger.warning(
-                        "Wellfound login requires verification - "
-                        "proceeding anyway")
-                    return True
+            if (_LOGIN_VERIFICATION_RE.search(current_url) or
+                    await self._page_text_contains(_LOGIN_VERIFICATION_RE)):
+                self.logger.warning(
+                    "Wellfound login requires verification - "
+                    "proceeding anyway")
+                return True
 
             # Check if we're still on login page (failed login)
             if 'login' in current_url or 'sign' in current_url:
@@ -200,15 +479,77 @@ class WellfoundAgent(JobAgent):
             self.logger.error(f"Wellfound login error: {str(e)}")
             return False
 
+    async def _has_active_session(self) -> bool:
+        """
+        Check the restored cookies are still logged in: the jobs page loads
+        without a login redirect and shows something only members see
+        """
+        try:
+            await self._goto(self._jobs_url)
+            self._note_jobs_page()
+            if _LOGGED_IN_URL_RE.search(self.page.url):
+                return True
+            if not _LOGIN_SUCCESS_URL_RE.search(self.page.url):
+                return False
+            await self.page.locator(_LOGGED_IN_SELECTOR).first.wait_for(
+                timeout=5000)
+            return True
+        except PlaywrightError as e:
+            self.logger.debug(f"Saved session check failed: {e}")
+            return False
+
+    def _note_jobs_page(self) -> None:
+        """Record whether the page has just landed on the unfiltered jobs page"""
+        self._jobs_page_pristine = (
+            urlsplit(self.page.url).path.rstrip('/') ==
+            urlsplit(self._jobs_url).path.rstrip('/'))
+
+    def _navigation_gate(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent page loads, shared by worker copies"""
+        if self._navigation_slots is None:
+            self._navigation_slots = asyncio.Semaphore(self._max_navigations)
+        return self._navigation_slots
+
+    async def _goto(self, url: str):
+        """Load a page within the rate limit, backing off on HTTP 429"""
+        # Whatever was loaded, it is no longer the page login landed on;
+        # callers that load the jobs page re-check with _note_jobs_page
+        self._jobs_page_pristine = False
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            async with self._navigation_gate():
+                response = await self.page.goto(
+                    url, wait_until='domcontentloaded')
+            if (response is None or response.status != 429 or
+                    attempt == _MAX_RATE_LIMIT_RETRIES):
+                return response
+            delay = min(self._backoff_base * 2 ** attempt + random.random(),
+                        _MAX_BACKOFF_SECONDS)
+            self.logger.warning(
+                f"Rate limited by Wellfound, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
     async def search_jobs(self, criteria: SearchCriteria) -> List[JobPosting]:
         """Search for jobs on Wellfound based on criteria"""
         try:
-            jobs = []
+            if self._search_api_url:
+                jobs = await self._search_via_api(criteria)
+                if jobs:
+                    self.logger.info(
+                        f"Found {len(jobs)} jobs via the Wellfound search API")
+                    return jobs
 
-            # Navigate to Wellfound jobs page
-            self.logger.info("Navigating to Wellfound jobs page")
-            await self.page.goto("https://wellfound.com/jobs")
-            await self.page.wait_for_load_state('networkidle')
+            # Login usually leaves the page on the jobs page already
+            if self._jobs_page_pristine:
+                self.logger.info("Searching from the loaded Wellfound jobs page")
+            else:
+                self.logger.info("Navigating to Wellfound jobs page")
+                await self._goto(self._jobs_url)
+            self._jobs_page_pristine = False
+            try:
+                await self.page.wait_for_selector(
+                    _SEARCH_INPUT_SELECTOR, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Search input wait failed: {e}")
 
             # Handle job search
             await self._perform_job_search(criteria)
@@ -223,31 +564,78 @@ class WellfoundAgent(JobAgent):
             self.logger.error(f"Wellfound job search error: {str(e)}")
             return []
 
+    async def _search_via_api(self, criteria: SearchCriteria) -> List[JobPosting]:
+        """Fetch search results as JSON over the session's HTTP client,
+        with no page render"""
+        try:
+            # A URL with unexpected placeholders just falls back to the page
+            url = self._search_api_url.format(
+                keywords=quote_plus(" ".join(criteria.keywords)),
+                location=quote_plus(", ".join(criteria.locations)))
+            response = await self.page.request.get(url)
+            if not response.ok:
+                self.logger.debug(
+                    f"Wellfound search API returned HTTP {response.status}")
+                return []
+            data = await response.json()
+        except (PlaywrightError, ValueError, KeyError, IndexError) as e:
+            self.logger.debug(f"Wellfound search API failed: {e}")
+            return []
+
+        return self._jobs_from_api_data(data)
+
+    def _jobs_from_api_data(self, data: Any) -> List[JobPosting]:
+        """Build job postings from a search API response, skipping duplicates"""
+        jobs = []
+        seen = set()
+        for record in _find_job_records(data):
+            job_url = record.get('url') or f"/jobs/{record['id']}"
+            job_url = urljoin('https://wellfound.com', job_url)
+            job_id = (str(record['id']) if record.get('id')
+                      else self._extract_job_id_from_url(job_url))
+            if job_id in seen:
+                continue
+            seen.add(job_id)
+            jobs.append(JobPosting(
+                job_id=job_id,
+                title=record['title'].strip(),
+                company=(_api_text(record.get('company')) or
+                         _api_text(record.get('startup')) or
+                         "Unknown").strip(),
+                location=(_api_text(record.get('location')) or
+                          _api_text(record.get('locationNames')) or
+                          "Unknown").strip(),
+                url=job_url,
+                platform="Wellfound"
+            ))
+            if len(jobs) == _MAX_JOB_CARDS:
+                break
+        return jobs
+
     async def _perform_job_search(self, criteria: SearchCriteria):
         """Perform job search with keywords and filters"""
         try:
             # Search by role/keywords
             keywords_str = " ".join(criteria.keywords)
+            results = await self._region_text(_JOB_CARD_SELECTOR)
 
             # Find and fill search input
-            search_selectors = [
-                'input[placeholder*="Search"]',
-                'input[name="query"]',
-                'input.search-input',
-                '[data-test="JobSearchFilters-keywords"]'
-            ]
-
-            for selector in search_selectors:
+            for selector in _SEARCH_INPUT_SELECTORS:
                 try:
                     if await self.page.is_visible(selector):
                         await self.page.fill(selector, keywords_str)
                         await self.page.press(selector, 'Enter')
+                        await self._wait_for_change(_JOB_CARD_SELECTOR,
+                                                    results)
                         break
                 except PlaywrightError as e:
                     self.logger.debug(f"Search field selector failed: {e}")
                     continue
 
-            await self.page.wait_for_timeout(2000)
+            if not (criteria.locations or criteria.remote_options or
+                    criteria.experience_level):
+                return
+            results = await self._region_text(_JOB_CARD_SELECTOR)
 
             # Apply location filters
             if criteria.locations:
@@ -261,7 +649,8 @@ class WellfoundAgent(JobAgent):
             if criteria.experience_level:
                 await self._apply_experience_filter(criteria.experience_level)
 
-            await self.page.wait_for_timeout(3000)
+            # Results are reloaded over XHR; wait for the filtered cards
+            await self._wait_for_change(_JOB_CARD_SELECTOR, results)
 
         except Exception as e:
             self.logger.error(f"Error performing job search: {str(e)}")
@@ -270,13 +659,7 @@ class WellfoundAgent(JobAgent):
         """Apply location filters"""
         try:
             # Look for location filter
-            location_selectors = [
-                '[data-test="JobSearchFilters-location"]',
-                'input[placeholder*="Location"]',
-                'input[name="location"]'
-            ]
-
-            for selector in location_selectors:
+            for selector in _LOCATION_INPUT_SELECTORS:
                 try:
                     if await self.page.is_visible(selector):
                         location_str = ", ".join(locations)
@@ -295,13 +678,7 @@ class WellfoundAgent(JobAgent):
         try:
             # Look for remote work options
             if "remote" in remote_option.lower():
-                remote_selectors = [
-                    'label:has-text("Remote")',
-                    'input[value*="remote"]',
-                    '[data-test*="remote"]'
-                ]
-
-                for selector in remote_selectors:
+                for selector in _REMOTE_FILTER_SELECTORS:
                     try:
                         if await self.page.is_visible(selector):
                             await self.page.click(selector)
@@ -316,33 +693,18 @@ class WellfoundAgent(JobAgent):
     async def _apply_experience_filter(self, experience_level: str):
         """Apply experience level filter"""
         try:
-            # Map experience levels to Wellfound options
-            experience_map = {
-                "entry": "Entry level",
-                "mid": "Mid level",
-                "senior": "Senior level",
-                "lead": "Lead",
-                "principal": "Principal"
-            }
-
-            # Find matching experience option
-            for key, value in experience_map.items():
-                if key.lower() in experience_level.lower():
-                    experience_selectors = [
-                        f'label:has-text("{value}")',
-                        f'input[value*="{key}"]',
-                        f'[data-test*="{key}"]'
-                    ]
-
-                    for selector in experience_selectors:
-                        try:
-                            if await self.page.is_visible(selector):
-                                await self.page.click(selector)
-                                return
-                        except PlaywrightError as e:
-                            self.logger.debug(f"Experience filter selector failed: {e}")
-                            continue
-                    break
+            # First level keyword found in the requested level wins
+            level = experience_level.lower()
+            key = next((key for key in _EXPERIENCE_LEVELS if key in level),
+                       None)
+            if key is None:
+                return
+
+            handle = await self.page.evaluate_handle(
+                FIRST_VISIBLE_JS, _EXPERIENCE_FILTER_CANDIDATES[key])
+            option = handle.as_element()
+            if option:
+                await option.click()
 
         except Exception as e:
             self.logger.warning(f"Could not apply experience filter: {str(e)}")
@@ -358,28 +720,28 @@ class WellfoundAgent(JobAgent):
                 timeout=10000)
 
             # Get all job cards
-            job_selectors = [
-                '.job-card',
-                '.startup-job-listing',
-                '[data-test*="job-listing"]',
-                '.job-listing'
-            ]
-
             job_cards = []
-            for selector in job_selectors:
+            for selector in _JOB_CARD_SELECTORS:
                 cards = await self.page.query_selector_all(selector)
                 if cards:
                     job_cards = cards
                     break
 
-            for card in job_cards[:20]:  # Limit to first 20 jobs
-                try:
-                    job = await self._extract_single_job(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    self.logger.warning(f"Error extracting job: {str(e)}")
-                    continue
+            # Cards are independent, so read them concurrently
+            slots = asyncio.Semaphore(_CARD_EXTRACTION_CONCURRENCY)
+
+            async def extract(card):
+                async with slots:
+                    return await self._extract_single_job(card)
+
+            results = await asyncio.gather(
+                *[extract(card) for card in job_cards[:_MAX_JOB_CARDS]],
+                return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Error extracting job: {str(result)}")
+                elif result:
+                    jobs.append(result)
 
         except Exception as e:
             self.logger.error(f"Error extracting job listings: {str(e)}")
@@ -389,26 +751,14 @@ class WellfoundAgent(JobAgent):
     async def _extract_single_job(self, card) -> Optional[JobPosting]:
         """Extract information from a single job card"""
         try:
-            # Extract job title and URL
-            title_selectors = [
-                'a.job-title',
-                '.job-title a',
-                '[data-test*="job-title"] a',
-                'h3 a',
-                'h4 a'
-            ]
-
-            title_element = None
-            for selector in title_selectors:
-                title_element = await card.query_selector(selector)
-                if title_element:
-                    break
-
-            if not title_element:
+            # Read title, URL, company and location in one call
+            fields = await card.evaluate(
+                _CARD_FIELDS_JS,
+                [_TITLE_SELECTORS, _COMPANY_SELECTORS, _LOCATION_SELECTORS])
+            if not fields:
                 return None
 
-            title = await title_element.inner_text()
-            job_url = await title_element.get_attribute('href')
+            job_url = fields['url']
 
             # Make URL absolute
             if job_url and not job_url.startswith('http'):
@@ -417,40 +767,11 @@ class WellfoundAgent(JobAgent):
             # Extract job ID from URL
             job_id = self._extract_job_id_from_url(job_url)
 
-            # Extract company name
-            company_selectors = [
-                '.startup-name',
-                '.company-name',
-                '[data-test*="company"] a',
-                '.startup-link'
-            ]
-
-            company = "Unknown"
-            for selector in company_selectors:
-                company_element = await card.query_selector(selector)
-                if company_element:
-                    company = await company_element.inner_text()
-                    break
-
-            # Extract location
-            location_selectors = [
-                '.location',
-                '[data-test*="location"]',
-                '.job-location'
-            ]
-
-            location = "Unknown"
-            for selector in location_selectors:
-                location_element = await card.query_selector(selector)
-                if location_element:
-                    location = await location_element.inner_text()
-                    break
-
             return JobPosting(
                 job_id=job_id,
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
+                title=fields['title'].strip(),
+                company=(fields['company'] or "Unknown").strip(),
+                location=(fields['location'] or "Unknown").strip(),
                 url=job_url,
                 platform="Wellfound"
             )
@@ -461,40 +782,45 @@ class WellfoundAgent(JobAgent):
 
     def _extract_job_id_from_url(self, url: str) -> str:
         """Extract Wellfound job ID from URL"""
-        try:
-            # Wellfound job URLs typically look like:
-            # https://wellfound.com/company/startup-name/jobs/1234567-job-title
-            if '/jobs/' in url:
-                job_part = url.split('/jobs/')[1]
-                job_id = job_part.split('-')[0]
-                return job_id
-            else:
-                # Fallback: use the entire URL as ID
-                return url.split('/')[-1].split('?')[0]
-        except (IndexError, TypeError) as e:
-            self.logger.debug(f"Job ID extraction failed: {e}")
+        if not url:
             return url
+        # Wellfound job URLs typically look like:
+        # https://wellfound.com/company/startup-name/jobs/1234567-job-title
+        match = _JOB_ID_RE.search(url)
+        if match:
+            return match.group(1)
+        # Fallback: use the last path segment as ID
+        return url.rpartition('/')[2].partition('?')[0]
+
+    async def apply_to_job(self, job: JobPosting,
+                           ai_content: Optional[Dict[str, str]] = None) -> bool:
+        """Apply to a specific job on Wellfound on a page from the context pool"""
+        try:
+            # Create the gate before copying so every worker shares it
+            self._navigation_gate()
+            async with self._worker() as worker:
+                return await worker._apply_on_page(job)
+        except Exception as e:
+            self.logger.error(f"Error applying to {job.title}: {str(e)}")
+            return False
 
-    async def apply_to_job(self, job: JobPosting) -> bool:
-        """Apply to a specific job on Wellfound"""
+    async def _apply_on_page(self, job: JobPosting) -> bool:
+        """Run the Wellfound apply flow for a job on this agent's current page"""
         try:
             self.logger.info(f"Applying to {job.title} at {job.company}")
 
-            # Navigate to job page
-            await self.page.goto(job.url)
-            await self.page.wait_for_load_state('networkidle')
+            # Navigate to job page and wait for the apply button
+            await self._goto(job.url)
+            try:
+                await self.page.wait_for_selector(
+                    _APPLY_BUTTON_SELECTOR, timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Apply button wait failed: {e}")
 
             # Look for apply button
-            apply_selectors = [
-                'button:has-text("Apply")',
-                '.apply-button',
-                '[data-test*="apply"]',
-                'a:has-text("Apply to")',
-                'input[value*="Apply"]'
-            ]
-
+            step_text = await self._region_text(_APPLICATION_SELECTOR)
             clicked = False
-            for selector in apply_selectors:
+            for selector in _APPLY_BUTTON_SELECTORS:
                 try:
                     if await self.page.is_visible(selector):
                         await self.page.click(selector)
@@ -509,8 +835,8 @@ class WellfoundAgent(JobAgent):
                     f"Could not find apply button for {job.title}")
                 return False
 
-            # Wait for application form/process
-            await self.page.wait_for_timeout(3000)
+            # Wait for the application form to open
+            await self._wait_for_change(_APPLICATION_SELECTOR, step_text)
 
             # Handle application process
             success = await self._handle_application_flow(job)
@@ -548,7 +874,8 @@ class WellfoundAgent(JobAgent):
                             await self.email_verifier
                             .handle_greenhouse_verification(self.page))
                         if verification_success:
-                            await self.page.wait_for_timeout(3000)
+                            await self.page.wait_for_load_state(
+                                'domcontentloaded', timeout=10000)
                             continue
                         else:
                             self.logger.error(
@@ -561,6 +888,9 @@ class WellfoundAgent(JobAgent):
                 # Fill Wellfound application form
                 await self._fill_wellfound_application_form()
 
+                # Remember this step so we can tell when the next one renders
+                step_text = await self._region_text(_APPLICATION_SELECTOR)
+
                 # Try to proceed to next step
                 next_clicked = await self._click_next_or_submit_button()
                 if not next_clicked:
@@ -573,7 +903,7 @@ class WellfoundAgent(JobAgent):
                         return False
 
                 current_step += 1
-                await self.page.wait_for_timeout(2000)
+                await self._wait_for_change(_APPLICATION_SELECTOR, step_text)
 
             return False
 
@@ -584,53 +914,29 @@ class WellfoundAgent(JobAgent):
     async def _fill_wellfound_application_form(self):
         """Fill Wellfound-specific application form fields"""
         try:
-            app_settings = self.config.get(
-                'application', {}).get('default_answers', {})
-
-            # Common Wellfound form fields
-            form_fields = {
-                'why interested': ('I am excited about this opportunity and believe '
-                                   'my skills align well with your needs.'),
-                'years experience': app_settings.get(
-                    'years_experience', '3-5 years'),
-                'salary expectation': app_settings.get(
-                    'salary_expectation', 'Competitive'),
-                'available start': app_settings.get(
-                    'availability', '2 weeks notice'),
-                'relocate': ('Yes' if app_settings.get(
-                    'willing_to_relocate', False) else 'No'),
-                'visa sponsorship': ('Yes' if app_settings.get(
-                    'require_sponsorship', False) else 'No')
-            }
+            fields = await self._describe_form_fields(
+                _WELLFOUND_FIELD_SELECTOR, _FORM_FIELD_ATTRIBUTES)
 
             # Fill text areas and inputs
-            inputs = await self.page.query_selector_all(
-                'input[type="text"], textarea, input:not([type])')
-            for input_element in inputs:
-                placeholder = (
-                    await input_element.get_attribute('placeholder') or '')
-                name = await input_element.get_attribute('name') or ''
-                label_text = await self._get_input_label(input_element)
-
-                field_context = f"{placeholder} {name} {label_text}".lower()
-
-                for field_key, field_value in form_fields.items():
-                    if field_key.lower() in field_context:
-                        await input_element.fill(str(field_value))
-                        break
+            for field in fields:
+                if field['type'] == 'checkbox':
+                    continue
+                field_value = self._match_form_answer(
+                    f"{field['placeholder']} {field['name']} {field['label']}")
+                if field_value is not None:
+                    await self.page.fill(
+                        self._field_selector(field), field_value)
 
             # Handle checkboxes
-            checkboxes = await self.page.query_selector_all(
-                'input[type="checkbox"]')
-            for checkbox in checkboxes:
-                label_text = await self._get_input_label(checkbox)
+            for field in fields:
+                if field['type'] != 'checkbox':
+                    continue
+                label_text = field['label'].lower()
 
                 # Handle common checkboxes
-                if ('terms' in label_text.lower() or
-                        'agree' in label_text.lower()):
-                    await checkbox.check()
-                elif ('newsletter' in label_text.lower() or
-                      'updates' in label_text.lower()):
+                if 'terms' in label_text or 'agree' in label_text:
+                    await self.page.check(self._field_selector(field))
+                elif 'newsletter' in label_text or 'updates' in label_text:
                     # Optional: uncheck newsletter subscriptions
                     pass
 
@@ -641,84 +947,44 @@ class WellfoundAgent(JobAgent):
         """Fill external application forms (Greenhouse, Lever, etc.)"""
         try:
             # Basic form filling for external systems
-            inputs = await self.page.query_selector_all(
-                'input[type="text"], textarea')
-            for input_element in inputs:
-                placeholder = (
-                    await input_element.get_attribute('placeholder') or '')
-                name = await input_element.get_attribute('name') or ''
+            fields = await self._describe_form_fields(
+                _EXTERNAL_FIELD_SELECTOR, _FORM_FIELD_ATTRIBUTES)
+            for field in fields:
+                selector = self._field_selector(field)
 
                 # Try to match common fields
-                field_context = f"{placeholder} {name}".lower()
+                field_context = (
+                    f"{field['placeholder']} {field['name']}".lower())
 
                 if 'first name' in field_context:
-                    first_name = self.config.get('application', {}).get(
-                        'personal_info', {}).get('first_name', '')
+                    first_name = self._personal_info.get('first_name', '')
                     if first_name:
-                        await input_element.fill(first_name)
+                        await self.page.fill(selector, first_name)
                 elif 'last name' in field_context:
-                    last_name = self.config.get('application', {}).get(
-                        'personal_info', {}).get('last_name', '')
+                    last_name = self._personal_info.get('last_name', '')
                     if last_name:
-                        await input_element.fill(last_name)
+                        await self.page.fill(selector, last_name)
                 elif 'email' in field_context:
-                    email = self.config.get('credentials', {}).get(
-                        'verification_email', {}).get('address', '')
+                    email = self._verification_address
                     if email:
-                        await input_element.fill(email)
+                        await self.page.fill(selector, email)
                 elif 'phone' in field_context:
-                    phone_number = self.config.get('application', {}).get(
-                        'personal_info', {}).get('phone_number', '')
+                    phone_number = self._personal_info.get('phone_number', '')
                     if phone_number:
-                        await input_element.fill(phone_number)
+                        await self.page.fill(selector, phone_number)
                 elif 'cover letter' in field_context or 'why' in field_context:
-                    await input_element.fill(
+                    await self.page.fill(
+                        selector,
                         "I am excited about this opportunity and would love "
                         "to contribute to your team.")
 
         except Exception as e:
             self.logger.warning(f"Error filling external form: {str(e)}")
 
-    async def _get_input_label(self, element) -> str:
-        """Get the label text associated with an input element"""
-        try:
-            # Try to find associated label
-            element_id = await element.get_attribute('id')
-            if element_id:
-                label = await self.page.query_selector(
-                    f'label[for="{element_id}"]')
-                if label:
-                    return await label.inner_text()
-
-            # Try to find parent label
-            parent_label = await element.query_selector(
-                'xpath=ancestor::label[1]')
-            if parent_label:
-                return await parent_label.inner_text()
-
-            # Try aria-label
-            aria_label = await element.get_attribute('aria-label')
-            if aria_label:
-                return aria_label
-
-            return ""
-        except (PlaywrightError, AttributeError, TypeError) as e:
-            self.logger.debug(f"Label extraction failed: {e}")
-            return ""
-
     async def _click_next_or_submit_button(self) -> bool:
         """Click next, continue, or submit button"""
-        button_selectors = [
-            'button:has-text("Submit")',
-            'button:has-text("Apply")',
-            'button:has-text("Continue")',
-            'button:has-text("Next")',
-            'input[type="submit"]',
-            '[data-test*="submit"]',
-            '[data-test*="apply"]'
-        ]
-
-        for selector in button_selectors:
+
+        for selector in _NEXT_OR_SUBMIT_SELECTORS:
             try:
                 if await self.page.is_visible(selector):
                     await self.page.click(selector)
@@ -729,29 +995,46 @@ class WellfoundAgent(JobAgent):
 
         return False
 
+    async def _region_text(self, selector: str) -> Optional[str]:
+        """Read the text of a page region, to detect when it changes"""
+        try:
+            return await self.page.evaluate(_REGION_TEXT_JS, selector)
+        except PlaywrightError as e:
+            self.logger.debug(f"Could not read page region: {e}")
+            return None
+
+    async def _wait_for_change(self, selector: str,
+                               before: Optional[str]) -> None:
+        """Wait until a page region no longer shows the text read before"""
+        try:
+            await self.page.wait_for_function(
+                _REGION_CHANGED_JS, arg=[selector, before],
+                timeout=_CHANGE_TIMEOUT)
+        except PlaywrightError as e:
+            self.logger.debug(f"Page change wait failed: {e}")
+
     async def _is_application_complete(self) -> bool:
         """Check if application is complete"""
-        success_indicators = [
-            'application submitted',
-            'thank you for applying',
-            'application received',
-            'successfully submitted',
-            'application complete',
-            'we\'ll be in touch',
-            'application sent'
-        ]
-
-        content = await self.page.content()
-        content_lower = content.lower()
-
-        return any(indicator in content_lower
-                   for indicator in success_indicators)
+        return await self._page_text_contains(_SUCCESS_RE)
+
+    async def _page_text_contains(self, pattern: Pattern) -> bool:
+        """Search the page's visible text in the browser"""
+        try:
+            return await self.page.evaluate(
+                _PAGE_TEXT_SEARCH_JS, pattern.pattern)
+        except PlaywrightError as e:
+            self.logger.debug(f"Page text check failed: {e}")
+            return False
 
     async def get_job_details(self, job_url: str) -> Optional[JobPosting]:
         """Get detailed job information from job page"""
         try:
-            await self.page.goto(job_url)
-            await self.page.wait_for_load_state('networkidle')
+            await self._goto(job_url)
+            try:
+                await self.page.wait_for_selector('h1, .job-title',
+                                                  timeout=10000)
+            except PlaywrightError as e:
+                self.logger.debug(f"Job title wait failed: {e}")
 
             # Extract detailed information
             title_element = await self.page.query_selector('h1, .job-title')
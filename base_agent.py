@@ -1,13 +1,82 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import (AsyncIterator, Callable, Dict, List, Mapping, Optional,
+                    Pattern, Tuple, Any)
 from dataclasses import dataclass
+from contextlib import asynccontextmanager
 import asyncio
+import copy
+import os
+import random
+import re
+import sys
+import time
 from playwright.async_api import Browser, Page, BrowserContext
+from playwright.async_api import Error as PlaywrightError
 import logging
+from utils.email_verifier import GreenHouseEmailVerifier
 from utils.stealth_browser import StealthBrowserManager
 
+_CHALLENGE_URL_RE = re.compile(r'checkpoint|challenge|captcha', re.IGNORECASE)
+_CAPTCHA_HINT_SELECTOR = (
+    'iframe[src*="captcha"], [data-sitekey], .g-recaptcha, .h-captcha, '
+    'div[class*="captcha"]')
+
+# Form fields are tagged with their index so they can be filled by selector
+_FIELD_INDEX_ATTR = 'data-jobapp-idx'
+
+# Reads the label and the requested attributes ({key: attribute name}) of
+# every field matching a selector in one call. Labels come from the
+# element's own labels (label[for] or an enclosing <label>), falling back
+# to aria-label. Tags left by an earlier scan are cleared first so an index
+# never matches two elements.
+_DESCRIBE_FIELDS_JS = """
+([selector, indexAttr, attributes]) => {
+    document.querySelectorAll(`[${indexAttr}]`)
+        .forEach(el => el.removeAttribute(indexAttr));
+    return Array.from(document.querySelectorAll(selector)).map((el, index) => {
+        el.setAttribute(indexAttr, index);
+        const labelEl = (el.labels && el.labels[0]) || el.closest('label');
+        const field = {
+            index: index,
+            tag: el.tagName.toLowerCase(),
+            label: (labelEl ? labelEl.innerText
+                            : el.getAttribute('aria-label')) || ''
+        };
+        for (const [key, attribute] of Object.entries(attributes)) {
+            field[key] = el.getAttribute(attribute) || '';
+        }
+        return field;
+    });
+}
+"""
+
+# Returns the first visible element for a priority-ordered list of
+# [selector, text] pairs; text is matched like Playwright's :has-text()
+# (case-insensitive substring). Candidates are checked in order rather than
+# as one CSS union, so a loose match earlier in the DOM cannot win over a
+# higher-priority candidate. Shared by the agents' button and option lookups.
+FIRST_VISIBLE_JS = """
+(candidates) => {
+    const visible = (el) =>
+        !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    for (const [selector, text] of candidates) {
+        const needle = text ? text.toLowerCase() : null;
+        for (const el of document.querySelectorAll(selector)) {
+            const label = (el.innerText || '').replace(/\\s+/g, ' ').toLowerCase();
+            if ((!needle || label.includes(needle)) && visible(el)) {
+                return el;
+            }
+        }
+    }
+    return null;
+}
+"""
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class JobPosting:
     """Data class for job posting information"""
     job_id: str
@@ -21,7 +90,7 @@ class JobPosting:
     platform: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SearchCriteria:
     """Data class for job search parameters"""
     keywords: List[str]
@@ -33,12 +102,19 @@ class SearchCriteria:
     easy_apply_only: bool = True
 
 
+# Called with each job applied to and its summary['applied_jobs'] entry
+AppliedCallback = Callable[[JobPosting, Dict[str, Any]], None]
+
+
 class JobAgent(ABC):
     """
     Abstract base class for job application agents.
     Defines the standard interface that all job board agents must implement.
     """
 
+    # Agents whose apply_to_job runs on its own pooled page can apply in parallel
+    supports_concurrent_apply = False
+
     def __init__(self, config: Dict[str, Any], proxy_config: Optional[Dict[str, str]] = None):
         self.config = config
         self.proxy_config = proxy_config
@@ -47,6 +123,31 @@ class JobAgent(ABC):
         self.page: Optional[Page] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # Pool of extra browser contexts used to apply to jobs in parallel.
+        # Created lazily (after login) so pooled contexts inherit the session.
+        self._context_pool_size = max(
+            1, config.get('browser', {}).get('context_pool_size', 4))
+        self._context_pool: Optional[asyncio.Queue] = None
+        self._context_slots: Optional[asyncio.Semaphore] = None
+        self._pooled_contexts: List[BrowserContext] = []
+        self._is_worker = False
+
+        # Set when the browser context was created from a saved login session
+        self.session_restored = False
+
+        # Optional hook run_automation applies to each batch of search results
+        # (e.g. dropping jobs already applied to) before queueing them
+        self.job_filter: Optional[Callable[[List[JobPosting]],
+                                           List[JobPosting]]] = None
+
+        # Form question keys as one regex plus answers by lowercased key;
+        # agents that fill forms set these with _compile_form_fields
+        self._form_field_re: Optional[Pattern] = None
+        self._form_field_answers: Dict[str, str] = {}
+
+        # Shared (per-mailbox) Greenhouse verifier, for agents that use one
+        self.email_verifier: Optional[GreenHouseEmailVerifier] = None
+
     async def initialize_browser(self, headless: bool = None) -> None:
         """Initialize browser with enhanced anti-detection settings"""
         from playwright.async_api import async_playwright
@@ -101,14 +202,15 @@ class JobAgent(ABC):
 
         self.browser = await playwright.chromium.launch(**launch_options)
 
-        # Create human-like browser context with enhanced anti-detection
-        self.context = await self.stealth_manager.create_human_like_context(self.browser)
+        # Create human-like browser context with enhanced anti-detection,
+        # reusing cookies from a previous run's login when still fresh
+        session_state = self._saved_session_path()
+        self.context = await self.stealth_manager.create_human_like_context(
+            self.browser, storage_state=session_state)
+        self.session_restored = session_state is not None
 
         self.page = await self.context.new_page()
-
-        # Apply comprehensive stealth measures to the page
-        await self.stealth_manager.apply_stealth_to_page(self.page)
-        await self.stealth_manager.add_human_behavior_to_page(self.page)
+        await self._prepare_page(self.page)
 
         # Initialize CAPTCHA solver if enabled
         captcha_config = self.config.get('captcha_solver', {})
@@ -129,6 +231,48 @@ class JobAgent(ABC):
         else:
             self.captcha_solver = None
 
+    def _session_state_path(self) -> str:
+        """Path of this platform's saved login session (Playwright storage state)"""
+        session_dir = self.config.get('browser', {}).get(
+            'session_dir', './data/sessions')
+        platform = getattr(self, 'platform_name', self.__class__.__name__)
+        return os.path.join(session_dir, f"{platform.lower()}_state.json")
+
+    def _saved_session_path(self) -> Optional[str]:
+        """Return the saved session path if it exists and has not expired"""
+        path = self._session_state_path()
+        max_age_hours = self.config.get('browser', {}).get(
+            'session_max_age_hours', 24)
+        try:
+            if time.time() - os.path.getmtime(path) < max_age_hours * 3600:
+                return path
+        except OSError:
+            pass
+        return None
+
+    async def save_session(self) -> None:
+        """Persist the logged-in context's cookies so later runs can skip login"""
+        path = self._session_state_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            await self.context.storage_state(path=path)
+            self.logger.info(f"Saved login session to {path}")
+        except Exception as e:
+            self.logger.warning(f"Could not save login session: {e}")
+
+    async def _prepare_page(self, page: Page) -> None:
+        """Apply stealth measures and navigation defaults to a new page"""
+        # Bound every action and navigation once instead of per call; callers
+        # wait for their own target selectors with shorter timeouts
+        browser_config = self.config.get('browser', {})
+        page.set_default_timeout(browser_config.get('action_timeout', 15000))
+        page.set_default_navigation_timeout(
+            browser_config.get('navigation_timeout', 20000))
+
+        # Apply comprehensive stealth measures to the page
+        await self.stealth_manager.apply_stealth_to_page(page)
+        await self.stealth_manager.add_human_behavior_to_page(page)
+
     async def handle_captcha_if_present(self) -> bool:
         """
         Detect and solve CAPTCHAs on the current page if CAPTCHA solver is enabled
@@ -143,6 +287,10 @@ class JobAgent(ABC):
             return False
 
         try:
+            # Skip the per-widget waits on the (usual) challenge-free page
+            if not await self._captcha_hint_present():
+                return False
+
             self.logger.debug("Scanning page for CAPTCHA challenges...")
 
             # Check for reCAPTCHA v2 iframe
@@ -197,6 +345,12 @@ class JobAgent(ABC):
             self.logger.error(f"Error during CAPTCHA detection: {str(e)}")
             return False
 
+    async def _captcha_hint_present(self) -> bool:
+        """Cheap check for signs of a challenge: URL keywords or a CAPTCHA element"""
+        if _CHALLENGE_URL_RE.search(self.page.url):
+            return True
+        return await self.page.locator(_CAPTCHA_HINT_SELECTOR).count() > 0
+
     async def _solve_recaptcha_v2(self) -> bool:
         """
         Solve reCAPTCHA v2/v3 challenge
@@ -271,7 +425,6 @@ class JobAgent(ABC):
 
             # Method 3: Check page source for embedded key
             content = await self.page.content()
-            import re
             matches = re.findall(r'data-sitekey=["\']([^"\']+)["\']', content)
             if matches:
                 return matches[0]
@@ -352,14 +505,198 @@ class JobAgent(ABC):
             self.logger.error(f"Error injecting reCAPTCHA token: {str(e)}")
             raise
 
+    async def _new_pooled_context(self) -> BrowserContext:
+        """Create a context that shares the main context's logged-in session"""
+        storage_state = await self.context.storage_state() if self.context else None
+        return await self.stealth_manager.create_human_like_context(
+            self.browser, storage_state=storage_state)
+
+    @asynccontextmanager
+    async def _acquire_context(self):
+        """Borrow a browser context from the pool, creating one if needed"""
+        if self._context_pool is None:
+            self._context_pool = asyncio.Queue()
+            self._context_slots = asyncio.Semaphore(self._context_pool_size)
+
+        async with self._context_slots:
+            try:
+                context = self._context_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                context = await self._new_pooled_context()
+                self._pooled_contexts.append(context)
+            try:
+                yield context
+            finally:
+                self._context_pool.put_nowait(context)
+
+    @asynccontextmanager
+    async def _worker(self):
+        """
+        Yield a shallow copy of this agent bound to a new page in a pooled context.
+        The page is closed afterwards; the context stays in the pool for reuse.
+        """
+        if self._is_worker:
+            yield self
+            return
+
+        async with self._acquire_context() as context:
+            page = await context.new_page()
+            await self._prepare_page(page)
+
+            worker = copy.copy(self)
+            worker.context = context
+            worker.page = page
+            worker._is_worker = True
+            try:
+                yield worker
+            finally:
+                await page.close()
+
+    async def apply_to_jobs(
+            self,
+            applications: List[Tuple[JobPosting, Optional[Dict[str, str]]]],
+            summary: Dict[str, Any],
+            on_applied: Optional[AppliedCallback] = None) -> None:
+        """
+        Apply to (job, ai_content) pairs on the same queue workers
+        run_automation uses, counting results and errors into summary
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for application in applications:
+            queue.put_nowait(application)
+        workers = self._start_apply_workers(queue, summary, on_applied)
+        try:
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    def _start_apply_workers(
+            self, queue: asyncio.Queue, summary: Dict[str, Any],
+            on_applied: Optional[AppliedCallback] = None) -> List[asyncio.Future]:
+        """One queue worker per pooled context, or one if applies are serial"""
+        worker_count = (self._context_pool_size
+                        if self.supports_concurrent_apply else 1)
+        return [
+            asyncio.ensure_future(
+                self._apply_from_queue(queue, summary, on_applied))
+            for _ in range(worker_count)]
+
+    async def iter_job_batches(
+            self, criteria: SearchCriteria) -> AsyncIterator[List[JobPosting]]:
+        """Yield search results in batches as they become available"""
+        yield await self.search_jobs(criteria)
+
+    @staticmethod
+    def _compile_form_fields(
+            form_fields: Dict[str, Any]) -> Tuple[Optional[Pattern], Dict[str, str]]:
+        """Compile form question keys into one regex plus an answer lookup"""
+        answers = {key.lower(): str(value) for key, value in form_fields.items()}
+        if not answers:
+            return None, answers
+        # A lookahead matches at every position, so keys overlapping an
+        # earlier match (like "name" inside "first name") are still found
+        pattern = re.compile(
+            '(?=(%s))' % '|'.join(map(re.escape, answers)), re.IGNORECASE)
+        return pattern, answers
+
+    def _match_form_answer(self, *texts: str) -> Optional[str]:
+        """
+        Answer for the first question key, in config order, found in any of
+        the texts
+        """
+        if self._form_field_re is None:
+            return None
+        found = {match.group(1).lower()
+                 for text in texts
+                 for match in self._form_field_re.finditer(text)}
+        for key, answer in self._form_field_answers.items():
+            if key in found:
+                return answer
+        return None
+
+    async def _describe_form_fields(
+            self, selector: str,
+            attributes: Mapping[str, str]) -> List[Dict[str, Any]]:
+        """
+        Read the label, tag and the given attributes (as {key: attribute})
+        of every field matching selector in one call
+        """
+        try:
+            return await self.page.evaluate(
+                _DESCRIBE_FIELDS_JS,
+                [selector, _FIELD_INDEX_ATTR, dict(attributes)])
+        except PlaywrightError as e:
+            self.logger.debug(f"Form field discovery failed: {e}")
+            return []
+
+    def _field_selector(self, field: Dict[str, Any]) -> str:
+        """Selector for a field found by _describe_form_fields"""
+        return f'[{_FIELD_INDEX_ATTR}="{field["index"]}"]'
+
+    async def pause(self, base_ms: int, jitter_ms: int = 500) -> None:
+        """
+        Sleep for base_ms plus up to jitter_ms of random jitter, so parallel
+        workers and agents do not fire requests in lockstep
+        """
+        await asyncio.sleep((base_ms + random.random() * jitter_ms) / 1000)
+
+    async def _apply_from_queue(
+            self, queue: asyncio.Queue, summary: Dict[str, Any],
+            on_applied: Optional[AppliedCallback] = None) -> None:
+        """
+        Apply to queued (job, ai_content) pairs until a None sentinel
+        arrives; on_applied gets each applied job and its applied_jobs entry
+        """
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            job, ai_content = item
+            try:
+                success = await self.apply_to_job(job, ai_content)
+                if success:
+                    summary['applications_submitted'] += 1
+                    applied = {
+                        'title': job.title,
+                        'company': job.company,
+                        'url': job.url
+                    }
+                    summary['applied_jobs'].append(applied)
+                    if on_applied:
+                        on_applied(job, applied)
+                    self.logger.info(
+                        f"Applied to {job.title} at {job.company}")
+                await self.pause(2000)  # Rate limiting
+            except Exception as e:
+                self.logger.error(
+                    f"Error applying to {job.title}: {str(e)}")
+                summary['errors'] += 1
+
     async def cleanup(self) -> None:
-        """Clean up browser resources"""
+        """Clean up browser resources and the verifier's IMAP session"""
+        for context in self._pooled_contexts:
+            await context.close()
+        self._pooled_contexts = []
+        self._context_pool = None
         if self.page:
             await self.page.close()
         if self.context:
             await self.context.close()
         if self.browser:
             await self.browser.close()
+        # The verifier reconnects on next use, so closing a shared one here
+        # does not break other agents still running. close() waits for any
+        # poll holding the connection, so keep it off the event loop.
+        if self.email_verifier:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.email_verifier.close)
+
+    def has_credentials(self) -> bool:
+        """Whether the credentials needed to log in are configured"""
+        return True
 
     @abstractmethod
     async def login(self) -> bool:
@@ -418,6 +755,10 @@ class JobAgent(ABC):
         }
 
         try:
+            # Fail fast on misconfiguration, before paying for a browser launch
+            if not self.has_credentials():
+                raise Exception("Login failed: credentials not configured")
+
             await self.initialize_browser()
             self.logger.info(f"Starting {self.__class__.__name__} automation")
 
@@ -426,32 +767,27 @@ class JobAgent(ABC):
             if not login_success:
                 raise Exception("Login failed")
 
-            # Search for jobs
-            jobs = await self.search_jobs(criteria)
-            summary['jobs_found'] = len(jobs)
-            self.logger.info(f"Found {len(jobs)} jobs")
-
-            # Apply to jobs
-            applications = 0
-            for job in jobs[:max_applications]:
-                try:
-                    success = await self.apply_to_job(job, ai_content)
-                    if success:
-                        applications += 1
-                        summary['applied_jobs'].append({
-                            'title': job.title,
-                            'company': job.company,
-                            'url': job.url
-                        })
-                        self.logger.info(
-                            f"Applied to {job.title} at {job.company}")
-                    await asyncio.sleep(2)  # Rate limiting
-                except Exception as e:
-                    self.logger.error(
-                        f"Error applying to {job.title}: {str(e)}")
-                    summary['errors'] += 1
-
-            summary['applications_submitted'] = applications
+            # Search for jobs, applying to each batch while the rest of
+            # the search is still running
+            queue: asyncio.Queue = asyncio.Queue()
+            workers = self._start_apply_workers(queue, summary)
+            try:
+                queued = 0
+                async for jobs in self.iter_job_batches(criteria):
+                    if self.job_filter:
+                        jobs = self.job_filter(jobs)
+                    summary['jobs_found'] += len(jobs)
+                    for job in jobs[:max(max_applications - queued, 0)]:
+                        queue.put_nowait((job, ai_content))
+                        queued += 1
+                self.logger.info(f"Found {summary['jobs_found']} jobs")
+
+                for _ in workers:
+                    queue.put_nowait(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
 
         except Exception as e:
             self.logger.error(f"Automation error: {str(e)}")
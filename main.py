@@ -323,6 +323,10 @@ class JobApplicationOrchestrator:
         }
 
         try:
+            # Fail fast on misconfiguration, before paying for a browser launch
+            if not agent.has_credentials():
+                raise Exception("Login failed: credentials not configured")
+
             # Initialize agent browser
             await agent.initialize_browser()
 
@@ -359,7 +363,6 @@ class JobApplicationOrchestrator:
 
             # Process jobs with AI filtering and content generation
             qualified_jobs = []
-            applications_submitted = 0
 
             # Check more jobs than we plan to apply to
             for job in new_jobs[:max_applications * 3]:
@@ -406,54 +409,35 @@ class JobApplicationOrchestrator:
                     summary['errors'] += 1
                     continue
 
-            # Apply to qualified jobs with AI-generated content
-            for job_data in qualified_jobs:
-                try:
-                    job = job_data['job']
-                    ai_content = job_data['ai_content']
-
-                    self.logger.info(
-                        f"Applying to high-relevance job: {job.title} at {job.company}")
-
-                    # Apply to job with AI-generated content
-                    success = await agent.apply_to_job(job, ai_content)
-
-                    if success:
-                        applications_submitted += 1
-                        summary['applied_jobs'].append({
-                            'title': job.title,
-                            'company': job.company,
-                            'url': job.url,
-                            'relevance_score': job_data['relevance_score'],
-                            'ai_enhanced': True
-                        })
+            # Apply to qualified jobs with AI-generated content on the
+            # agent's apply workers, in parallel when it supports that
+            relevance_scores = {job_data['job'].job_id: job_data['relevance_score']
+                                for job_data in qualified_jobs}
 
-                        # Record in state manager
-                        self.state_manager.record_application(
-                            job_id=job.job_id,
-                            platform=platform_name,
-                            title=job.title,
-                            company=job.company,
-                            url=job.url,
-                            status='applied'
-                        )
+            def record_applied(job: JobPosting, applied: Dict[str, Any]) -> None:
+                applied['relevance_score'] = relevance_scores[job.job_id]
+                applied['ai_enhanced'] = True
 
-                        self.logger.info(
-                            f"Successfully applied to {job.title} with AI enhancements")
-
-                    # Rate limiting between applications
-                    await asyncio.sleep(2)
+                # Record in state manager
+                self.state_manager.record_application(
+                    job_id=job.job_id,
+                    platform=platform_name,
+                    title=job.title,
+                    company=job.company,
+                    url=job.url,
+                    status='applied'
+                )
 
-                except Exception as e:
-                    self.logger.error(
-                        f"Error applying to {job.title}: {str(e)}")
-                    summary['errors'] += 1
-                    continue
+                self.logger.info(
+                    f"Successfully applied to {job.title} with AI enhancements")
 
-            summary['applications_submitted'] = applications_submitted
+            await agent.apply_to_jobs(
+                [(job_data['job'], job_data['ai_content'])
+                 for job_data in qualified_jobs],
+                summary, record_applied)
 
             self.logger.info(
-                f"AI-enhanced automation completed: {applications_submitted} applications submitted")
+                f"AI-enhanced automation completed: {summary['applications_submitted']} applications submitted")
             return summary
 
         except Exception as e:
@@ -477,14 +461,8 @@ class JobApplicationOrchestrator:
                         f"Skipping already applied job: {job.title} at {job.company}")
             return new_jobs
 
-        # Run automation with custom filtering
-        original_search = agent.search_jobs
-
-        async def filtered_search(criteria):
-            jobs = await original_search(criteria)
-            return filter_new_jobs(jobs)
-
-        agent.search_jobs = filtered_search
+        # Run automation with custom filtering on each batch of results
+        agent.job_filter = filter_new_jobs
 
         # Track applications in state manager
         original_apply = agent.apply_to_job
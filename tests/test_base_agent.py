@@ -1,6 +1,16 @@
-from base_agent import JobAgent, JobPosting, SearchCriteria
+from base_agent import (JobAgent, JobPosting, SearchCriteria,
+                        _DESCRIBE_FIELDS_JS, _FIELD_INDEX_ATTR)
+from playwright.async_api import Error as PlaywrightError
+from types import MappingProxyType
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, List, Optional, Any
 
 import sys
@@ -162,6 +172,21 @@ class TestJobAgentBase:
         agent.context.close.assert_called_once()
         agent.browser.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_email_verifier(self):
+        """Test cleanup logs the shared verifier out of its IMAP session"""
+        agent = ConcreteJobAgent({})
+        agent.email_verifier = MagicMock()
+        threads = []
+        agent.email_verifier.close.side_effect = (
+            lambda: threads.append(threading.current_thread()))
+
+        await agent.cleanup()
+
+        agent.email_verifier.close.assert_called_once()
+        # A poll may hold the connection lock, so close off the event loop
+        assert threads[0] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_cleanup_partial_components(self):
         """Test cleanup when only some components are initialized"""
@@ -182,6 +207,266 @@ class TestJobAgentBase:
         await agent.cleanup()  # Should not raise exception
 
 
+class TestDescribeFormFields:
+    """Test the shared one-call form field scan"""
+
+    @pytest.mark.asyncio
+    async def test_requested_attributes_sent_to_page(self):
+        """Test the selector and attribute keys go to a single evaluate"""
+        agent = ConcreteJobAgent({})
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            {'index': 3, 'tag': 'input', 'label': 'Name', 'name': 'q1'}])
+
+        fields = await agent._describe_form_fields(
+            'input', MappingProxyType({'name': 'name'}))
+
+        assert agent._field_selector(fields[0]) == '[data-jobapp-idx="3"]'
+        selector, _, attributes = agent.page.evaluate.await_args.args[1]
+        assert selector == 'input'
+        assert attributes == {'name': 'name'}
+
+    @pytest.mark.asyncio
+    async def test_page_error_yields_no_fields(self):
+        """Test a failed scan is treated as a form without fields"""
+        agent = ConcreteJobAgent({})
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(side_effect=PlaywrightError("gone"))
+
+        assert await agent._describe_form_fields('input', {}) == []
+
+    @pytest.mark.skipif(shutil.which('node') is None,
+                        reason="node is needed to run the page script")
+    def test_rescan_clears_stale_indexes(self):
+        """Test a second scan with another selector leaves one tag per index"""
+        # Minimal DOM: elements match by tag name or by [attribute]
+        script = """
+        class El {
+            constructor(tag) { this.tagName = tag; this.attrs = new Map(); }
+            setAttribute(k, v) { this.attrs.set(k, String(v)); }
+            getAttribute(k) {
+                return this.attrs.has(k) ? this.attrs.get(k) : null;
+            }
+            removeAttribute(k) { this.attrs.delete(k); }
+            closest() { return null; }
+        }
+        const els = [new El('INPUT'), new El('TEXTAREA'), new El('INPUT')];
+        global.document = {querySelectorAll: sel => {
+            const attr = sel.match(/^\\[(.+)\\]$/);
+            const tags = sel.split(', ');
+            return els.filter(el => attr ? el.attrs.has(attr[1])
+                                         : tags.includes(el.tagName.toLowerCase()));
+        }};
+        const scan = (%s);
+        scan(['input, textarea', '%s', {}]);
+        scan(['input', '%s', {}]);
+        console.log(JSON.stringify(els.map(el => el.getAttribute('%s'))));
+        """ % ((_DESCRIBE_FIELDS_JS,) + (_FIELD_INDEX_ATTR,) * 3)
+
+        result = subprocess.run(['node', '-e', script], capture_output=True,
+                                text=True, check=True)
+
+        assert json.loads(result.stdout) == ['0', None, '1']
+
+
+class TestPause:
+    """Test jittered rate-limit pauses"""
+
+    @pytest.mark.asyncio
+    async def test_pause_adds_jitter(self):
+        """Test the pause is the base delay plus a random share of the jitter"""
+        agent = ConcreteJobAgent({})
+
+        with patch('base_agent.random.random', return_value=0.5), \
+                patch('asyncio.sleep', new_callable=AsyncMock) as sleep:
+            await agent.pause(2000, jitter_ms=400)
+
+        sleep.assert_awaited_once_with(2.2)
+
+
+def _pooled_context():
+    """A context mock whose pages have sync setters and async actions"""
+    context = AsyncMock()
+    page = MagicMock()
+    page.close = AsyncMock()
+    context.new_page = AsyncMock(return_value=page)
+    return context
+
+
+class TestContextPool:
+    """Test pooled browser context handling"""
+
+    @pytest.mark.asyncio
+    async def test_context_reused_across_acquisitions(self):
+        """Test a released context is handed out again instead of a new one"""
+        agent = ConcreteJobAgent({})
+        agent.stealth_manager = AsyncMock()
+        agent.stealth_manager.create_human_like_context = AsyncMock(
+            side_effect=lambda *args, **kwargs: AsyncMock())
+
+        async with agent._acquire_context() as first:
+            pass
+        async with agent._acquire_context() as second:
+            pass
+
+        assert first is second
+        agent.stealth_manager.create_human_like_context.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_worker_uses_own_page(self):
+        """Test worker copies get a fresh page that is closed afterwards"""
+        agent = ConcreteJobAgent({})
+        agent.page = AsyncMock()
+        agent.stealth_manager = AsyncMock()
+        pooled_context = _pooled_context()
+        agent.stealth_manager.create_human_like_context = AsyncMock(
+            return_value=pooled_context)
+
+        async with agent._worker() as worker:
+            assert worker is not agent
+            assert worker.context is pooled_context
+            assert worker.page is not agent.page
+
+        worker.page.close.assert_awaited_once()
+        worker.page.set_default_timeout.assert_called_once_with(15000)
+
+        await agent.cleanup()
+        pooled_context.close.assert_called_once()
+
+
+class TestApplyToJobs:
+    """Test applying to a list of jobs on the queue workers"""
+
+    @pytest.mark.asyncio
+    async def test_results_and_errors_counted(self):
+        """Test each job gets its own content and failures are counted"""
+        agent = ConcreteJobAgent({})
+        agent.pause = AsyncMock()
+        contents = []
+
+        async def apply_to_job(job, ai_content=None):
+            contents.append(ai_content)
+            if job.job_id == "2":
+                raise RuntimeError("page closed")
+            return job.job_id == "1"
+
+        agent.apply_to_job = apply_to_job
+        jobs = [JobPosting(str(i), f"Engineer {i}", "Acme", "Remote",
+                           f"url{i}") for i in range(3)]
+        summary = {'applications_submitted': 0, 'errors': 0,
+                   'applied_jobs': []}
+        on_applied = MagicMock()
+
+        await agent.apply_to_jobs(
+            [(job, {'cover_letter': job.job_id}) for job in jobs],
+            summary, on_applied)
+
+        assert sorted(c['cover_letter'] for c in contents) == ['0', '1', '2']
+        assert summary['applications_submitted'] == 1
+        assert summary['errors'] == 1
+        on_applied.assert_called_once_with(
+            jobs[1], {'title': 'Engineer 1', 'company': 'Acme',
+                      'url': 'url1'})
+
+    @pytest.mark.asyncio
+    async def test_parallel_agents_bounded_by_pool(self):
+        """Test concurrent agents run one worker per pooled context"""
+        agent = ConcreteJobAgent({'browser': {'context_pool_size': 2}})
+        agent.supports_concurrent_apply = True
+        agent.pause = AsyncMock()
+        in_flight = 0
+        peak = 0
+
+        async def apply_to_job(job, ai_content=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return True
+
+        agent.apply_to_job = apply_to_job
+        summary = {'applications_submitted': 0, 'errors': 0,
+                   'applied_jobs': []}
+
+        await agent.apply_to_jobs(
+            [(JobPosting(str(i), "Engineer", "Acme", "Remote", f"url{i}"),
+              None) for i in range(5)], summary)
+
+        assert summary['applications_submitted'] == 5
+        assert peak == 2
+
+
+class TestSessionPersistence:
+    """Test saved login session handling"""
+
+    def test_no_saved_session(self, tmp_path):
+        """Test a missing state file is not reused"""
+        agent = ConcreteJobAgent({'browser': {'session_dir': str(tmp_path)}})
+        assert agent._saved_session_path() is None
+
+    def test_fresh_session_reused(self, tmp_path):
+        """Test a recent state file is picked up for the platform"""
+        agent = ConcreteJobAgent({'browser': {'session_dir': str(tmp_path)}})
+        state_file = tmp_path / "concretejobagent_state.json"
+        state_file.write_text("{}")
+
+        assert agent._saved_session_path() == str(state_file)
+
+    def test_stale_session_ignored(self, tmp_path):
+        """Test state files older than the max age are ignored"""
+        agent = ConcreteJobAgent({'browser': {
+            'session_dir': str(tmp_path), 'session_max_age_hours': 1}})
+        state_file = tmp_path / "concretejobagent_state.json"
+        state_file.write_text("{}")
+        two_hours_ago = time.time() - 7200
+        os.utime(state_file, (two_hours_ago, two_hours_ago))
+
+        assert agent._saved_session_path() is None
+
+    @pytest.mark.asyncio
+    async def test_save_session(self, tmp_path):
+        """Test the context storage state is written under the session dir"""
+        session_dir = tmp_path / "sessions"
+        agent = ConcreteJobAgent({'browser': {'session_dir': str(session_dir)}})
+        agent.context = AsyncMock()
+
+        await agent.save_session()
+
+        assert session_dir.is_dir()
+        agent.context.storage_state.assert_called_once_with(
+            path=str(session_dir / "concretejobagent_state.json"))
+
+
+class TestCaptchaGate:
+    """Test the cheap CAPTCHA pre-check"""
+
+    @pytest.mark.asyncio
+    async def test_clean_page_skips_detection(self):
+        """Test no widget waits happen without URL or DOM hints"""
+        agent = ConcreteJobAgent({})
+        agent.captcha_solver = AsyncMock()
+        agent.page = AsyncMock()
+        agent.page.url = "https://www.linkedin.com/jobs/view/1/"
+        agent.page.locator = MagicMock()
+        agent.page.locator.return_value.count = AsyncMock(return_value=0)
+
+        assert await agent.handle_captcha_if_present() is False
+        agent.page.wait_for_selector.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_challenge_url_triggers_detection(self):
+        """Test checkpoint URLs go on to scan for CAPTCHA widgets"""
+        agent = ConcreteJobAgent({})
+        agent.captcha_solver = AsyncMock()
+        agent.page = AsyncMock()
+        agent.page.url = "https://www.linkedin.com/checkpoint/challenge/abc"
+        agent.page.wait_for_selector = AsyncMock(return_value=None)
+
+        assert await agent.handle_captcha_if_present() is False
+        assert agent.page.wait_for_selector.call_count == 3
+
+
 class TestJobAgentBrowserInitialization:
     """Test browser initialization functionality"""
 
@@ -376,6 +661,22 @@ class TestJobAgentWorkflow:
         # Verify cleanup was called
         agent.cleanup.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_run_automation_missing_credentials(self):
+        """Test automation stops before launching a browser without credentials"""
+        agent = ConcreteJobAgent({})
+        agent.has_credentials = lambda: False
+
+        agent.initialize_browser = AsyncMock()
+        agent.cleanup = AsyncMock()
+
+        criteria = SearchCriteria(["engineer"], ["remote"])
+        result = await agent.run_automation(criteria)
+
+        agent.initialize_browser.assert_not_called()
+        assert not agent.login_called
+        assert result['errors'] == 1
+
     @pytest.mark.asyncio
     async def test_run_automation_application_errors(self):
         """Test automation workflow with application errors"""
@@ -431,6 +732,41 @@ class TestJobAgentWorkflow:
         assert result['applications_submitted'] == 3
         assert len(result['applied_jobs']) == 3
 
+    @pytest.mark.asyncio
+    async def test_run_automation_applies_while_searching(self):
+        """Test early batches are applied to before the search finishes"""
+        agent = ConcreteJobAgent({})
+        agent.initialize_browser = AsyncMock()
+        agent.cleanup = AsyncMock()
+        events = []
+        yield_to_workers = asyncio.sleep
+
+        async def batches(criteria):
+            events.append('batch 1')
+            yield [JobPosting("1", "Engineer 1", "A", "Remote", "url1")]
+            await yield_to_workers(0)
+            await yield_to_workers(0)
+            events.append('batch 2')
+            yield [JobPosting("2", "Engineer 2", "B", "Remote", "url2"),
+                   JobPosting("3", "Engineer 3", "C", "Remote", "url3")]
+
+        async def apply(job, ai_content=None):
+            events.append(f'apply {job.job_id}')
+            return True
+
+        agent.iter_job_batches = batches
+        agent.apply_to_job = apply
+        agent.job_filter = lambda jobs: [j for j in jobs if j.job_id != "3"]
+
+        with patch('asyncio.sleep', new_callable=AsyncMock):
+            result = await agent.run_automation(
+                SearchCriteria(["engineer"], ["remote"]), max_applications=5)
+
+        assert events.index('apply 1') < events.index('batch 2')
+        assert 'apply 3' not in events
+        assert result['jobs_found'] == 2
+        assert result['applications_submitted'] == 2
+
     @pytest.mark.asyncio
     async def test_run_automation_no_jobs_found(self):
         """Test automation workflow when no jobs are found"""
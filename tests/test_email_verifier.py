@@ -1,9 +1,12 @@
 from utils.email_verifier import GreenHouseEmailVerifier
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import pytest
 import imaplib
+import threading
 import email
+import email.utils
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from email.message import EmailMessage
 from typing import Optional
 
@@ -441,3 +444,201 @@ class TestGreenHouseEmailVerifier:
         # Should eventually succeed after retries
         assert link == "https://boards.greenhouse.io/test/verify?token=retry123"
         assert call_count[0] >= 3  # Should have retried at least 3 times
+
+
+class TestSharedConnection:
+    """Test the IMAP connection is shared and reused"""
+
+    def setup_method(self):
+        """Start each test without cached verifiers"""
+        GreenHouseEmailVerifier.reset()
+
+    def test_get_returns_one_verifier_per_mailbox(self):
+        """Test agents configured with the same mailbox share a verifier"""
+        config = {'address': 'test@gmail.com', 'password': 'app_password'}
+
+        first = GreenHouseEmailVerifier.get(config)
+        second = GreenHouseEmailVerifier.get(dict(config))
+        other = GreenHouseEmailVerifier.get({'address': 'other@gmail.com'})
+
+        assert first is second
+        assert other is not first
+
+    def test_changed_password_gets_new_verifier(self):
+        """Test a new password is not served the old login's connection"""
+        first = GreenHouseEmailVerifier.get(
+            {'address': 'test@gmail.com', 'password': 'old'})
+        second = GreenHouseEmailVerifier.get(
+            {'address': 'test@gmail.com', 'password': 'new'})
+
+        assert second is not first
+        assert second.email_password == 'new'
+
+    @patch('utils.email_verifier.imaplib.IMAP4_SSL')
+    def test_reset_closes_shared_verifiers(self, mock_imap):
+        """Test reset logs shared verifiers out and forgets them"""
+        config = {'address': 'test@gmail.com', 'password': 'app_password'}
+        verifier = GreenHouseEmailVerifier.get(config)
+        verifier.connect_to_email()
+
+        GreenHouseEmailVerifier.reset()
+
+        mock_imap.return_value.logout.assert_called_once()
+        assert GreenHouseEmailVerifier.get(config) is not verifier
+
+    @patch('utils.email_verifier.imaplib.IMAP4_SSL')
+    def test_live_connection_reused(self, mock_imap):
+        """Test a second connect only sends NOOP on the open connection"""
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+
+        first = verifier.connect_to_email()
+        second = verifier.connect_to_email()
+
+        assert first is second
+        mock_imap.assert_called_once()
+        first.noop.assert_called_once()
+
+    @patch('utils.email_verifier.imaplib.IMAP4_SSL')
+    def test_dropped_connection_reopened(self, mock_imap):
+        """Test a connection failing NOOP is replaced with a new login"""
+        stale, fresh = Mock(), Mock()
+        stale.noop.side_effect = imaplib.IMAP4.abort("socket closed")
+        mock_imap.side_effect = [stale, fresh]
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+
+        verifier.connect_to_email()
+        assert verifier.connect_to_email() is fresh
+        fresh.login.assert_called_once()
+
+    @patch('utils.email_verifier.imaplib.IMAP4_SSL')
+    def test_poll_holds_connection_lock(self, mock_imap):
+        """Test a poll uses the shared connection under the verifier lock"""
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+        held = []
+        mock_imap.return_value.select.side_effect = (
+            lambda *args: held.append(verifier._lock._is_owned()))
+        mock_imap.return_value.search.return_value = ('OK', [b''])
+
+        clock = [0]
+
+        def sleep(seconds):
+            held.append(verifier._lock._is_owned())
+            clock[0] += 60
+
+        with patch('utils.email_verifier.time.sleep', side_effect=sleep), \
+                patch('utils.email_verifier.time.time',
+                      side_effect=lambda: clock[0]):
+            assert verifier.find_verification_email(timeout_minutes=1) is None
+
+        assert held == [True, False]
+
+
+def _greenhouse_email(link, sent_at):
+    """Raw Greenhouse verification email sent at a Unix timestamp"""
+    message = EmailMessage()
+    message['From'] = 'no-reply@greenhouse.io'
+    message['Subject'] = 'Verify your application'
+    message['Date'] = email.utils.formatdate(sent_at)
+    message.set_content(f"Confirm here: {link}")
+    return message.as_bytes()
+
+
+class TestVerificationLinkSelection:
+    """Test which inbox link a verification takes"""
+
+    @patch('utils.email_verifier.imaplib.IMAP4_SSL')
+    def test_parallel_verifications_get_distinct_links(self, mock_imap):
+        """Test old emails and links already handed out are skipped"""
+        now = time.time()
+        inbox = {
+            b'1': _greenhouse_email(
+                "https://boards.greenhouse.io/acme/verify?token=old",
+                now - 3600),
+            b'2': _greenhouse_email(
+                "https://boards.greenhouse.io/acme/verify?token=a", now),
+            b'3': _greenhouse_email(
+                "https://boards.greenhouse.io/acme/verify?token=b", now),
+        }
+        mail = mock_imap.return_value
+        mail.search.return_value = ('OK', [b' '.join(inbox)])
+        mail.fetch.side_effect = (
+            lambda msg_id, parts: ('OK', [(msg_id, inbox[msg_id])]))
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+
+        clock = [now]
+
+        def sleep(seconds):
+            clock[0] += 60
+
+        with patch('utils.email_verifier.time.sleep', side_effect=sleep), \
+                patch('utils.email_verifier.time.time',
+                      side_effect=lambda: clock[0]):
+            first = verifier.find_verification_email(timeout_minutes=1)
+            second = verifier.find_verification_email(timeout_minutes=1)
+            third = verifier.find_verification_email(timeout_minutes=1)
+
+        assert first == "https://boards.greenhouse.io/acme/verify?token=b"
+        assert second == "https://boards.greenhouse.io/acme/verify?token=a"
+        assert third is None
+
+
+class TestGreenhouseVerification:
+    """Test the page-side Greenhouse verification flow"""
+
+    @pytest.mark.asyncio
+    async def test_email_polled_off_the_event_loop(self):
+        """Test the blocking IMAP poll runs in a worker thread"""
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+        page = MagicMock()
+        page.url = "https://boards.greenhouse.io/acme/jobs/1"
+        page.get_by_text.return_value.first.wait_for = AsyncMock()
+        page.goto = AsyncMock()
+        threads = []
+
+        def find_verification_email(timeout_minutes):
+            threads.append(threading.current_thread())
+            return "https://boards.greenhouse.io/acme/verify?token=1"
+
+        verifier.find_verification_email = find_verification_email
+
+        assert await verifier.handle_greenhouse_verification(page) is True
+
+        assert threads and threads[0] is not threading.main_thread()
+        page.goto.assert_awaited_once_with(
+            "https://boards.greenhouse.io/acme/verify?token=1")
+
+    @pytest.mark.asyncio
+    async def test_prompt_found_by_text_locator(self):
+        """Test other pages are checked for the prompt without page.content"""
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+        verifier.find_verification_email = Mock(return_value=None)
+        page = MagicMock()
+        page.url = "https://jobs.acme.com/apply"
+        page.get_by_text.return_value.count = AsyncMock(return_value=0)
+
+        assert await verifier.handle_greenhouse_verification(page) is False
+
+        page.content.assert_not_called()
+        verifier.find_verification_email.assert_not_called()
+        pattern = page.get_by_text.call_args.args[0]
+        assert pattern.search("Please check your email to continue")
+
+    @pytest.mark.asyncio
+    async def test_waits_for_success_message(self):
+        """Test success is awaited on the page instead of a fixed sleep"""
+        verifier = GreenHouseEmailVerifier({'address': 'test@gmail.com'})
+        verifier.find_verification_email = Mock(
+            return_value="https://boards.greenhouse.io/acme/verify?token=1")
+        page = MagicMock()
+        page.url = "https://boards.greenhouse.io/acme/jobs/1"
+        page.goto = AsyncMock()
+        success = page.get_by_text.return_value.first
+        success.wait_for = AsyncMock(
+            side_effect=PlaywrightTimeoutError("Timeout 10000ms exceeded"))
+
+        assert await verifier.handle_greenhouse_verification(page) is False
+
+        success.wait_for.assert_awaited_once()
+        page.wait_for_timeout.assert_not_called()
+        pattern = page.get_by_text.call_args.args[0]
+        assert pattern.search("Application submitted")
@@ -1,6 +1,6 @@
 from utils.state_manager import StateManager
 from config.config_loader import ConfigLoader
-from base_agent import SearchCriteria, JobPosting
+from base_agent import JobAgent, SearchCriteria, JobPosting
 from main import JobApplicationOrchestrator, parse_arguments, main
 import pytest
 import asyncio
@@ -179,6 +179,60 @@ class TestJobApplicationOrchestrator:
         assert result['jobs_found'] == 5
         assert result['applications_submitted'] == 3
 
+    @pytest.mark.asyncio
+    async def test_ai_run_applies_concurrently(self, config_file):
+        """Test AI-qualified jobs are applied to in parallel when supported"""
+        orchestrator = JobApplicationOrchestrator(
+            str(config_file), dry_run=False)
+        orchestrator.ai_enhancer = AsyncMock()
+        orchestrator.ai_enhancer.score_job_relevance = AsyncMock(
+            return_value={'score': 9, 'reasoning': 'good fit'})
+        orchestrator._generate_ai_content = AsyncMock(return_value={})
+        orchestrator.state_manager = MagicMock()
+        orchestrator.state_manager.has_applied.return_value = False
+
+        in_flight = 0
+        peak = 0
+
+        class PooledAgent(JobAgent):
+            """Agent applying on pooled pages, with the browser stubbed out"""
+
+            supports_concurrent_apply = True
+
+            async def login(self):
+                return True
+
+            async def search_jobs(self, criteria):
+                return [JobPosting(str(i), f"Engineer {i}", "Acme", "Remote",
+                                   f"url{i}") for i in range(3)]
+
+            async def apply_to_job(self, job, ai_content=None):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return True
+
+            async def get_job_details(self, job_url):
+                return None
+
+        agent = PooledAgent({})
+        agent.initialize_browser = AsyncMock()
+        agent.cleanup = AsyncMock()
+        agent.pause = AsyncMock()
+
+        criteria = SearchCriteria(['engineer'], ['remote'])
+        result = await orchestrator._run_agent_with_ai(
+            agent, 'linkedin', criteria, 3)
+
+        assert result['applications_submitted'] == 3
+        assert len(result['applied_jobs']) == 3
+        assert orchestrator.state_manager.record_application.call_count == 3
+        assert all(applied['relevance_score'] == 9 and applied['ai_enhanced']
+                   for applied in result['applied_jobs'])
+        assert peak == 3
+
     @pytest.mark.asyncio
     async def test_run_agent_exception_handling(self, config_file):
         """Test agent exception handling"""
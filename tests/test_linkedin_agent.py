@@ -0,0 +1,639 @@
+from agents.linkedin_agent import LinkedInAgent
+from base_agent import JobPosting, SearchCriteria
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import sys
+sys.path.append('/home/daniel/JobApp')
+
+
+@pytest.fixture
+def agent(sample_config):
+    """LinkedIn agent without a browser attached"""
+    return LinkedInAgent(sample_config)
+
+
+class TestJobIdExtraction:
+    """Test LinkedIn job ID parsing"""
+
+    def test_job_view_url(self, agent):
+        """Test extracting the ID from a standard job view URL"""
+        url = "https://www.linkedin.com/jobs/view/1234567890/"
+        assert agent._extract_job_id_from_url(url) == "1234567890"
+
+    def test_job_view_url_with_query(self, agent):
+        """Test that tracking parameters are ignored"""
+        url = "https://www.linkedin.com/jobs/view/1234567890?refId=abc&trk=x"
+        assert agent._extract_job_id_from_url(url) == "1234567890"
+
+    def test_slugged_job_view_url(self, agent):
+        """Test the numeric ID is taken from a title-slugged job URL"""
+        url = ("https://www.linkedin.com/jobs/view/"
+               "senior-engineer-2-at-acme-1234567890/?trk=x")
+        assert agent._extract_job_id_from_url(url) == "1234567890"
+
+    def test_current_job_id_query(self, agent):
+        """Test search and collection URLs use the currentJobId parameter"""
+        assert agent._extract_job_id_from_url(
+            "https://www.linkedin.com/jobs/search/?currentJobId=123"
+        ) == "123"
+        assert agent._extract_job_id_from_url(
+            "https://www.linkedin.com/jobs/search/?currentJobId=456&keywords=x"
+        ) == "456"
+        assert agent._extract_job_id_from_url(
+            "https://www.linkedin.com/jobs/collections/987654?currentJobId=1"
+        ) == "1"
+
+    def test_fallback_to_last_segment(self, agent):
+        """Test non job-view URLs fall back to the last path segment"""
+        url = "https://www.linkedin.com/jobs/collections/987654?trk=x"
+        assert agent._extract_job_id_from_url(url) == "987654"
+
+    def test_slug_without_numeric_id(self, agent):
+        """Test a job view URL without a numeric ID keeps its slug"""
+        assert agent._extract_job_id_from_url(
+            "https://www.linkedin.com/jobs/view/abc/") == "abc"
+        assert agent._extract_job_id_from_url(
+            "https://www.linkedin.com/jobs/view/senior-engineer/?trk=x"
+        ) == "senior-engineer"
+
+    def test_never_empty(self, agent):
+        """Test a URL with no path segments falls back to the whole URL"""
+        url = "https://www.linkedin.com/"
+        assert agent._extract_job_id_from_url(url) == url
+
+    def test_job_view_without_slug(self, agent):
+        """Test a bare /jobs/view/ URL is not given the shared ID 'view'"""
+        for url in ("https://www.linkedin.com/jobs/view/",
+                    "https://www.linkedin.com/jobs/view",
+                    "https://www.linkedin.com/jobs/view/?trk=x"):
+            assert agent._extract_job_id_from_url(url) == url
+
+
+class TestLogin:
+    """Test the LinkedIn login flow without fixed sleeps"""
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_waits_for_redirect(self, agent):
+        """Test manual verification is awaited with wait_for_url"""
+        agent.page = AsyncMock()
+        agent.page.url = "https://www.linkedin.com/checkpoint/challenge/1"
+        agent.handle_captcha_if_present = AsyncMock(return_value=False)
+        agent.save_session = AsyncMock()
+
+        assert await agent.login() is True
+
+        agent.page.wait_for_timeout.assert_not_called()
+        assert agent.page.wait_for_url.await_count == 2
+        agent.save_session.assert_awaited_once()
+
+
+class TestJobFromCardData:
+    """Test building JobPosting objects from extracted card fields"""
+
+    def test_relative_url_made_absolute(self, agent):
+        """Test card data with a relative link"""
+        job = agent._job_from_card_data({
+            'title': ' Solutions Engineer \n',
+            'url': '/jobs/view/42/?trk=search',
+            'company': 'Acme ',
+            'location': None
+        })
+
+        assert job.job_id == "42"
+        assert job.title == "Solutions Engineer"
+        assert job.company == "Acme"
+        assert job.location == "Unknown"
+        assert job.url == "https://www.linkedin.com/jobs/view/42/?trk=search"
+        assert job.platform == "LinkedIn"
+
+    def test_missing_title_or_url(self, agent):
+        """Test cards without a link are skipped"""
+        assert agent._job_from_card_data({'title': 'Engineer'}) is None
+        assert agent._job_from_card_data({'url': '/jobs/view/1/'}) is None
+
+    def test_duplicate_job_ids_dropped(self, agent):
+        """Test the same posting found through several cards is kept once"""
+        jobs = agent._jobs_from_card_data([
+            {'title': 'Engineer', 'url': '/jobs/view/7/'},
+            {'title': 'Engineer', 'url': '/jobs/view/engineer-at-acme-7/'},
+            {'title': 'Analyst', 'url': '/jobs/view/8/'},
+            {'url': '/jobs/view/9/'},
+        ])
+
+        assert [job.job_id for job in jobs] == ["7", "8"]
+
+    def test_slug_only_cards_not_merged(self, agent):
+        """Test postings without numeric IDs are kept apart by their slug"""
+        jobs = agent._jobs_from_card_data([
+            {'title': 'Engineer', 'url': '/jobs/view/engineer/'},
+            {'title': 'Analyst', 'url': '/jobs/view/analyst/?trk=x'},
+        ])
+
+        assert [job.job_id for job in jobs] == ["engineer", "analyst"]
+
+
+class TestSearchUrl:
+    """Test LinkedIn search URL construction"""
+
+    def test_keywords_location_and_filters(self, agent):
+        """Test keywords, location and filters are all encoded in the URL"""
+        criteria = SearchCriteria(
+            keywords=["Solutions Engineer", "Sales Engineer"],
+            locations=["San Francisco Bay Area"],
+            experience_level="Entry level",
+            date_posted="Past week")
+
+        url = agent._build_search_url(criteria)
+
+        assert url.startswith("https://www.linkedin.com/jobs/search/?")
+        assert "keywords=Solutions%20Engineer%20OR%20Sales%20Engineer" in url
+        assert "location=San%20Francisco%20Bay%20Area" in url
+        assert "f_LF=f_AL" in url
+        assert "f_TPR=r604800" in url
+        assert "f_E=2" in url
+
+    def test_unknown_filters_omitted(self, agent):
+        """Test unmapped filter values and disabled Easy Apply are left out"""
+        criteria = SearchCriteria(
+            keywords=["engineer"], locations=[],
+            date_posted="Yesterday", easy_apply_only=False)
+
+        url = agent._build_search_url(criteria)
+
+        assert url == "https://www.linkedin.com/jobs/search/?keywords=engineer"
+
+    @pytest.mark.asyncio
+    async def test_no_filters_skips_reload(self, agent):
+        """Test the results page is not reloaded when no filter is set"""
+        agent.page = AsyncMock()
+        criteria = SearchCriteria(keywords=["engineer"], locations=[],
+                                  easy_apply_only=False)
+
+        await agent._apply_search_filters(criteria)
+
+        agent.page.goto.assert_not_called()
+        agent.page.wait_for_function.assert_not_called()
+
+
+class TestExtractJobListings:
+    """Test reading job cards from the search results page"""
+
+    @pytest.mark.asyncio
+    async def test_field_selectors_keep_priority_order(self, agent):
+        """Test each field's selectors are passed as an ordered list"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            {'title': 'Engineer', 'url': '/jobs/view/42/',
+             'company': 'Acme', 'location': 'Remote'}])
+
+        jobs = await agent._extract_job_listings()
+
+        assert [job.job_id for job in jobs] == ['42']
+        _, title, company, location, _ = (
+            agent.page.evaluate.await_args.args[1])
+        assert title[:2] == ['a[data-test-id*="job-title"]',
+                             '.job-search-card__title a']
+        assert company.index('h4') < company.index(
+            '.base-search-card__subtitle')
+        assert isinstance(location, list)
+
+
+GUEST_SEARCH_HTML = """
+<li>
+  <div class="base-card base-search-card job-search-card"
+       data-entity-urn="urn:li:jobPosting:3812345678">
+    <a class="base-card__full-link"
+       href="https://www.linkedin.com/jobs/view/sales-engineer-at-acme-3812345678?position=1&amp;pageNum=0"></a>
+    <h3 class="base-search-card__title">
+      Sales Engineer
+    </h3>
+    <h4 class="base-search-card__subtitle"><a href="/company/acme">Acme</a></h4>
+    <span class="job-search-card__location">Austin, TX</span>
+  </div>
+</li>
+<li>
+  <a class="base-card base-search-card base-search-card--link"
+     href="/jobs/view/42/" data-entity-urn="urn:li:jobPosting:42">
+    <h3 class="base-search-card__title">Solutions Engineer</h3>
+  </a>
+</li>
+"""
+
+
+class TestGuestSearch:
+    """Test the opt-in guest search that skips rendering the results page"""
+
+    @pytest.mark.asyncio
+    async def test_cards_parsed_from_guest_html(self, agent):
+        """Test postings are built from the server-rendered card HTML"""
+        response = MagicMock(ok=True)
+        response.text = AsyncMock(return_value=GUEST_SEARCH_HTML)
+        agent.page = MagicMock()
+        agent.page.request.get = AsyncMock(return_value=response)
+        criteria = SearchCriteria(keywords=["engineer"], locations=["Remote"])
+
+        jobs = await agent._search_via_guest_api(criteria)
+
+        url = agent.page.request.get.await_args.args[0]
+        assert url.startswith(
+            "https://www.linkedin.com/jobs-guest/jobs/api/"
+            "seeMoreJobPostings/search?keywords=engineer")
+        assert [job.job_id for job in jobs] == ["3812345678", "42"]
+        assert jobs[0].title == "Sales Engineer"
+        assert jobs[0].company == "Acme"
+        assert jobs[0].location == "Austin, TX"
+        assert jobs[1].url == "https://www.linkedin.com/jobs/view/42/"
+        assert jobs[1].company == "Unknown"
+
+    @pytest.mark.asyncio
+    async def test_guest_search_used_only_when_enabled(self, agent):
+        """Test the rendered search is skipped once guest search has results"""
+        agent._search_via_guest_api = AsyncMock(return_value=["job"])
+        agent.page = AsyncMock()
+        criteria = SearchCriteria(keywords=["engineer"], locations=[])
+
+        agent._use_guest_search = True
+        assert await agent._search_location(criteria) == ["job"]
+        agent.page.goto.assert_not_called()
+
+        agent._use_guest_search = False
+        agent._extract_job_listings = AsyncMock(return_value=["dom"])
+        assert await agent._search_location(criteria) == ["dom"]
+        agent._search_via_guest_api.assert_awaited_once()
+
+
+class TestSearchForm:
+    """Test the search form fallback"""
+
+    @pytest.mark.asyncio
+    async def test_fields_filled_through_visible_locators(self, agent):
+        """Test each field is filled through one visible-union locator"""
+        agent.page = MagicMock()
+        agent.page.goto = AsyncMock()
+        agent.page.keyboard.press = AsyncMock()
+        agent.page.wait_for_load_state = AsyncMock()
+        field = agent.page.locator.return_value.first
+        field.fill = AsyncMock()
+        field.count = AsyncMock(return_value=1)
+        agent._apply_search_filters = AsyncMock()
+        agent._extract_job_listings = AsyncMock(return_value=[])
+        criteria = SearchCriteria(keywords=["engineer"], locations=["Remote"])
+
+        await agent._search_via_form(criteria)
+
+        selectors = [call.args[0] for call in agent.page.locator.call_args_list]
+        assert all(selector.endswith(">> visible=true")
+                   for selector in selectors)
+        field.fill.assert_any_await("engineer", timeout=5000)
+        field.fill.assert_any_await("Remote", timeout=5000)
+        agent.page.keyboard.press.assert_awaited_once_with('Enter')
+
+
+class TestConcurrentSearch:
+    """Test multi-location searches fan out across pooled pages"""
+
+    @pytest.mark.asyncio
+    async def test_locations_searched_separately_and_merged(self, agent):
+        """Test each location gets its own search and duplicates are dropped"""
+        def posting(job_id):
+            return JobPosting(job_id=job_id, title="Engineer", company="Acme",
+                              location="", url=f"/jobs/view/{job_id}/",
+                              platform="LinkedIn")
+
+        agent._search_in_worker = AsyncMock(side_effect=[
+            [posting("1"), posting("2")], [posting("2"), posting("3")]])
+        criteria = SearchCriteria(keywords=["engineer"],
+                                  locations=["Remote", "Austin, TX"])
+
+        jobs = await agent.search_jobs(criteria)
+
+        assert [job.job_id for job in jobs] == ["1", "2", "3"]
+        searched = [call.args[0].locations
+                    for call in agent._search_in_worker.await_args_list]
+        assert searched == [["Remote"], ["Austin, TX"]]
+
+    @pytest.mark.asyncio
+    async def test_location_batches_streamed_without_duplicates(self, agent):
+        """Test each location's new results are yielded as a batch"""
+        def posting(job_id):
+            return JobPosting(job_id=job_id, title="Engineer", company="Acme",
+                              location="", url=f"/jobs/view/{job_id}/",
+                              platform="LinkedIn")
+
+        results = {"Remote": [posting("1"), posting("2")],
+                   "Austin, TX": [posting("2"), posting("3")]}
+
+        async def search(criteria):
+            return results[criteria.locations[0]]
+
+        agent._search_in_worker = search
+        criteria = SearchCriteria(keywords=["engineer"],
+                                  locations=["Remote", "Austin, TX"])
+
+        batches = [[job.job_id for job in batch]
+                   async for batch in agent.iter_job_batches(criteria)]
+
+        assert sorted(sum(batches, [])) == ["1", "2", "3"]
+        assert len(batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_single_location_uses_main_page(self, agent):
+        """Test a single location is searched without a worker page"""
+        agent._search_location = AsyncMock(return_value=[])
+        agent._search_in_worker = AsyncMock()
+        criteria = SearchCriteria(keywords=["engineer"], locations=["Remote"])
+
+        assert await agent.search_jobs(criteria) == []
+        agent._search_in_worker.assert_not_called()
+
+
+class TestPagePredicates:
+    """Test application state checks on batched page-text matches"""
+
+    @pytest.mark.asyncio
+    async def test_page_text_matches_single_evaluate(self, agent):
+        """Test both indicator groups are sent in one evaluate call"""
+        agent.page = AsyncMock()
+        agent.page.evaluate.return_value = {'complete': True,
+                                            'greenhouse': False}
+
+        matches = await agent._page_text_matches()
+
+        assert matches == {'complete': True, 'greenhouse': False}
+        agent.page.evaluate.assert_awaited_once()
+        groups = agent.page.evaluate.await_args.args[1]
+        assert 'thank you for applying' in groups['complete']
+        assert 'check your email' in groups['greenhouse']
+        agent.page.content.assert_not_called()
+
+    def test_greenhouse_detected_from_url(self, agent):
+        """Test Greenhouse URLs match without needing page text"""
+        agent.page = MagicMock()
+        agent.page.url = "https://boards.Greenhouse.io/acme/jobs/1"
+        assert agent._needs_greenhouse_verification({}) is True
+
+    def test_greenhouse_detected_from_text(self, agent):
+        """Test verification prompts are taken from the text matches"""
+        agent.page = MagicMock()
+        agent.page.url = "https://www.linkedin.com/jobs/view/1/"
+        assert agent._needs_greenhouse_verification(
+            {'greenhouse': True}) is True
+        assert agent._needs_greenhouse_verification(
+            {'greenhouse': False}) is False
+
+    @pytest.mark.asyncio
+    async def test_flow_stops_on_success_text(self, agent):
+        """Test the flow returns as soon as the page text reports success"""
+        agent.page = AsyncMock()
+        agent.page.evaluate.return_value = {'complete': True,
+                                            'greenhouse': False}
+        agent._fill_application_form = AsyncMock()
+
+        assert await agent._handle_application_flow(MagicMock()) is True
+        agent._fill_application_form.assert_not_called()
+        agent.page.content.assert_not_called()
+
+
+class TestFormFields:
+    """Test default form answers resolved from config"""
+
+    def test_form_fields_from_default_answers(self, agent):
+        """Test config answers are mapped onto form questions at init"""
+        assert agent._form_fields['years of experience'] == '3-5 years'
+        assert agent._form_fields['willing to relocate'] == 'No'
+        assert agent._form_fields['authorized to work'] == 'Yes'
+        assert agent._form_fields['availability'] == '2 weeks notice'
+
+    def test_answer_matched_in_placeholder_or_label(self, agent):
+        """Test question keys are found case-insensitively in either text"""
+        assert agent._match_form_answer(
+            "", "How many Years of Experience do you have?") == '3-5 years'
+        assert agent._match_form_answer(
+            "Are you authorized to work here?", "") == 'Yes'
+        assert agent._match_form_answer("First name", "Email") is None
+
+    def test_answer_follows_config_order(self, agent):
+        """Test the earliest configured key wins, not the leftmost match"""
+        agent._form_field_re, agent._form_field_answers = (
+            agent._compile_form_fields({'name': 'Dana', 'first name': 'D'}))
+        assert agent._match_form_answer("First name") == 'Dana'
+        assert agent._match_form_answer("Phone", "Your first name") == 'Dana'
+
+        agent._form_field_re, agent._form_field_answers = (
+            agent._compile_form_fields({'first name': 'D', 'name': 'Dana'}))
+        assert agent._match_form_answer("Name (first name)") == 'D'
+
+
+def _field(index, tag='input', **attrs):
+    """Field description as returned by the in-page form scan"""
+    field = {'index': index, 'id': '', 'name': '', 'cls': '',
+             'placeholder': '', 'aria': '', 'label': '', 'tag': tag}
+    field.update(attrs)
+    return field
+
+
+class TestAiContentFilling:
+    """Test AI content is matched against batched field descriptions"""
+
+    @pytest.mark.asyncio
+    async def test_fills_cover_letter_and_resume(self, agent):
+        """Test matching fields are filled by their tagged index"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, label='First name'),
+            _field(1, tag='textarea', label='Cover Letter'),
+            _field(2, tag='textarea', name='professional_summary'),
+        ])
+
+        await agent._fill_ai_content({
+            'cover_letter': 'Dear team',
+            'optimized_summary': 'Ten years of sales engineering'})
+
+        agent.page.fill.assert_any_call(
+            '[data-jobapp-idx="1"]', 'Dear team')
+        agent.page.fill.assert_any_call(
+            '[data-jobapp-idx="2"]', 'Ten years of sales engineering')
+        assert agent.page.fill.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_first_matching_field_only(self, agent):
+        """Test later matching fields are left alone once content is placed"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, tag='textarea', label='Cover letter'),
+            _field(1, tag='textarea', label='Additional information'),
+        ])
+
+        await agent._fill_ai_content({'cover_letter': 'Dear team'})
+
+        agent.page.fill.assert_called_once_with(
+            '[data-jobapp-idx="0"]', 'Dear team')
+
+    @pytest.mark.asyncio
+    async def test_resume_requires_textarea(self, agent):
+        """Test single-line inputs are not used for resume content"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, tag='input', label='Skills')])
+
+        await agent._fill_ai_content({'optimized_skills': 'Python'})
+
+        agent.page.fill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_fillable_content_skips_scan(self, agent):
+        """Test the form is not scanned when there is nothing to place"""
+        agent.page = AsyncMock()
+
+        await agent._fill_ai_content({'job_match_score': '0.8'})
+
+        agent.page.evaluate.assert_not_called()
+
+
+class TestApplicationFormFilling:
+    """Test default answers are filled from one batched field scan"""
+
+    @pytest.mark.asyncio
+    async def test_fills_inputs_and_selects(self, agent):
+        """Test text inputs and selects are matched by their labels"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, label='Years of experience'),
+            _field(1, tag='select', label='Are you authorized to work?'),
+        ])
+
+        await agent._fill_application_form()
+
+        agent.page.evaluate.assert_called_once()
+        agent.page.fill.assert_called_once_with(
+            '[data-jobapp-idx="0"]', '3-5 years')
+        agent.page.select_option.assert_called_once_with(
+            '[data-jobapp-idx="1"]', label='Yes')
+
+    @pytest.mark.asyncio
+    async def test_ai_content_shares_field_scan(self, agent):
+        """Test AI-filled fields reuse the scan and skip default answers"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, tag='textarea', label='Cover letter'),
+            _field(1, label='Phone number'),
+        ])
+        agent._form_field_re, agent._form_field_answers = (
+            agent._compile_form_fields({'Cover letter': 'N/A',
+                                        'phone': '555-0100'}))
+
+        await agent._fill_application_form({'cover_letter': 'Dear team'})
+
+        agent.page.evaluate.assert_called_once()
+        agent.page.fill.assert_any_call('[data-jobapp-idx="0"]', 'Dear team')
+        agent.page.fill.assert_any_call('[data-jobapp-idx="1"]', '555-0100')
+        assert agent.page.fill.call_count == 2
+
+
+class TestButtonClicks:
+    """Test Next/Submit button lookup"""
+
+    @pytest.mark.asyncio
+    async def test_clicks_element_found_in_browser(self, agent):
+        """Test the element returned by the single lookup is clicked"""
+        element = AsyncMock()
+        agent.page = AsyncMock()
+        agent.page.evaluate_handle = AsyncMock(
+            return_value=MagicMock(as_element=MagicMock(return_value=element)))
+
+        assert await agent._click_next_button() is True
+        element.click.assert_called_once()
+        candidates = agent.page.evaluate_handle.call_args[0][1]
+        assert candidates[0] == ['button', 'Next']
+
+    @pytest.mark.asyncio
+    async def test_no_visible_button(self, agent):
+        """Test nothing is clicked when no candidate is visible"""
+        agent.page = AsyncMock()
+        agent.page.evaluate_handle = AsyncMock(
+            return_value=MagicMock(as_element=MagicMock(return_value=None)))
+
+        assert await agent._click_next_button() is False
+
+
+class TestJobDetails:
+    """Test job detail extraction"""
+
+    @pytest.mark.asyncio
+    async def test_details_read_in_one_call(self, agent):
+        """Test all detail fields come from a single evaluate"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value={
+            'title': ' Solutions Engineer\n', 'company': 'Acme',
+            'location': None, 'description': 'Build demos'})
+        url = "https://www.linkedin.com/jobs/view/42/"
+
+        job = await agent.get_job_details(url)
+
+        agent.page.evaluate.assert_called_once()
+        assert job.job_id == "42"
+        assert job.title == "Solutions Engineer"
+        assert job.company == "Acme"
+        assert job.location == "Unknown"
+        assert job.description == "Build demos"
+
+    @pytest.mark.asyncio
+    async def test_details_cached_by_job_id(self, agent):
+        """Test a repeat lookup of the same job skips the navigation"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value={
+            'title': 'Engineer', 'company': 'Acme',
+            'location': 'Remote', 'description': None})
+
+        first = await agent.get_job_details(
+            "https://www.linkedin.com/jobs/view/42/")
+        second = await agent.get_job_details(
+            "https://www.linkedin.com/jobs/view/42/?trk=feed")
+
+        assert second is first
+        agent.page.goto.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_details_cache_evicts_oldest(self, agent):
+        """Test the cache drops the least recently used job when full"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value={
+            'title': 'Engineer', 'company': 'Acme',
+            'location': 'Remote', 'description': None})
+        agent._details_cache_size = 1
+
+        await agent.get_job_details("https://www.linkedin.com/jobs/view/1/")
+        await agent.get_job_details("https://www.linkedin.com/jobs/view/2/")
+
+        assert list(agent._details_cache) == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_guest_details_skip_navigation(self, agent):
+        """Test guest posting HTML is parsed without opening the job page"""
+        html = """
+        <h2 class="top-card-layout__title topcard__title">Sales Engineer</h2>
+        <a class="topcard__org-name-link" href="/company/acme"> Acme </a>
+        <span class="topcard__flavor topcard__flavor--bullet">Austin, TX</span>
+        <span class="topcard__flavor topcard__flavor--bullet">2 days ago</span>
+        <div class="show-more-less-html__markup">
+          <p>Build <strong>demos</strong>.</p><div><ul><li>Python</li></ul></div>
+        </div>
+        """
+        response = MagicMock(ok=True)
+        response.text = AsyncMock(return_value=html)
+        agent.page = AsyncMock()
+        agent.page.request = MagicMock()
+        agent.page.request.get = AsyncMock(return_value=response)
+        agent._use_guest_job_details = True
+
+        job = await agent.get_job_details(
+            "https://www.linkedin.com/jobs/view/42/")
+
+        agent.page.goto.assert_not_called()
+        assert agent.page.request.get.await_args.args[0].endswith(
+            "/jobs-guest/jobs/api/jobPosting/42")
+        assert job.title == "Sales Engineer"
+        assert job.company == "Acme"
+        assert job.location == "Austin, TX"
+        assert job.description == "Build demos.\nPython"
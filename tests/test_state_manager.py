@@ -294,6 +294,22 @@ class TestStateManagerGeneral:
             StateManager(storage_type="invalid",
                          file_path=str(temp_dir / "test"))
 
+    def test_applied_keys_read_once(self, temp_dir):
+        """Test repeat has_applied checks are answered from memory"""
+        db_path = temp_dir / 'test.db'
+        StateManager(storage_type="sqlite", file_path=str(db_path)
+                     ).record_application("job123", "linkedin")
+        state_manager = StateManager(
+            storage_type="sqlite", file_path=str(db_path))
+
+        with patch('utils.state_manager.sqlite3.connect',
+                   wraps=sqlite3.connect) as connect:
+            assert state_manager.has_applied("job123", "linkedin") is True
+            for i in range(20):
+                assert state_manager.has_applied(f"job{i}", "linkedin") is False
+
+        assert connect.call_count == 1
+
     def test_directory_creation(self, temp_dir):
         """Test that parent directories are created automatically"""
         nested_path = temp_dir / "nested" / "directory" / "test.db"
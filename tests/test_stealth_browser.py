@@ -0,0 +1,89 @@
+from utils.stealth_browser import StealthBrowserManager
+import pytest
+from unittest.mock import AsyncMock
+
+import sys
+sys.path.append('/home/daniel/JobApp')
+
+
+class TestRequestBlocking:
+    """Test which requests are aborted by the context route handler"""
+
+    @pytest.fixture
+    def manager(self):
+        """Stealth manager with default blocking settings"""
+        return StealthBrowserManager({'browser': {}})
+
+    @pytest.mark.asyncio
+    async def test_route_installed_by_default(self, manager):
+        """Test every context gets the blocking route unless disabled"""
+        browser = AsyncMock()
+
+        context = await manager.create_human_like_context(browser)
+
+        context.route.assert_awaited_once_with("**/*", manager._route_request)
+
+    @pytest.mark.asyncio
+    async def test_no_route_when_disabled(self):
+        """Test contexts keep the HTTP cache when block_resources is off"""
+        manager = StealthBrowserManager({'browser': {'block_resources': False}})
+        browser = AsyncMock()
+
+        context = await manager.create_human_like_context(browser)
+
+        context.route.assert_not_called()
+
+    def test_blocks_heavy_resource_types(self, manager):
+        """Test images, fonts and media are blocked"""
+        url = "https://media.licdn.com/dms/image/logo.png"
+        assert manager.should_block_request('image', url) is True
+        assert manager.should_block_request('font', url) is True
+        assert manager.should_block_request('media', url) is True
+
+    def test_allows_documents_and_scripts(self, manager):
+        """Test pages, scripts and XHR needed by the app are allowed"""
+        url = "https://www.linkedin.com/jobs/view/123/"
+        assert manager.should_block_request('document', url) is False
+        assert manager.should_block_request('script', url) is False
+        assert manager.should_block_request('xhr', url) is False
+
+    def test_stylesheets_allowed_by_default(self, manager):
+        """Test CSS loads so visibility checks see the real layout"""
+        url = "https://static.licdn.com/sc/h/main.css"
+        assert manager.should_block_request('stylesheet', url) is False
+
+    def test_blocks_tracker_hosts(self, manager):
+        """Test analytics requests are blocked regardless of type"""
+        url = "https://www.google-analytics.com/collect?v=1"
+        assert manager.should_block_request('script', url) is True
+        assert manager.should_block_request(
+            'xhr', "https://www.linkedin.com/li/track") is True
+
+    def test_blocks_linkedin_ad_pixel(self, manager):
+        """Test LinkedIn's ad conversion pixel is blocked"""
+        url = "https://px.ads.linkedin.com/collect/?pid=123&fmt=gif"
+        assert manager.should_block_request('image', url) is True
+        assert manager.should_block_request('xhr', url) is True
+
+    def test_captcha_images_allowed(self, manager):
+        """Test CAPTCHA challenge images are never blocked"""
+        url = "https://www.google.com/recaptcha/api2/payload?k=abc"
+        assert manager.should_block_request('image', url) is False
+        url = "https://www.gstatic.com/recaptcha/releases/abc/recaptcha__en.js"
+        assert manager.should_block_request('image', url) is False
+
+    def test_other_gstatic_assets_blocked(self, manager):
+        """Test fonts and images on gstatic are not exempt as CAPTCHA assets"""
+        assert manager.should_block_request(
+            'font', "https://fonts.gstatic.com/s/roboto/v30/a.woff2") is True
+        assert manager.should_block_request(
+            'image', "https://ssl.gstatic.com/images/logo.png") is True
+
+    def test_blocked_types_configurable(self):
+        """Test blocked resource types come from browser config"""
+        manager = StealthBrowserManager(
+            {'browser': {'blocked_resource_types': ['stylesheet']}})
+        assert manager.should_block_request(
+            'stylesheet', "https://example.com/a.css") is True
+        assert manager.should_block_request(
+            'image', "https://example.com/a.png") is False
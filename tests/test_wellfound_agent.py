@@ -0,0 +1,645 @@
+from agents.wellfound_agent import WellfoundAgent
+from base_agent import JobPosting, SearchCriteria
+from playwright.async_api import Error as PlaywrightError
+from utils.stealth_browser import StealthBrowserManager
+import asyncio
+import pytest
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.fixture
+def agent(sample_config):
+    """Wellfound agent without a browser attached"""
+    return WellfoundAgent(sample_config)
+
+
+class TestJobIdExtraction:
+    """Test Wellfound job ID parsing"""
+
+    def test_slugged_job_url(self, agent):
+        """Test the numeric ID is taken from a title-slugged job URL"""
+        url = "https://wellfound.com/company/acme/jobs/1234567-backend-engineer"
+        assert agent._extract_job_id_from_url(url) == "1234567"
+
+    def test_job_url_with_query(self, agent):
+        """Test tracking parameters are not part of the ID"""
+        url = "https://wellfound.com/jobs/1234567?ref=search"
+        assert agent._extract_job_id_from_url(url) == "1234567"
+
+    def test_fallback_to_last_segment(self, agent):
+        """Test other URLs fall back to the last path segment"""
+        url = "https://wellfound.com/company/acme/role-abc?ref=x"
+        assert agent._extract_job_id_from_url(url) == "role-abc"
+
+    def test_missing_url(self, agent):
+        """Test a card without an href yields no ID"""
+        assert agent._extract_job_id_from_url(None) is None
+
+
+class TestExtractSingleJob:
+    """Test building a JobPosting from one card read"""
+
+    @pytest.mark.asyncio
+    async def test_card_read_in_one_call(self, agent):
+        """Test all card fields come from a single evaluate"""
+        card = AsyncMock()
+        card.evaluate = AsyncMock(return_value={
+            'title': ' Backend Engineer ',
+            'url': '/company/acme/jobs/1234567-backend-engineer',
+            'company': 'Acme\n',
+            'location': None,
+        })
+
+        job = await agent._extract_single_job(card)
+
+        card.evaluate.assert_awaited_once()
+        card.query_selector.assert_not_called()
+        assert job.job_id == "1234567"
+        assert job.title == "Backend Engineer"
+        assert job.company == "Acme"
+        assert job.location == "Unknown"
+        assert job.url == ("https://wellfound.com/company/acme/jobs/"
+                           "1234567-backend-engineer")
+
+    @pytest.mark.asyncio
+    async def test_card_without_title_skipped(self, agent):
+        """Test cards with no title link are skipped"""
+        card = AsyncMock()
+        card.evaluate = AsyncMock(return_value=None)
+        assert await agent._extract_single_job(card) is None
+
+
+class TestExtractJobListings:
+    """Test reading job cards from the search results page"""
+
+    @pytest.mark.asyncio
+    async def test_cards_extracted_concurrently(self, agent):
+        """Test cards are read in parallel and failures are skipped"""
+        in_flight = 0
+        peak = 0
+
+        async def extract(card):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if card == 'broken':
+                raise RuntimeError("detached")
+            if card == 'empty':
+                return None
+            return JobPosting(job_id=card, title="Engineer", company="Acme",
+                              location="Remote", url=f"https://x/{card}",
+                              platform="Wellfound")
+
+        agent.page = MagicMock()
+        agent.page.wait_for_selector = AsyncMock()
+        agent.page.query_selector_all = AsyncMock(
+            return_value=['1', 'broken', 'empty', '2'])
+        agent._extract_single_job = extract
+
+        jobs = await agent._extract_job_listings()
+
+        assert [job.job_id for job in jobs] == ['1', '2']
+        assert peak > 1
+
+
+def _field(index, type='text', name='', placeholder='', label=''):
+    """A form field as returned by _describe_form_fields"""
+    return {'index': index, 'type': type, 'name': name,
+            'placeholder': placeholder, 'label': label}
+
+
+class TestFormFields:
+    """Test filling application forms from one batched field read"""
+
+    @pytest.mark.asyncio
+    async def test_wellfound_form_filled_by_index(self, agent):
+        """Test matched inputs and checkboxes are addressed by their index"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, label='Years experience'),
+            _field(1, name='nickname'),
+            _field(2, type='checkbox', label='I agree to the terms'),
+            _field(3, type='checkbox', label='Send me updates'),
+        ])
+
+        await agent._fill_wellfound_application_form()
+
+        agent.page.evaluate.assert_awaited_once()
+        agent.page.fill.assert_awaited_once_with(
+            '[data-jobapp-idx="0"]', '3-5 years')
+        agent.page.check.assert_awaited_once_with('[data-jobapp-idx="2"]')
+
+    @pytest.mark.asyncio
+    async def test_answers_matched_case_insensitively(self, agent):
+        """Test question keys are found anywhere in the hints and label"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, placeholder='Do you need VISA SPONSORSHIP?'),
+            _field(1, name='q_relocate'),
+        ])
+
+        await agent._fill_wellfound_application_form()
+
+        agent.page.fill.assert_any_await('[data-jobapp-idx="0"]', 'No')
+        agent.page.fill.assert_any_await('[data-jobapp-idx="1"]', 'No')
+
+    @pytest.mark.asyncio
+    async def test_external_form_uses_placeholder_and_name(self, agent):
+        """Test external forms match personal info fields"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=[
+            _field(0, placeholder='First name'),
+            _field(1, name='phone'),
+        ])
+
+        await agent._fill_external_application_form()
+
+        agent.page.fill.assert_any_await('[data-jobapp-idx="0"]', 'John')
+        agent.page.fill.assert_any_await(
+            '[data-jobapp-idx="1"]', '555-123-4567')
+
+
+class TestPagePredicates:
+    """Test login and completion checks against compiled patterns"""
+
+    @pytest.mark.asyncio
+    async def test_application_complete_checked_in_page(self, agent):
+        """Test success text is searched in the browser, not via content()"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(return_value=True)
+
+        assert await agent._is_application_complete() is True
+
+        pattern = agent.page.evaluate.await_args.args[1]
+        assert re.search(pattern, "thank you for applying")
+        agent.page.content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_application_complete_on_page_error(self, agent):
+        """Test a failed page check reports the application as incomplete"""
+        agent.page = AsyncMock()
+        agent.page.evaluate = AsyncMock(side_effect=PlaywrightError("gone"))
+        assert await agent._is_application_complete() is False
+
+
+def _login_page(url="https://wellfound.com/jobs?ref=login"):
+    """A page mock whose locators resolve immediately"""
+    page = MagicMock()
+    page.url = url
+    page.goto = AsyncMock()
+    page.wait_for_load_state = AsyncMock()
+    page.wait_for_timeout = AsyncMock()
+    page.wait_for_url = AsyncMock()
+    page.evaluate = AsyncMock(return_value=False)
+    page.keyboard.press = AsyncMock()
+    field = page.locator.return_value.first
+    field.wait_for = AsyncMock()
+    field.fill = AsyncMock()
+    field.click = AsyncMock()
+    return page
+
+
+class TestLogin:
+    """Test the Wellfound login flow"""
+
+    @pytest.mark.asyncio
+    async def test_fields_found_through_visible_unions(self, agent):
+        """Test each login field is located with one visible-union wait"""
+        agent.page = _login_page()
+        agent.save_session = AsyncMock()
+
+        assert await agent.login() is True
+
+        agent.save_session.assert_awaited_once()
+        selectors = [call.args[0] for call in agent.page.locator.call_args_list]
+        assert len(selectors) == 3
+        assert all(selector.endswith(">> visible=true")
+                   for selector in selectors)
+        field = agent.page.locator.return_value.first
+        field.fill.assert_any_await('test@example.com')
+        field.fill.assert_any_await('test_password')
+        field.click.assert_awaited_once()
+        agent.page.keyboard.press.assert_not_called()
+        agent.page.wait_for_url.assert_awaited_once()
+        agent.page.wait_for_timeout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_enter_pressed_without_login_button(self, agent):
+        """Test the form is submitted with Enter if no button is visible"""
+        agent.page = _login_page()
+        agent.save_session = AsyncMock()
+        agent.page.locator.return_value.first.click = AsyncMock(
+            side_effect=PlaywrightError("not found"))
+
+        assert await agent.login() is True
+        agent.page.keyboard.press.assert_awaited_once_with('Enter')
+
+    @pytest.mark.asyncio
+    async def test_missing_email_field_fails(self, agent):
+        """Test login stops when no email field appears"""
+        agent.page = _login_page()
+        agent.page.locator.return_value.first.wait_for = AsyncMock(
+            side_effect=PlaywrightError("timeout"))
+
+        assert await agent.login() is False
+
+    @pytest.mark.asyncio
+    async def test_restored_session_skips_form(self, agent):
+        """Test a still-valid saved session returns before the login form"""
+        agent.page = _login_page()
+        agent.session_restored = True
+
+        assert await agent.login() is True
+
+        agent.page.goto.assert_awaited_once_with(
+            "https://wellfound.com/jobs", wait_until='domcontentloaded')
+        agent.page.locator.assert_called_once()
+        assert 'a[href*="/logout"]' in agent.page.locator.call_args.args[0]
+        agent.page.locator.return_value.first.fill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_logged_out_jobs_page_falls_back_to_form(self, agent):
+        """Test a public jobs page without member UI is not taken as a login"""
+        agent.page = _login_page(url="https://wellfound.com/jobs")
+        agent.session_restored = True
+        agent.save_session = AsyncMock()
+        marker_wait = AsyncMock(side_effect=[PlaywrightError("timeout"),
+                                             None, None, None])
+        agent.page.locator.return_value.first.wait_for = marker_wait
+
+        assert await agent.login() is True
+
+        assert agent.page.locator.call_count == 4
+        agent.page.locator.return_value.first.fill.assert_any_await(
+            'test@example.com')
+
+    @pytest.mark.asyncio
+    async def test_expired_session_falls_back_to_form(self, agent):
+        """Test a saved session redirected to login goes through the form"""
+        agent.page = _login_page(url="https://wellfound.com/login")
+        agent.session_restored = True
+        agent.save_session = AsyncMock()
+
+        await agent.login()
+
+        assert agent.page.locator.call_count == 3
+        agent.save_session.assert_not_called()
+
+
+class TestResourceBlocking:
+    """Test Wellfound contexts skip images, fonts and media"""
+
+    @pytest.mark.asyncio
+    async def test_search_context_routes_requests(self, agent):
+        """Test the context Wellfound searches in gets the blocking route"""
+        playwright = AsyncMock()
+        browser = playwright.chromium.launch.return_value
+        agent._saved_session_path = MagicMock(return_value=None)
+        agent._prepare_page = AsyncMock()
+
+        with patch('playwright.async_api.async_playwright') as start:
+            start.return_value.start = AsyncMock(return_value=playwright)
+            await agent.initialize_browser(headless=True)
+
+        assert agent.context is browser.new_context.return_value
+        agent.context.route.assert_awaited_once_with(
+            "**/*", agent.stealth_manager._route_request)
+
+    @pytest.mark.asyncio
+    async def test_worker_context_routes_requests(self, agent, sample_config):
+        """Test the pooled context Wellfound applies in gets the blocking route"""
+        agent.stealth_manager = StealthBrowserManager(sample_config)
+        agent.browser = AsyncMock()
+        agent.browser.new_context.return_value.new_page = AsyncMock(
+            return_value=MagicMock(close=AsyncMock()))
+        agent._prepare_page = AsyncMock()
+
+        async with agent._worker() as worker:
+            worker.context.route.assert_awaited_once_with(
+                "**/*", agent.stealth_manager._route_request)
+            assert worker.context is agent.browser.new_context.return_value
+
+
+class TestConcurrentApply:
+    """Test applications run on pages from the shared context pool"""
+
+    @pytest.mark.asyncio
+    async def test_apply_runs_on_pooled_page(self, agent):
+        """Test apply_to_job hands the flow to a worker on its own page"""
+        agent.page = AsyncMock()
+        agent.stealth_manager = AsyncMock()
+        context = AsyncMock()
+        context.new_page = AsyncMock(
+            side_effect=lambda: MagicMock(close=AsyncMock()))
+        agent.stealth_manager.create_human_like_context = AsyncMock(
+            return_value=context)
+        pages = []
+
+        async def apply_on_page(worker, job):
+            pages.append(worker.page)
+            return True
+
+        job = JobPosting(job_id="1", title="Engineer", company="Acme",
+                         location="Remote", url="https://wellfound.com/jobs/1",
+                         platform="Wellfound")
+        agent.pause = AsyncMock()
+        summary = {'applications_submitted': 0, 'errors': 0,
+                   'applied_jobs': []}
+        with patch.object(WellfoundAgent, '_apply_on_page', apply_on_page):
+            await agent.apply_to_jobs(
+                [(job, {'cover': 'x'}), (job, {'cover': 'x'})], summary)
+
+        assert summary['applications_submitted'] == 2
+        assert agent.page not in pages
+        assert len(pages) == 2
+
+
+class TestApplicationFlow:
+    """Test the multi-step apply flow waits on page changes"""
+
+    @pytest.mark.asyncio
+    async def test_steps_wait_for_form_change(self, agent):
+        """Test each step waits for the form text to change, not a sleep"""
+        agent.page = AsyncMock()
+        agent.page.url = "https://wellfound.com/jobs/1/apply"
+        agent.page.evaluate = AsyncMock(return_value="Step 1 of 2")
+        agent._is_application_complete = AsyncMock(side_effect=[False, True])
+        agent._fill_wellfound_application_form = AsyncMock()
+        agent._click_next_or_submit_button = AsyncMock(return_value=True)
+        job = JobPosting(job_id="1", title="Engineer", company="Acme",
+                         location="Remote", url="https://wellfound.com/jobs/1",
+                         platform="Wellfound")
+
+        assert await agent._handle_application_flow(job) is True
+
+        agent.page.wait_for_timeout.assert_not_called()
+        agent.page.wait_for_load_state.assert_not_called()
+        agent.page.wait_for_function.assert_awaited_once()
+        _, before = agent.page.wait_for_function.await_args.kwargs['arg']
+        assert before == "Step 1 of 2"
+
+    @pytest.mark.asyncio
+    async def test_change_timeout_is_not_fatal(self, agent):
+        """Test a region that never changes only logs and continues"""
+        agent.page = AsyncMock()
+        agent.page.wait_for_function = AsyncMock(
+            side_effect=PlaywrightError("Timeout 10000ms exceeded"))
+
+        await agent._wait_for_change('form', "Step 1")
+
+    @pytest.mark.asyncio
+    async def test_filters_wait_for_new_results(self, agent):
+        """Test filtered results are awaited against the pre-filter cards"""
+        agent.page = AsyncMock()
+        agent.page.is_visible = AsyncMock(return_value=False)
+        agent.page.evaluate = AsyncMock(return_value="Unfiltered cards")
+        agent._apply_location_filter = AsyncMock()
+
+        await agent._perform_job_search(
+            SearchCriteria(keywords=["python"], locations=["Remote"]))
+
+        agent._apply_location_filter.assert_awaited_once_with(["Remote"])
+        selector, before = agent.page.wait_for_function.await_args.kwargs[
+            'arg']
+        assert '.job-card' in selector
+        assert before == "Unfiltered cards"
+
+
+class TestRateLimit:
+    """Test page loads are bounded and back off when rate limited"""
+
+    @pytest.mark.asyncio
+    async def test_backs_off_on_429(self, agent):
+        """Test a 429 response is retried after an exponential delay"""
+        agent.page = AsyncMock()
+        agent.page.goto = AsyncMock(side_effect=[
+            MagicMock(status=429), MagicMock(status=429),
+            MagicMock(status=200)])
+
+        with patch('agents.wellfound_agent.asyncio.sleep',
+                   new=AsyncMock()) as sleep:
+            response = await agent._goto("https://wellfound.com/jobs")
+
+        assert response.status == 200
+        assert agent.page.goto.await_count == 3
+        first, second = (call.args[0] for call in sleep.await_args_list)
+        assert 1.5 <= first < 2.5
+        assert 3.0 <= second < 4.0
+
+    def test_mode_sets_concurrency(self, sample_config):
+        """Test rate_limit_mode picks the page-load bound"""
+        sample_config['platforms'] = {
+            'wellfound': {'rate_limit_mode': 'conservative'}}
+        agent = WellfoundAgent(sample_config)
+        assert agent._navigation_gate()._value == 2
+
+    def test_unknown_mode_falls_back_to_normal(self, sample_config):
+        """Test an unknown mode uses the normal settings"""
+        sample_config['platforms'] = {'wellfound': {'rate_limit_mode': 'x'}}
+        agent = WellfoundAgent(sample_config)
+        assert agent._max_navigations == 4
+
+
+class TestExperienceFilter:
+    """Test the experience level filter lookup"""
+
+    @staticmethod
+    def _page_with(dom):
+        """Page whose in-page lookup walks (selector, text, element) nodes"""
+        async def evaluate_handle(script, candidates):
+            for selector, text in candidates:
+                for node_selector, node_text, element in dom:
+                    if node_selector == selector and (
+                            not text or text.lower() in node_text.lower()):
+                        return MagicMock(as_element=lambda: element)
+            return MagicMock(as_element=lambda: None)
+
+        page = MagicMock()
+        page.evaluate_handle = AsyncMock(side_effect=evaluate_handle)
+        return page
+
+    @pytest.mark.asyncio
+    async def test_level_clicked_in_one_lookup(self, agent):
+        """Test the matching level is found and clicked in one page call"""
+        label = MagicMock(click=AsyncMock())
+        agent.page = self._page_with(
+            [('label', 'Senior level', label)])
+
+        await agent._apply_experience_filter("Senior Engineer")
+
+        agent.page.evaluate_handle.assert_awaited_once()
+        label.click.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_label_wins_over_earlier_data_test_hook(self, agent):
+        """Test priority order beats DOM order for the option lookup"""
+        hook = MagicMock(click=AsyncMock())
+        label = MagicMock(click=AsyncMock())
+        agent.page = self._page_with([
+            ('[data-test*="mid"]', 'Pyramid', hook),
+            ('label', 'Mid level', label),
+        ])
+
+        await agent._apply_experience_filter("mid")
+
+        label.click.assert_awaited_once()
+        hook.click.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_data_test_hook(self, agent):
+        """Test the data-test hook is used when no label matches"""
+        hook = MagicMock(click=AsyncMock())
+        agent.page = self._page_with([('[data-test*="lead"]', '', hook)])
+
+        await agent._apply_experience_filter("Lead")
+
+        hook.click.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_level_skips_page(self, agent):
+        """Test levels without a known keyword do not touch the page"""
+        agent.page = MagicMock()
+        await agent._apply_experience_filter("Staff")
+        agent.page.evaluate_handle.assert_not_called()
+
+
+SEARCH_API_RESPONSE = {
+    'data': {
+        'talent': {
+            'jobSearchResults': [
+                {'startup': {'name': 'Acme'}, 'jobs': [
+                    {'id': 1234567, 'title': 'Backend Engineer ',
+                     'url': '/jobs/1234567-backend-engineer',
+                     'locationNames': ['Remote', 'New York']},
+                    {'id': 1234567, 'title': 'Backend Engineer',
+                     'url': '/jobs/1234567-backend-engineer'},
+                ]},
+                {'jobs': [
+                    {'id': 89, 'title': 'Designer',
+                     'company': 'Globex', 'location': 'Berlin'},
+                ]},
+            ]
+        }
+    }
+}
+
+
+class TestSearchApi:
+    """Test the opt-in JSON search endpoint"""
+
+    @pytest.fixture
+    def api_agent(self, sample_config):
+        """Agent with a search API URL configured"""
+        sample_config['platforms'] = {'wellfound': {
+            'search_api_url': 'https://wellfound.com/api/jobs?q={keywords}'}}
+        agent = WellfoundAgent(sample_config)
+        agent.page = MagicMock()
+        agent.page.goto = AsyncMock()
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_results_read_without_page_render(self, api_agent):
+        """Test jobs come from the JSON response and the page is not loaded"""
+        response = MagicMock(ok=True)
+        response.json = AsyncMock(return_value=SEARCH_API_RESPONSE)
+        api_agent.page.request.get = AsyncMock(return_value=response)
+        criteria = SearchCriteria(keywords=["python", "dev"], locations=[])
+
+        jobs = await api_agent.search_jobs(criteria)
+
+        api_agent.page.request.get.assert_awaited_once_with(
+            'https://wellfound.com/api/jobs?q=python+dev')
+        api_agent.page.goto.assert_not_called()
+        assert [job.job_id for job in jobs] == ['1234567', '89']
+        assert jobs[0].title == 'Backend Engineer'
+        assert jobs[0].location == 'Remote, New York'
+        assert jobs[0].url == ('https://wellfound.com/jobs/'
+                               '1234567-backend-engineer')
+        assert jobs[1].company == 'Globex'
+        assert jobs[1].url == 'https://wellfound.com/jobs/89'
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_page_on_error(self, api_agent):
+        """Test an HTTP error falls back to scraping the jobs page"""
+        api_agent.page.request.get = AsyncMock(
+            return_value=MagicMock(ok=False, status=403))
+        api_agent.page.wait_for_selector = AsyncMock()
+        api_agent._perform_job_search = AsyncMock()
+        api_agent._extract_job_listings = AsyncMock(return_value=[])
+
+        await api_agent.search_jobs(
+            SearchCriteria(keywords=["x"], locations=["Remote"]))
+
+        api_agent.page.goto.assert_awaited_once()
+        api_agent._extract_job_listings.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bad_url_template_falls_back_to_page(self, api_agent):
+        """Test a URL with unknown placeholders falls back to the page"""
+        api_agent._search_api_url = 'https://wellfound.com/api?q={query}&x={}'
+        api_agent.page.request.get = AsyncMock()
+        api_agent.page.wait_for_selector = AsyncMock()
+        api_agent._perform_job_search = AsyncMock()
+        api_agent._extract_job_listings = AsyncMock(return_value=[])
+
+        await api_agent.search_jobs(
+            SearchCriteria(keywords=["x"], locations=["Remote"]))
+
+        api_agent.page.request.get.assert_not_called()
+        api_agent._extract_job_listings.assert_awaited_once()
+
+
+class TestJobsPageReuse:
+    """Test search_jobs does not reload the jobs page login landed on"""
+
+    @pytest.fixture
+    def search_agent(self, agent):
+        """Agent whose search steps are stubbed out"""
+        agent.page = MagicMock()
+        agent.page.goto = AsyncMock()
+        agent.page.wait_for_selector = AsyncMock()
+        agent._perform_job_search = AsyncMock()
+        agent._extract_job_listings = AsyncMock(return_value=[])
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_landing_page_reused_once(self, search_agent):
+        """Test the first search reuses the page and later ones navigate"""
+        search_agent.page.url = "https://wellfound.com/jobs/"
+        search_agent._note_jobs_page()
+        criteria = SearchCriteria(keywords=["python"], locations=["Remote"])
+
+        await search_agent.search_jobs(criteria)
+        search_agent.page.goto.assert_not_called()
+
+        await search_agent.search_jobs(criteria)
+        search_agent.page.goto.assert_awaited_once_with(
+            "https://wellfound.com/jobs", wait_until='domcontentloaded')
+
+    @pytest.mark.asyncio
+    async def test_other_landing_page_navigates(self, search_agent):
+        """Test landing anywhere else still loads the jobs page"""
+        search_agent.page.url = "https://wellfound.com/dashboard"
+        search_agent._note_jobs_page()
+
+        await search_agent.search_jobs(
+            SearchCriteria(keywords=["python"], locations=["Remote"]))
+
+        search_agent.page.goto.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_navigation_clears_landing_page(self, search_agent):
+        """Test viewing a job in between makes the search reload /jobs"""
+        search_agent.page.url = "https://wellfound.com/jobs"
+        search_agent._note_jobs_page()
+
+        await search_agent.get_job_details("https://wellfound.com/jobs/1")
+        await search_agent.search_jobs(
+            SearchCriteria(keywords=["python"], locations=["Remote"]))
+
+        assert search_agent.page.goto.await_args_list[-1].args == (
+            "https://wellfound.com/jobs",)
+        assert search_agent.page.goto.await_count == 2
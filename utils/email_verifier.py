@@ -1,11 +1,31 @@
+import asyncio
 import imaplib
 import email
+import email.utils
 import re
+import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 import logging
 from urllib.parse import urlparse
 
+from playwright.async_api import Error as PlaywrightError
+
+# Emails dated up to this many seconds before a verification started still
+# count for it, to allow for sender and local clock skew
+_EMAIL_CLOCK_SKEW = 120
+
+# Page text asking the applicant to verify their email, and page text
+# shown once the verification link has been followed
+_VERIFICATION_PROMPT_RE = re.compile(
+    r'verify your email|check your email|verification link|'
+    r'confirm your application', re.IGNORECASE)
+_VERIFICATION_SUCCESS_RE = re.compile(
+    r'verified successfully|verification complete|thank you|'
+    r'application submitted', re.IGNORECASE)
+# How long the verified page may take to show a success message
+_VERIFICATION_SUCCESS_TIMEOUT = 10000
+
 
 class GreenHouseEmailVerifier:
     """
@@ -13,23 +33,72 @@ class GreenHouseEmailVerifier:
     Connects to Gmail to find verification emails and extract links
     """
 
+    # One verifier (and IMAP connection) per mailbox login, shared by all
+    # agents for the life of the process unless reset()
+    _shared: Dict[Tuple[Any, Any, str, int], 'GreenHouseEmailVerifier'] = {}
+
     def __init__(self, config: Dict[str, Any]):
         self.email_address = config.get('address')
         self.email_password = config.get('password')
         self.imap_server = config.get('imap_server', 'imap.gmail.com')
         self.imap_port = config.get('imap_port', 993)
         self.logger = logging.getLogger(__name__)
+        self._mail: Optional[imaplib.IMAP4_SSL] = None
+        # Polls run in worker threads and share _mail; re-entrant because
+        # connect_to_email and the poll itself call close() while holding it
+        self._lock = threading.RLock()
+        # Links already handed out, so parallel verifications of the same
+        # mailbox never navigate to the same one
+        self._used_links: Set[str] = set()
+
+    @classmethod
+    def get(cls, config: Dict[str, Any]) -> 'GreenHouseEmailVerifier':
+        """Return the shared verifier for this mailbox, creating it once"""
+        key = (config.get('address'), config.get('password'),
+               config.get('imap_server', 'imap.gmail.com'),
+               config.get('imap_port', 993))
+        verifier = cls._shared.get(key)
+        if verifier is None:
+            verifier = cls._shared[key] = cls(config)
+        return verifier
+
+    @classmethod
+    def reset(cls) -> None:
+        """Close and forget every shared verifier"""
+        verifiers = list(cls._shared.values())
+        cls._shared.clear()
+        for verifier in verifiers:
+            verifier.close()
 
     def connect_to_email(self) -> Optional[imaplib.IMAP4_SSL]:
-        """Connect to email server"""
+        """Connect to email server, reusing the open connection if alive"""
+        if self._mail is not None:
+            try:
+                self._mail.noop()
+                return self._mail
+            except (imaplib.IMAP4.error, OSError) as e:
+                self.logger.debug(f"Cached IMAP connection dropped: {e}")
+                self.close()
+
         try:
             mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
             mail.login(self.email_address, self.email_password)
+            self._mail = mail
             return mail
         except Exception as e:
             self.logger.error(f"Failed to connect to email: {str(e)}")
             return None
 
+    def close(self) -> None:
+        """Log out of the cached IMAP connection, if any"""
+        with self._lock:
+            mail, self._mail = self._mail, None
+            if mail is not None:
+                try:
+                    mail.logout()
+                except (imaplib.IMAP4.error, OSError) as e:
+                    self.logger.debug(f"IMAP logout failed: {e}")
+
     def find_verification_email(self, timeout_minutes: int = 5) -> Optional[str]:
         """
         Search for Greenhouse verification email and extract verification link
@@ -37,59 +106,70 @@ class GreenHouseEmailVerifier:
         """
         start_time = time.time()
         timeout_seconds = timeout_minutes * 60
+        since = start_time - _EMAIL_CLOCK_SKEW
 
         while time.time() - start_time < timeout_seconds:
-            mail = self.connect_to_email()
-            if not mail:
-                time.sleep(10)
-                continue
-
-            try:
-                mail.select('inbox')
-
-                # Search for recent emails from Greenhouse
-                search_criteria = [
-                    '(FROM "greenhouse.io")',
-                    '(FROM "greenhouse")',
-                    '(SUBJECT "verify")',
-                    '(SUBJECT "confirmation")',
-                    '(SUBJECT "application")'
-                ]
-
-                for criteria in search_criteria:
-                    # Search for emails from the last hour
-                    status, messages = mail.search(None, criteria)
-                    if status == 'OK' and messages[0]:
-                        message_ids = messages[0].split()
-
-                        # Check the most recent emails first
-                        # Check last 10 emails
-                        for msg_id in reversed(message_ids[-10:]):
-                            verification_link = self._extract_verification_link(
-                                mail, msg_id)
-                            if verification_link:
-                                mail.logout()
-                                return verification_link
-
-                mail.logout()
-
-            except Exception as e:
-                self.logger.error(f"Error searching emails: {str(e)}")
+            # One poll at a time uses the shared connection; the lock is
+            # released while sleeping so other verifications can poll
+            with self._lock:
+                mail = self.connect_to_email()
                 if mail:
-                    try:
-                        mail.logout()
-                    except:
-                        pass
+                    verification_link = self._poll_verification_email(
+                        mail, since)
+                    if verification_link:
+                        self._used_links.add(verification_link)
+                        return verification_link
 
             # Wait before checking again
-            time.sleep(30)
+            time.sleep(30 if mail else 10)
 
         self.logger.warning(
             f"No verification email found within {timeout_minutes} minutes")
         return None
 
-    def _extract_verification_link(self, mail: imaplib.IMAP4_SSL, msg_id: bytes) -> Optional[str]:
-        """Extract verification link from a specific email"""
+    def _poll_verification_email(self, mail: imaplib.IMAP4_SSL,
+                                 since: float = 0) -> Optional[str]:
+        """
+        Search the inbox once for an unused Greenhouse verification link in
+        an email dated no earlier than since (a Unix timestamp)
+        """
+        try:
+            mail.select('inbox')
+
+            # Search for recent emails from Greenhouse
+            search_criteria = [
+                '(FROM "greenhouse.io")',
+                '(FROM "greenhouse")',
+                '(SUBJECT "verify")',
+                '(SUBJECT "confirmation")',
+                '(SUBJECT "application")'
+            ]
+
+            for criteria in search_criteria:
+                # Search for emails from the last hour
+                status, messages = mail.search(None, criteria)
+                if status == 'OK' and messages[0]:
+                    message_ids = messages[0].split()
+
+                    # Check the most recent emails first
+                    # Check last 10 emails
+                    for msg_id in reversed(message_ids[-10:]):
+                        verification_link = self._extract_verification_link(
+                            mail, msg_id, since)
+                        if verification_link:
+                            return verification_link
+
+        except Exception as e:
+            self.logger.error(f"Error searching emails: {str(e)}")
+            # Reconnect on the next poll rather than reuse a bad session
+            self.close()
+
+        return None
+
+    def _extract_verification_link(self, mail: imaplib.IMAP4_SSL,
+                                   msg_id: bytes,
+                                   since: float = 0) -> Optional[str]:
+        """Extract an unused verification link from a specific email"""
         try:
             status, msg_data = mail.fetch(msg_id, '(RFC822)')
             if status != 'OK':
@@ -105,44 +185,65 @@ class GreenHouseEmailVerifier:
             if 'greenhouse' not in from_header and 'greenhouse' not in subject:
                 return None
 
+            # Skip emails sent before this verification started
+            if self._email_timestamp(email_message) < since:
+                return None
+
             # Extract text content
             content = self._get_email_content(email_message)
             if not content:
                 return None
 
-            # Look for verification links
-            verification_patterns = [
-                r'https?://[^\s]+greenhouse[^\s]*verify[^\s]*',
-                r'https?://[^\s]+verify[^\s]*greenhouse[^\s]*',
-                r'https?://[^\s]+confirm[^\s]*application[^\s]*',
-                r'https?://boards\.greenhouse\.io/[^\s]+/verify[^\s]*',
-                r'https?://[^\s]*\.greenhouse\.io[^\s]*'
-            ]
-
-            for pattern in verification_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    # Return the first match, clean it up
-                    link = matches[0].strip('.,;!?')
-                    if self._is_valid_verification_link(link):
-                        self.logger.info(f"Found verification link: {link}")
-                        return link
-
-            # Also check for generic links in Greenhouse emails
-            url_pattern = r'https?://[^\s<>"\';,!?)]+'
-            urls = re.findall(url_pattern, content)
-            for url in urls:
-                url = url.strip('.,;!?')
-                if 'greenhouse' in url.lower() and ('verify' in url.lower() or 'confirm' in url.lower()):
-                    if self._is_valid_verification_link(url):
-                        self.logger.info(f"Found verification link: {url}")
-                        return url
+            # An email whose link was already handed out is spent
+            link = self._find_verification_link(content)
+            if link is None or link in self._used_links:
+                return None
+            self.logger.info(f"Found verification link: {link}")
+            return link
 
         except Exception as e:
             self.logger.error(f"Error extracting verification link: {str(e)}")
 
         return None
 
+    def _find_verification_link(self, content: str) -> Optional[str]:
+        """First valid verification link in an email's text"""
+        # Look for verification links
+        verification_patterns = [
+            r'https?://[^\s]+greenhouse[^\s]*verify[^\s]*',
+            r'https?://[^\s]+verify[^\s]*greenhouse[^\s]*',
+            r'https?://[^\s]+confirm[^\s]*application[^\s]*',
+            r'https?://boards\.greenhouse\.io/[^\s]+/verify[^\s]*',
+            r'https?://[^\s]*\.greenhouse\.io[^\s]*'
+        ]
+
+        for pattern in verification_patterns:
+            matches = re.findall(pattern, content, re.IGNORECASE)
+            if matches:
+                # Return the first match, clean it up
+                link = matches[0].strip('.,;!?')
+                if self._is_valid_verification_link(link):
+                    return link
+
+        # Also check for generic links in Greenhouse emails
+        url_pattern = r'https?://[^\s<>"\';,!?)]+'
+        urls = re.findall(url_pattern, content)
+        for url in urls:
+            url = url.strip('.,;!?')
+            if 'greenhouse' in url.lower() and ('verify' in url.lower() or 'confirm' in url.lower()):
+                if self._is_valid_verification_link(url):
+                    return url
+
+        return None
+
+    def _email_timestamp(self, email_message) -> float:
+        """Unix time of the Date header, or infinity if it cannot be read"""
+        try:
+            return email.utils.parsedate_to_datetime(
+                email_message.get('Date')).timestamp()
+        except (TypeError, ValueError):
+            return float('inf')
+
     def _get_email_content(self, email_message) -> str:
         """Extract text content from email message"""
         content = ""
@@ -205,50 +306,40 @@ class GreenHouseEmailVerifier:
         Returns True if verification was successful, False otherwise
         """
         try:
-            # Check if current page is a Greenhouse verification page
-            url = page.url
-            content = await page.content()
-
-            greenhouse_verification_indicators = [
-                'greenhouse.io' in url.lower(),
-                'verify your email' in content.lower(),
-                'check your email' in content.lower(),
-                'verification link' in content.lower(),
-                'confirm your application' in content.lower()
-            ]
-
-            if not any(greenhouse_verification_indicators):
+            # Check if current page is a Greenhouse verification page,
+            # without pulling the whole page HTML over
+            if ('greenhouse.io' not in page.url.lower() and
+                    not await page.get_by_text(
+                        _VERIFICATION_PROMPT_RE).count()):
                 return False
 
             self.logger.info(
                 "Detected Greenhouse verification page, checking email...")
 
-            # Find verification email
-            verification_link = self.find_verification_email(timeout_minutes)
+            # Polling IMAP blocks (and sleeps between polls) for minutes, so
+            # run it in a thread rather than stall every other page worker.
+            # run_in_executor rather than asyncio.to_thread keeps Python 3.8.
+            loop = asyncio.get_running_loop()
+            verification_link = await loop.run_in_executor(
+                None, self.find_verification_email, timeout_minutes)
 
             if verification_link:
                 self.logger.info(
                     f"Navigating to verification link: {verification_link}")
                 await page.goto(verification_link)
 
-                # Wait for page to load and check if verification was successful
-                await page.wait_for_timeout(3000)
-
-                # Check for success indicators
-                new_content = await page.content()
-                success_indicators = [
-                    'verified successfully' in new_content.lower(),
-                    'verification complete' in new_content.lower(),
-                    'thank you' in new_content.lower(),
-                    'application submitted' in new_content.lower()
-                ]
-
-                if any(success_indicators):
-                    self.logger.info("Email verification successful")
-                    return True
-                else:
-                    self.logger.warning("Email verification may have failed")
+                # Wait for a success message rather than a fixed delay
+                success = page.get_by_text(_VERIFICATION_SUCCESS_RE).first
+                try:
+                    await success.wait_for(
+                        timeout=_VERIFICATION_SUCCESS_TIMEOUT)
+                except PlaywrightError as e:
+                    self.logger.warning(
+                        f"Email verification may have failed: {e}")
                     return False
+
+                self.logger.info("Email verification successful")
+                return True
             else:
                 self.logger.error("Could not find verification email")
                 return False
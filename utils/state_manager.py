@@ -1,7 +1,7 @@
 import sqlite3
 import csv
 import json
-from typing import Set, Dict, Any, Optional
+from typing import Set, Dict, Any, Optional, Tuple
 from pathlib import Path
 import threading
 from datetime import datetime
@@ -17,6 +17,8 @@ class StateManager:
         self.storage_type = storage_type
         self.file_path = Path(file_path)
         self.lock = threading.Lock()
+        # (job_id, platform) pairs already applied to, loaded on first use
+        self._applied_keys: Optional[Set[Tuple[str, str]]] = None
 
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -72,13 +74,19 @@ class StateManager:
         Uses composite key of job_id + platform for uniqueness
         """
         with self.lock:
+            return (job_id, platform) in self._get_applied_keys()
+
+    def _get_applied_keys(self) -> Set[Tuple[str, str]]:
+        """Load every applied (job_id, platform) pair once; callers hold the lock"""
+        if self._applied_keys is None:
             if self.storage_type == "sqlite":
-                return self._has_applied_sqlite(job_id, platform)
+                self._applied_keys = self._load_applied_keys_sqlite()
             else:
-                return self._has_applied_csv(job_id, platform)
+                self._applied_keys = self._load_applied_keys_csv()
+        return self._applied_keys
 
-    def _has_applied_sqlite(self, job_id: str, platform: str) -> bool:
-        """Check application status using SQLite"""
+    def _load_applied_keys_sqlite(self) -> Set[Tuple[str, str]]:
+        """Read applied job keys from SQLite"""
         if str(self.file_path) == ':memory:' and hasattr(self, '_memory_conn'):
             conn = self._memory_conn
             close_conn = False
@@ -87,26 +95,20 @@ class StateManager:
             close_conn = True
 
         try:
-            cursor = conn.execute(
-                "SELECT 1 FROM applied_jobs WHERE job_id = ? AND platform = ?",
-                (job_id, platform)
-            )
-            return cursor.fetchone() is not None
+            cursor = conn.execute("SELECT job_id, platform FROM applied_jobs")
+            return set(cursor.fetchall())
         finally:
             if close_conn:
                 conn.close()
 
-    def _has_applied_csv(self, job_id: str, platform: str) -> bool:
-        """Check application status using CSV"""
+    def _load_applied_keys_csv(self) -> Set[Tuple[str, str]]:
+        """Read applied job keys from CSV"""
         if not self.file_path.exists():
-            return False
+            return set()
 
         with open(self.file_path, 'r', encoding='utf-8') as csvfile:
             reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row['job_id'] == job_id and row['platform'] == platform:
-                    return True
-        return False
+            return {(row.get('job_id'), row.get('platform')) for row in reader}
 
     def record_application(self, job_id: str, platform: str,
                            title: str = "", company: str = "", url: str = "",
@@ -115,18 +117,22 @@ class StateManager:
         Record a job application
         Returns True if successfully recorded, False if already exists
         """
-        if self.has_applied(job_id, platform):
-            return False
-
         with self.lock:
+            applied_keys = self._get_applied_keys()
+            if (job_id, platform) in applied_keys:
+                return False
+
             if self.storage_type == "sqlite":
-                return self._record_application_sqlite(
+                recorded = self._record_application_sqlite(
                     job_id, platform, title, company, url, status, metadata
                 )
             else:
-                return self._record_application_csv(
+                recorded = self._record_application_csv(
                     job_id, platform, title, company, url, status, metadata
                 )
+            if recorded:
+                applied_keys.add((job_id, platform))
+            return recorded
 
     def _record_application_sqlite(self, job_id: str, platform: str,
                                    title: str, company: str, url: str,
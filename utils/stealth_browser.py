@@ -2,8 +2,9 @@
 Enhanced browser manager with anti-detection capabilities
 """
 import random
+import re
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from playwright.async_api import BrowserContext, Page
 try:
     from playwright_stealth import stealth_async
@@ -11,6 +12,21 @@ except ImportError:
     # Fallback if stealth_async is not available
     stealth_async = None
 
+# Resource types that job scraping/applying never needs
+DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media')
+
+_TRACKER_URL_RE = re.compile(
+    r'google-analytics\.com|googletagmanager\.com|doubleclick\.net|'
+    r'linkedin\.com/li/track|px\.ads\.linkedin\.com|'
+    r'connect\.facebook\.net|bat\.bing\.com|hotjar\.com|segment\.io')
+
+# CAPTCHA widgets render challenges as images, so never block them
+_CAPTCHA_URL_RE = re.compile(
+    r'recaptcha|hcaptcha|gstatic\.com/recaptcha|arkoselabs|funcaptcha')
+
+# A saved session: a storage state file path or the state dict itself
+StorageState = Union[str, Dict[str, Any]]
+
 
 class StealthBrowserManager:
     """
@@ -20,6 +36,9 @@ class StealthBrowserManager:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.browser_config = config.get('browser', {})
+        self.block_resources = self.browser_config.get('block_resources', True)
+        self.blocked_resource_types = frozenset(self.browser_config.get(
+            'blocked_resource_types', DEFAULT_BLOCKED_RESOURCE_TYPES))
 
     async def apply_stealth_to_page(self, page: Page) -> None:
         """Apply stealth measures to a page"""
@@ -110,6 +129,8 @@ class StealthBrowserManager:
             'args': [
                 '--no-first-run',
                 '--no-default-browser-check',
+                # /dev/shm is often tiny in containers; use /tmp instead
+                '--disable-dev-shm-usage',
                 '--disable-background-timer-throttling',
                 '--disable-backgrounding-occluded-windows',
                 '--disable-renderer-backgrounding',
@@ -136,7 +157,9 @@ class StealthBrowserManager:
 
         return launch_options
 
-    async def create_human_like_context(self, browser) -> BrowserContext:
+    async def create_human_like_context(
+            self, browser,
+            storage_state: Optional[StorageState] = None) -> BrowserContext:
         """Create a browser context that mimics human behavior"""
         context_options = {
             'viewport': {
@@ -161,9 +184,36 @@ class StealthBrowserManager:
             }
         }
 
+        # Carry over cookies/localStorage from an existing session
+        if storage_state:
+            context_options['storage_state'] = storage_state
+
         context = await browser.new_context(**context_options)
+
+        # Drop images, fonts and trackers to cut page-load bytes. Playwright
+        # disables the HTTP cache for any context with a route; the bytes
+        # saved on image-heavy job listings outweigh refetching scripts.
+        if self.block_resources:
+            await context.route("**/*", self._route_request)
+
         return context
 
+    def should_block_request(self, resource_type: str, url: str) -> bool:
+        """Whether a request is unnecessary for automation and can be aborted"""
+        if _CAPTCHA_URL_RE.search(url):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return bool(_TRACKER_URL_RE.search(url))
+
+    async def _route_request(self, route) -> None:
+        """Abort blocked requests and let everything else through"""
+        request = route.request
+        if self.should_block_request(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def add_human_behavior_to_page(self, page: Page) -> None:
         """Add human-like behavior patterns to page interactions"""
 